@@ -0,0 +1,19 @@
+"""
+Bing Points Bot - automated Microsoft Rewards (and Leetcode daily) collection.
+
+The automation lives in bing_points.bot and never imports tkinter, so it can be
+driven headlessly with `python -m bing_points`. main.py is the Tkinter front-end.
+"""
+from .config import CONFIG_FILE, LOG_FILE, METRICS_FILE, LEDGER_FILE, TASKS, DEFAULT_CONFIG, setup_logging, load_config, save_config
+
+__all__ = [
+	"CONFIG_FILE",
+	"LOG_FILE",
+	"METRICS_FILE",
+	"LEDGER_FILE",
+	"TASKS",
+	"DEFAULT_CONFIG",
+	"setup_logging",
+	"load_config",
+	"save_config",
+]
@@ -0,0 +1,192 @@
+"""
+Headless command-line entry point.
+
+	python -m bing_points [--config config.json] [--tasks searches,offers,leetcode] [--max-workers N] [--force]
+	python -m bing_points --metrics-summary [--metrics-runs N]
+	python -m bing_points --benchmark-offline [--benchmark-runs N] [--benchmark-latency MS]
+	python -m bing_points --benchmark-lean [--benchmark-runs N]
+	python -m bing_points --show-endpoints
+	python -m bing_points --daemon | --use-daemon [--tasks ...] | --daemon-status | --daemon-stop
+
+Runs the bot without importing tkinter, logs to stderr and bing_points.log,
+and prints the run result as JSON on stdout (exit code 0 only when the run succeeded).
+When the config lists "profiles", every profile is run on a worker pool and
+the JSON output is the multi-account summary.
+"""
+import sys
+import json
+import logging
+import argparse
+
+from .config import CONFIG_FILE, METRICS_FILE, TASKS, setup_logging, load_config
+
+def parse_tasks(value):
+	"""argparse type for a comma-separated task list."""
+	tasks = [t.strip().lower() for t in value.split(",") if t.strip()]
+	unknown = [t for t in tasks if t not in TASKS]
+	if unknown:
+		raise argparse.ArgumentTypeError(f"unknown task(s): {', '.join(unknown)} (choose from {', '.join(TASKS)})")
+	return tasks
+
+def build_parser():
+	parser = argparse.ArgumentParser(prog="python -m bing_points", description="Run the Bing Points Bot without the GUI.")
+	parser.add_argument("--config", default=CONFIG_FILE, help=f"path to the config file (default: {CONFIG_FILE})")
+	parser.add_argument("--tasks", type=parse_tasks, help=f"comma-separated tasks to run, overriding the config ({', '.join(TASKS)})")
+	parser.add_argument("--num-searches", type=int, help="number of searches to perform")
+	parser.add_argument("--force", action="store_true", help="run the selected tasks even if the ledger shows them done today")
+	parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=None, help="run the browser headless")
+	parser.add_argument("--search-strategy", choices=("searchbox", "url"), help="how searches are submitted")
+	parser.add_argument("--page-load-strategy", choices=("normal", "eager", "none"), help="Selenium page load strategy")
+	parser.add_argument("--benchmark-searches", action="store_true", help="time the same searches with every search strategy and print the comparison")
+	parser.add_argument("--benchmark-offline", action="store_true", help="run the bot against a local fake site and print throughput, phase latencies and WebDriver command counts")
+	parser.add_argument("--benchmark-lean", action="store_true", help="load the main pages with and without lean mode and print load times and bytes")
+	parser.add_argument("--benchmark-runs", type=int, default=3, help="number of runs for --benchmark-offline, or loads per page for --benchmark-lean (default: 3)")
+	parser.add_argument("--benchmark-latency", type=int, default=0, help="response delay of the fake site in milliseconds (default: 0)")
+	parser.add_argument("--show-endpoints", action="store_true", help="print every URL the bot would open, after region/config/env overrides, and exit")
+	parser.add_argument("--daemon", action="store_true", help="serve runs from warm browser sessions on the local daemon port until stopped")
+	parser.add_argument("--use-daemon", action="store_true", help="submit this run to a running daemon instead of starting a browser")
+	parser.add_argument("--profile", help="profile name or path to run (with --use-daemon; default: the configured profile(s))")
+	parser.add_argument("--daemon-status", action="store_true", help="print the running daemon's warm sessions and exit")
+	parser.add_argument("--daemon-stop", action="store_true", help="stop the running daemon and its browsers")
+	parser.add_argument("--max-workers", type=int, help="number of profiles to run concurrently (multi-account mode)")
+	parser.add_argument("--metrics-summary", action="store_true", help="print p50/p95 timings per phase from the metrics file and exit")
+	parser.add_argument("--metrics-runs", type=int, help="only summarise the last N runs (with --metrics-summary)")
+	return parser
+
+def print_metrics_summary(path, last_runs=None):
+	"""Prints the per-phase timing table of the recorded runs. Returns the exit code."""
+	from .metrics import load_spans, summarize, format_summary
+	spans = load_spans(path)
+	run_ids = list(dict.fromkeys(span.get("run_id") for span in spans))
+	if last_runs:
+		keep = set(run_ids[-last_runs:])
+		spans = [span for span in spans if span.get("run_id") in keep]
+		run_ids = [run_id for run_id in run_ids if run_id in keep]
+	if not spans:
+		logging.error(f"No metrics recorded in {path}.")
+		return 1
+	print(format_summary(summarize(spans), runs=len(run_ids)))
+	return 0
+
+def talk_to_daemon(args, config):
+	"""Sends --daemon-status, --daemon-stop or a --use-daemon run to the daemon and prints its reply. Returns the exit code."""
+	from .daemon import send_request
+	if args.daemon_status:
+		request = {"cmd": "status"}
+	elif args.daemon_stop:
+		request = {"cmd": "shutdown"}
+	else:
+		request = {"cmd": "run", "profile": args.profile, "tasks": args.tasks, "num_searches": args.num_searches, "force": args.force}
+	try:
+		response = send_request(request, config.get("daemon_port"))
+	except OSError as e:
+		logging.error(f"No daemon reachable on port {config.get('daemon_port')}: {e}")
+		return 2
+	if not response.get("ok"):
+		logging.error(f"Daemon error: {response.get('error')}")
+		return 1
+	output = response.get("result", response)
+	json.dump(output, sys.stdout, indent=4)
+	sys.stdout.write("\n")
+	return 0 if output.get("status", "ok") == "ok" else 1
+
+def main(argv=None):
+	args = build_parser().parse_args(argv)
+	# stdout is reserved for the JSON result
+	setup_logging(sys.stderr)
+
+	config = load_config(args.config)
+	if args.tasks is not None:
+		for task in TASKS:
+			config[f"do_{task}"] = task in args.tasks
+	if args.num_searches is not None:
+		config["num_searches"] = args.num_searches
+	if args.headless is not None:
+		config["headless"] = args.headless
+	if args.force:
+		config["skip_completed"] = False
+	if args.search_strategy:
+		config["search_strategy"] = args.search_strategy
+	if args.page_load_strategy:
+		config["page_load_strategy"] = args.page_load_strategy
+
+	if args.daemon_status or args.daemon_stop or args.use_daemon:
+		return talk_to_daemon(args, config)
+
+	if args.daemon:
+		from .daemon import BrowserDaemon
+		try:
+			daemon = BrowserDaemon(config, config_path=args.config)
+		except OSError as e:
+			logging.error(f"Could not listen on port {config.get('daemon_port')}: {e}")
+			return 2
+		try:
+			daemon.serve_forever()
+		except KeyboardInterrupt:
+			pass
+		return 0
+
+	from .endpoints import EndpointRegistry
+	try:
+		# Resolves every endpoint once, so a bad pinned URL fails here rather than mid-run
+		endpoints = EndpointRegistry(config).describe()
+	except ValueError as e:
+		logging.error(f"Invalid endpoints config: {e}")
+		return 2
+	if args.show_endpoints:
+		json.dump(endpoints, sys.stdout, indent=4)
+		sys.stdout.write("\n")
+		return 0
+
+	if args.metrics_summary:
+		return print_metrics_summary(config.get("metrics_file") or METRICS_FILE, args.metrics_runs)
+
+	if args.benchmark_offline:
+		from .benchmark import run_offline_benchmark
+		report = run_offline_benchmark(config, args.benchmark_runs, args.benchmark_latency)
+		json.dump(report, sys.stdout, indent=4)
+		sys.stdout.write("\n")
+		return 0 if report["ok_runs"] == report["runs"] else 1
+
+	if args.benchmark_searches:
+		from .bot import BingBot
+		report = BingBot(config).benchmark_search_strategies()
+		json.dump(report, sys.stdout, indent=4)
+		sys.stdout.write("\n")
+		return 0 if "error" not in report else 1
+
+	if args.benchmark_lean:
+		from .bot import BingBot
+		report = BingBot(config).benchmark_lean_mode(loads=args.benchmark_runs)
+		json.dump(report, sys.stdout, indent=4)
+		sys.stdout.write("\n")
+		return 0 if "error" not in report else 1
+
+	# Imported late so --help and argument errors don't pay for selenium
+	if config.get("profiles"):
+		from .pool import ProfilePool
+		try:
+			runner = ProfilePool(config, max_workers=args.max_workers, config_path=args.config)
+		except ValueError as e:
+			logging.error(f"Invalid profiles config: {e}")
+			return 2
+	else:
+		from .bot import BingBot
+		runner = BingBot(
+			config,
+			config_path=args.config,
+			on_driver_missing=lambda: logging.error("No usable msedgedriver. Set 'driver_path' in the config file."),
+		)
+	try:
+		result = runner.run()
+	except KeyboardInterrupt:
+		runner.cancel()
+		logging.warning("Interrupted. Browser closed.")
+		return 130
+
+	json.dump(result, sys.stdout, indent=4)
+	sys.stdout.write("\n")
+	return 0 if result["status"] == "ok" else 1
+
+if __name__ == "__main__":
+	sys.exit(main())
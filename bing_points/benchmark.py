@@ -0,0 +1,119 @@
+"""
+Offline benchmark: runs the bot repeatedly against the local fake site
+(bing_points.fake_site) and reports throughput, per-phase latency and the number
+of WebDriver commands issued, so speed regressions show up without touching
+the real Bing, Trends or Leetcode pages.
+
+	python -m bing_points --benchmark-offline [--benchmark-runs N] [--benchmark-latency MS]
+
+Every run gets a fresh fake account, a throwaway Edge profile, its own trends
+and solution caches (always refetched) and metrics file. Search pacing is set to zero so the
+numbers measure the bot rather than its deliberate delays.
+"""
+import os
+import time
+import shutil
+import logging
+import tempfile
+import threading
+from collections import Counter
+
+from .bot import BingBot
+from .fake_site import FakeSite
+from .trends import TrendsCache
+from .solution_cache import SolutionCache
+from .metrics import load_spans, summarize
+
+class CommandCounter:
+	"""Counts the WebDriver wire commands (find element, execute script, ...) sent by attached drivers."""
+	def __init__(self):
+		self.counts = Counter()
+		self._lock = threading.Lock()
+
+	def attach(self, driver):
+		"""Wraps the driver's execute() so every command it sends is counted."""
+		execute = driver.execute
+		def counting_execute(driver_command, params=None):
+			with self._lock:
+				self.counts[driver_command] += 1
+			return execute(driver_command, params)
+		driver.execute = counting_execute
+
+	@property
+	def total(self):
+		return sum(self.counts.values())
+
+def run_offline_benchmark(config, runs=3, latency_ms=0, log=logging.info):
+	"""
+	Runs the bot `runs` times against a fresh fake site and returns the report dict:
+	runs per minute, per-phase p50/p95 from the metrics spans, WebDriver command counts
+	and fake-site requests per run, and each run's result.
+	"""
+	work_dir = tempfile.mkdtemp(prefix="bing_points_bench_")
+	metrics_file = os.path.join(work_dir, "metrics.jsonl")
+	counter = CommandCounter()
+	results = []
+	requests = 0
+	started = time.monotonic()
+	try:
+		with FakeSite(latency=latency_ms / 1000) as site:
+			log(f"Fake site serving on {site.origin} ({latency_ms} ms latency).")
+			for run in range(1, runs + 1):
+				site.reset()
+				bench_config = dict(config)
+				bench_config.update(site.config_overrides())
+				bench_config.update({
+					"profile_path": tempfile.mkdtemp(prefix="profile_", dir=work_dir),
+					"leetcode_profile_path": "",
+					"profiles": [],
+					"metrics_file": metrics_file,
+					"ledger_file": "",
+					"skip_completed": False,
+					"trends_ttl_minutes": 0,
+					"search_pacing": [0, 0],
+				})
+				bot = BingBot(
+					bench_config,
+					name=f"bench {run}",
+					on_driver_created=counter.attach,
+					trends_cache=TrendsCache(os.path.join(work_dir, f"trends_{run}.json")),
+					solution_cache=SolutionCache(os.path.join(work_dir, f"solutions_{run}")),
+				)
+				commands_before = counter.total
+				try:
+					result = bot.run()
+				finally:
+					bot.quit_driver()
+				requests += site.state.requests
+				results.append({
+					"run": run,
+					"status": result["status"],
+					"duration": result["duration"],
+					"searches": result["searches"],
+					"offers": result["offers"],
+					"leetcode": result["leetcode"],
+					"points_gained": result["points_gained"],
+					"webdriver_commands": counter.total - commands_before,
+					"site_requests": site.state.requests,
+					"error": result["error"],
+				})
+				log(f"Benchmark run {run}/{runs}: {result['status']} in {result['duration']}s, {counter.total - commands_before} WebDriver commands.")
+		wall = time.monotonic() - started
+		spans = [span for span in load_spans(metrics_file) if span.get("phase") != "run"]
+		return {
+			"runs": runs,
+			"ok_runs": sum(1 for result in results if result["status"] == "ok"),
+			"latency_ms": latency_ms,
+			"wall_seconds": round(wall, 3),
+			"runs_per_minute": round(runs / wall * 60, 3) if wall else None,
+			"phases": summarize(spans),
+			"webdriver_commands": {
+				"total": counter.total,
+				"per_run": round(counter.total / runs, 1) if runs else None,
+				"by_command": dict(counter.counts.most_common()),
+			},
+			"site_requests_per_run": round(requests / runs, 1) if runs else None,
+			"results": results,
+		}
+	finally:
+		shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,1662 @@
+import os
+import time
+import random
+import logging
+import threading
+from collections import deque
+from typing import Literal
+
+import pyperclip
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.edge.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.edge.service import Service
+# Import the specific exception
+from selenium.common.exceptions import SessionNotCreatedException, StaleElementReferenceException, TimeoutException
+
+from .config import DEFAULT_CONFIG, TASKS, USER_AGENT, load_config, save_config
+from .driver_cache import DriverCache
+from .trends import TrendsCache, SeleniumTrendsProvider, TRENDS_FETCH_SIZE, make_providers, fetch_trends
+from .extract import TREND_ROWS_XPATH, OFFER_CONTAINERS_XPATH, extract_trends, extract_offers, is_claimable, offer_key, offer_label, offer_link
+from .points import PointsClient, PointsStatus, driver_cookies
+from .solutions import Solution, LeetCodeGraphQL, make_solution_sources, fetch_solutions, slug_from_url, looks_like_solution
+from .solution_cache import SolutionCache
+from .scoring import rank_candidates
+from .verify import parse_examples, verify_solution
+from .endpoints import EndpointRegistry
+from .locators import LocatorRegistry
+from .waits import wait_until, wait_for_any, wait_for_ready_state, wait_for_dom_quiet, wait_for_element_stable, wait_for_new_window, wait_for_network_idle
+from .metrics import Metrics
+from .ledger import Ledger, account_key
+from .orchestrator import Orchestrator, Task
+from .phases import BING_PHASE, LEETCODE_PHASE, plan_sessions, describe_plan
+from .lean import apply_lean_options, set_resource_blocking, page_stats
+
+# Page-ready check for pipelined tabs. A page is ready once the marker set on the previous
+# document before navigating is gone, the DOM is parsed and the given selector matches.
+PAGE_READY_JS = "return !window.__bingPointsPending && document.readyState !== 'loading' && !!document.querySelector(arguments[0]);"
+
+SEARCH_STRATEGIES = ("searchbox", "url")
+# Pages loaded by benchmark_lean_mode()
+LEAN_BENCHMARK_ENDPOINTS = ("bing.home", "bing.search", "rewards.flyout", "trends.page", "leetcode.problemset")
+
+# Shared by every runner in the process so pool workers serialise installs
+DRIVER_CACHE = DriverCache()
+# One trends fetch per TTL serves every runner (and account) in the process
+TRENDS_CACHE = TrendsCache()
+# Solutions of the daily problem, researched once and shared by every account
+SOLUTION_CACHE = SolutionCache()
+# Ranked element locators; the winning locator of each element is remembered across runs
+LOCATORS = LocatorRegistry()
+# Pool workers may write resolved settings back to the same config file
+_CONFIG_WRITE_LOCK = threading.Lock()
+
+# --- Bot Runner ---
+class BingBot:
+	"""
+	GUI-independent runner for the Bing Points automation.
+	Front-ends (the Tkinter app, the CLI) pass a config dict and optional callbacks
+	for status updates, error/info popups and driver prompts; run() returns a result dict.
+	"""
+	def __init__(self, config, cancel_event=None, on_status=None, on_error=None, on_info=None,
+				on_driver_missing=None, on_leetcode_done=None, name=None, config_path=None, on_driver_resolved=None,
+				on_driver_created=None, trends_cache=None, session_pool=None, on_progress=None,
+				solution_cache=None):
+		# Work on a copy so the Leetcode headless override never leaks back to the caller
+		self.config = DEFAULT_CONFIG.copy()
+		self.config.update(config)
+		self.cancel_event = cancel_event or threading.Event()
+		self.on_status = on_status
+		self.on_error = on_error
+		self.on_info = on_info
+		self.on_driver_missing = on_driver_missing
+		self.on_leetcode_done = on_leetcode_done
+		self.name = name # Prefixes log lines when several profiles run side by side
+		self.config_path = config_path # Where resolved settings (driver_path) are written back
+		self.on_driver_resolved = on_driver_resolved
+		self.on_driver_created = on_driver_created # Called with every new driver (e.g. to count WebDriver commands)
+		self.on_progress = on_progress # Called with every task event of the run (see bing_points.orchestrator)
+		self.trends_cache = trends_cache or TRENDS_CACHE
+		self.solution_cache = solution_cache or SOLUTION_CACHE
+		self.session_pool = session_pool # Lends warm browsers instead of starting new ones (bing_points.daemon)
+		self.search_latencies: list[dict] = [] # Per-search timings of the last search phase
+		self.metrics = Metrics(self.config.get("metrics_file") or "", profile=name)
+		self.ledger = Ledger(self.config.get("ledger_file") or "")
+		self.endpoints = EndpointRegistry(self.config)
+		self.driver: webdriver.Edge | None = None # Explicitly type hint
+		self.session: dict | None = None # Planned session the active driver belongs to
+		self._prewarm_thread: threading.Thread | None = None
+		self._prewarmed: webdriver.Edge | None = None
+		self.initial_tab: str | None = None # Window the Bing steps return to
+		self.prefetched_trends: list[str] | None = None # Terms fetched by the trends task ahead of the searches ([] if it found none)
+		self.points_statuses: dict[str, PointsStatus] = {} # "before"/"after" reads of the last run
+		self.unconfirmed_locators: dict[str, tuple] = {} # Winners of find(remember=False) awaiting confirm_locator()
+		self.offers_remaining: int | None = None # Claimable offers left after the offers step (None if unknown)
+
+	# --- Status & Error Helpers ---
+	def log_status(self, message, lvl: Literal["info", "warn", "debug", "error"]="info"):
+		"""Logs the message and forwards it to the status callback (debug messages are only logged)."""
+		if self.name:
+			message = f"[{self.name}] {message}"
+		if lvl == "warn":
+			logging.warning(message)
+		elif lvl == "debug":
+			logging.debug(message)
+		elif lvl == "error":
+			logging.error(message)
+		else:
+			logging.info(message)
+		if self.on_status and lvl != "debug":
+			self.on_status(message)
+
+	def show_error(self, title, message):
+		"""Logs an error and forwards it to the error callback."""
+		logging.error(message)
+		if self.on_error:
+			self.on_error(title, message)
+
+	def show_info(self, title, message):
+		"""Logs info and forwards it to the info callback."""
+		logging.info(message)
+		if self.on_info:
+			self.on_info(title, message)
+
+	def quit_driver(self):
+		"""Quits the active driver, ignoring errors from an already closed browser."""
+		if not self.driver:
+			return
+		self.close_driver(self.driver)
+		self.driver = None
+
+	def abort_browser(self):
+		"""
+		Quits the active browser so a step blocked on it fails fast; called when a step runs past
+		its task_timeouts entry. A pooled browser is handed back dead and restarted by the pool.
+		"""
+		driver, self.driver = self.driver, None
+		if not driver:
+			return
+		self.log_status("Step timed out. Closing the browser to stop it.", "warn")
+		try:
+			driver.quit()
+		except Exception as e:
+			logging.debug(f"Error while quitting driver on timeout: {e}")
+		if self.session_pool:
+			self.session_pool.release(driver)
+
+	def close_driver(self, driver):
+		"""Quits a driver, or hands it back to the session pool to keep it warm."""
+		try:
+			if self.session_pool:
+				self.session_pool.release(driver)
+			else:
+				driver.quit()
+		except Exception as e:
+			logging.debug(f"Error while quitting driver: {e}")
+
+	def remember_driver_path(self, driver_path):
+		"""Records a resolved driver as the config's driver_path so it doubles as the offline fallback."""
+		if not driver_path or driver_path == self.config.get("driver_path"):
+			return
+		self.config["driver_path"] = driver_path
+		if self.on_driver_resolved:
+			self.on_driver_resolved(driver_path)
+		if not self.config_path:
+			return
+		try:
+			with _CONFIG_WRITE_LOCK:
+				saved_config = load_config(self.config_path)
+				saved_config["driver_path"] = driver_path
+				save_config(saved_config, self.config_path)
+		except Exception as e:
+			self.log_status(f"Could not save driver path to {self.config_path}: {e}", "warn")
+
+	def start_prewarm(self, session):
+		"""Starts the browser for a later session on a background thread."""
+		def _warm():
+			self._prewarmed = self.setup_driver(session)
+		self.log_status(f"Pre-warming {'+'.join(session['phases'])} session in the background...")
+		self._prewarm_thread = threading.Thread(target=_warm, daemon=True)
+		self._prewarm_thread.start()
+
+	def take_prewarmed(self):
+		"""Waits for the pre-warmed browser (usually already up) and hands it over."""
+		if self._prewarm_thread:
+			self._prewarm_thread.join()
+			self._prewarm_thread = None
+		driver, self._prewarmed = self._prewarmed, None
+		return driver
+
+	def cancel(self):
+		"""Signal the run to stop and attempt to quit the browser."""
+		self.cancel_event.set()
+		self.log_status("Cancellation requested. Attempting to stop...")
+		# Closing the browser makes any pending WebDriver call fail fast
+		for driver in (self.driver, self._prewarmed):
+			try:
+				if driver:
+					driver.quit()
+			except Exception as e:
+				logging.debug(f"Error while quitting driver on cancel: {e}")
+
+	def selected_tasks(self):
+		"""Returns the task names enabled in the config, in run order."""
+		return [task for task in TASKS if self.config.get(f"do_{task}")]
+
+	def run(self):
+		"""
+		The main Selenium automation logic. Blocks until the run finishes and
+		returns a JSON-serialisable result dict.
+		The steps run as orchestrated tasks (see plan_tasks()); progress events go to on_progress.
+		"""
+		started = time.monotonic()
+		self.metrics.new_run()
+		skipped = self.skip_completed_tasks()
+		result = {
+			"status": "ok",
+			"tasks": self.selected_tasks(),
+			"skipped": skipped, # Selected tasks the ledger or the live points read showed done today
+			"points_before": None,
+			"points_after": None,
+			"points_gained": None,
+			"points_status": None,
+			"searches": 0,
+			"search_stats": None,
+			"offers": 0,
+			"leetcode": None,
+			"error": None,
+			"duration": 0.0,
+		}
+		sessions = plan_sessions(self.config)
+		if not sessions:
+			self.log_status("All selected tasks are already done today. Nothing to do." if skipped else "No tasks selected. Nothing to do.")
+			result["duration"] = round(time.monotonic() - started, 3)
+			return result
+		self.prefetched_trends = None
+		self.points_statuses = {}
+		try:
+			# Browser modes are planned for every phase up front so the browser starts once
+			self.log_status(f"Session plan: {describe_plan(sessions)}")
+			orchestrator = Orchestrator(self.plan_tasks(sessions, result), self.cancel_event, self.report_progress)
+			outcomes = orchestrator.run_sync()
+
+			if self.cancel_event.is_set():
+				self.log_status("Run cancelled.")
+				result["status"] = "cancelled"
+			elif not outcomes["driver"].ok:
+				# setup_driver() will have already shown a specific error and logged it
+				self.log_status("Driver setup failed. Halting bot run.")
+				result["status"] = "failed"
+				result["error"] = "Driver setup failed."
+			else:
+				failed = [(name, outcome) for name, outcome in outcomes.items() if outcome.state in ("failed", "timeout")]
+				if failed:
+					name, outcome = failed[0]
+					result["status"] = "error"
+					result["error"] = f"{name}: {outcome.error}"
+					self.show_error("Bing Bot Error", f"An error occurred during bot operation ({name}):\n{outcome.error}")
+			self.report_points(result)
+		except Exception as e:
+			result["status"] = "cancelled" if self.cancel_event.is_set() else "error"
+			result["error"] = str(e)
+			self.show_error("Bing Bot Error", f"An error occurred during bot operation:\n{e}")
+		finally:
+			# --- Cleanup ---
+			# A pre-warmed session that never got used (failure, cancel) must not linger
+			prewarmed = self.take_prewarmed()
+			if prewarmed:
+				self.close_driver(prewarmed)
+			if self.driver:
+				if self.session_pool:
+					self.log_status("Returning browser to the warm session pool.")
+					self.quit_driver()
+				elif self.session["headless"]:
+					self.log_status("Headless mode: Quitting driver.")
+					self.quit_driver()
+				else:
+					self.log_status("Browser left open. Close UI to quit driver (if not detached).")
+			result["duration"] = round(time.monotonic() - started, 3)
+			self.metrics.record("run", result["duration"], result["status"], tasks=result["tasks"])
+		return result
+
+	def ledger_account(self, task):
+		"""The ledger key of the account a task runs under; Leetcode may use its own profile."""
+		profile_path = self.config.get("leetcode_profile_path") if task == "leetcode" else ""
+		return account_key(profile_path or self.config.get("profile_path"))
+
+	def skip_completed_tasks(self):
+		"""Deselects the tasks the ledger shows done today (unless skip_completed is off) and returns their names."""
+		if not self.config.get("skip_completed", True):
+			return []
+		skipped = [task for task in self.selected_tasks() if task in self.ledger.done_today(self.ledger_account(task))]
+		for task in skipped:
+			self.config[f"do_{task}"] = False
+		if skipped:
+			self.log_status(f"Already done today: {', '.join(skipped)}. Skipping (set skip_completed to false to run them again).")
+		return skipped
+
+	def record_task(self, task, status="done", **fields):
+		"""Appends a finished task (or a points read) of this account to the ledger."""
+		self.ledger.record(self.ledger_account(task), task, status, **fields)
+
+	def plan_tasks(self, sessions, result):
+		"""
+		Builds the task graph of a run. Browser steps share the "browser" resource and run one
+		at a time; the trends fetch only tries the HTTP providers, so it never waits for the browser
+		and overlaps the driver start and the first points read (the browser scraper is left to
+		the searches step). A failed search phase doesn't stop offers or Leetcode. A browser step
+		running past its timeout gets the browser closed under it, failing the browser steps after it.
+		"""
+		timeouts = self.config.get("task_timeouts") or {}
+		bing = BING_PHASE in sessions[0]["phases"]
+		tasks = [Task("driver", lambda: self.step_setup_driver(sessions), timeout=timeouts.get("driver"), exclusive="browser", on_timeout=self.abort_browser)]
+		if bing and self.config["do_searches"]:
+			tasks.append(Task("trends", self.step_prefetch_trends, timeout=timeouts.get("trends")))
+		bing_steps = []
+		if bing:
+			tasks.append(Task("points_before", lambda: self.step_points(result, "before"), deps=("driver",), timeout=timeouts.get("points"), exclusive="browser", on_timeout=self.abort_browser))
+			bing_steps.append("points_before")
+			if self.config["do_searches"]:
+				tasks.append(Task("searches", lambda: self.step_searches(result), deps=("driver",), after=("trends", "points_before"), timeout=timeouts.get("searches"), exclusive="browser", on_timeout=self.abort_browser))
+				bing_steps.append("searches")
+			if self.config["do_offers"]:
+				tasks.append(Task("offers", lambda: self.step_offers(result), deps=("driver",), after=tuple(bing_steps), timeout=timeouts.get("offers"), exclusive="browser", on_timeout=self.abort_browser))
+				bing_steps.append("offers")
+			tasks.append(Task("points_after", lambda: self.step_points(result, "after"), deps=("driver",), after=tuple(bing_steps), timeout=timeouts.get("points"), exclusive="browser", on_timeout=self.abort_browser))
+			bing_steps.append("points_after")
+		if self.config["do_leetcode"]:
+			# A separate Leetcode session only needs the first session to have been attempted
+			same_session = LEETCODE_PHASE in sessions[0]["phases"]
+			tasks.append(Task(
+				"leetcode", lambda: self.step_leetcode(sessions, result),
+				deps=("driver",) if same_session else (), after=("driver", *bing_steps),
+				timeout=timeouts.get("leetcode"), exclusive="browser", on_timeout=self.abort_browser,
+			))
+		return tasks
+
+	def report_progress(self, event):
+		"""Logs an orchestrator task event and forwards it to the progress callback."""
+		message = f"Task {event['task']}: {event['state']}" + (f" ({event['error']})" if event["error"] else "")
+		self.log_status(message, "warn" if event["state"] in ("failed", "timeout") else "debug")
+		if self.on_progress:
+			self.on_progress(event)
+
+	def step_setup_driver(self, sessions):
+		self.log_status("[1/5] Setting up Edge driver...")
+		self.session = sessions[0]
+		self.driver = self.setup_driver(self.session)
+		if len(sessions) > 1:
+			self.start_prewarm(sessions[1])
+		if not self.driver:
+			raise RuntimeError("Driver setup failed.")
+		self.initial_tab = self.driver.current_window_handle
+
+	def step_prefetch_trends(self):
+		self.prefetched_trends = self.get_trending_searches(browser=False)
+
+	def step_points(self, result, which):
+		if which == "before":
+			self.apply_lean_mode(BING_PHASE)
+			self.log_status("[2/4] Retrieving initial points...")
+		else:
+			self.log_status("Retrieving final points...")
+		status = self.get_current_points()
+		result[f"points_{which}"] = status.balance
+		if which == "after":
+			result["points_status"] = status.to_dict()
+		self.log_status(f"Points {which}: {self.describe_points(status)}")
+		self.points_statuses[which] = status
+		if status.known:
+			self.record_task("points", "read", which=which, **status.to_dict())
+
+	def step_searches(self, result):
+		# Cheap live check: the points read already tells whether today's PC searches are maxed out
+		status_before = self.points_statuses.get("before")
+		if self.config.get("skip_completed", True) and status_before is not None and status_before.searches_done:
+			self.log_status(f"PC search points already maxed out today ({status_before.pc_search_progress}/{status_before.pc_search_max}). Skipping searches.")
+			result["skipped"].append("searches")
+			self.record_task("searches", pc_search_progress=status_before.pc_search_progress, pc_search_max=status_before.pc_search_max)
+			return
+		self.log_status("[3/4] Performing trending searches...")
+		search_started = time.monotonic()
+		with self.metrics.span("searches", mode=self.config.get("search_mode"), strategy=self.config.get("search_strategy")) as span:
+			if self.config.get("search_mode") == "pipelined":
+				result["searches"] = self.perform_pipelined_searches(self.initial_tab)
+			elif self.config.get("search_strategy") == "url":
+				result["searches"] = self.perform_url_searches(self.initial_tab)
+			else:
+				result["searches"] = self.perform_trending_searches(self.initial_tab)
+			span.fields["completed"] = result["searches"]
+		result["search_stats"] = self.search_stats(time.monotonic() - search_started)
+		if result["searches"] >= self.config["num_searches"]:
+			self.record_task("searches", searches=result["searches"])
+		self.driver.switch_to.window(self.initial_tab)
+		self.driver.get(self.endpoints.url("bing.home")) # Refresh
+		wait_for_network_idle(self.driver, self.config["timeout"])
+
+	def step_offers(self, result):
+		self.log_status("[4/4] Collecting special offers...")
+		with self.metrics.span("offers") as span:
+			result["offers"] = self.collect_special_offers(self.initial_tab)
+			span.fields["completed"] = result["offers"]
+		if self.offers_remaining == 0:
+			self.record_task("offers", offers=result["offers"])
+		self.driver.switch_to.window(self.initial_tab)
+		self.driver.get(self.endpoints.url("bing.home")) # Refresh
+		wait_for_network_idle(self.driver, self.config["timeout"])
+
+	def step_leetcode(self, sessions, result):
+		self.log_status("Preparing Leetcode bot...")
+		if LEETCODE_PHASE not in self.session["phases"]:
+			self.log_status("Switching to the pre-warmed Leetcode session...")
+			self.quit_driver()
+			self.session = sessions[1]
+			self.driver = self.take_prewarmed()
+			if not self.driver:
+				self.log_status("Leetcode session failed to start. Skipping Leetcode bot.")
+				result["leetcode"] = False
+				return
+		else:
+			self.log_status("Continuing Leetcode in the current browser session.")
+		self.apply_lean_mode(LEETCODE_PHASE)
+
+		self.log_status("Running Leetcode bot...")
+		with self.metrics.span("leetcode") as span:
+			result["leetcode"] = bool(self.run_leetcode_bot())
+			if not result["leetcode"]:
+				span.outcome = "failed"
+		if result["leetcode"]:
+			self.record_task("leetcode")
+		self.log_status("Leetcode bot finished.")
+
+	def report_points(self, result):
+		"""Logs and shows the points gained when both reads succeeded."""
+		status_before, status_after = self.points_statuses.get("before"), self.points_statuses.get("after")
+		if status_before is None or status_after is None:
+			return
+		# Gains are only meaningful when both reads succeeded
+		if not (status_before.known and status_after.known):
+			self.log_status("Could not read points before or after. Check UI manually.")
+			self.show_info("Bing Bot Finished", "Bot run complete.\n\nCould not read point values. Please check Bing manually.")
+		else:
+			total_gained = status_after.balance - status_before.balance
+			result["points_gained"] = total_gained
+			self.log_status(f"Total points gained: {total_gained}")
+			self.show_info("Bing Bot Finished", f"Bot run complete.\n\nPoints Gained: {total_gained}\nPoints Before: {status_before.balance}\nPoints After: {status_after.balance}")
+
+	# --- Selenium Core Functions ---
+	def apply_lean_mode(self, phase):
+		"""Blocks images, media, fonts and trackers in the current browser while `phase` runs, if it is a lean phase."""
+		lean_phases = self.config.get("lean_phases") or []
+		if not lean_phases:
+			return
+		# A browser shared by a lean and a non-lean phase turns blocking off again
+		lean = phase in lean_phases
+		if set_resource_blocking(self.driver, lean) and lean:
+			self.log_status(f"Lean mode on for {phase}: blocking images, media, fonts and trackers.")
+
+	def setup_driver(self, session=None):
+		"""Starts the WebDriver for the planned session, timed as a "driver_setup" span. Returns None on failure."""
+		with self.metrics.span("driver_setup", headless=(session or self.config)["headless"], lean=bool((session or {}).get("lean"))) as span:
+			if self.session_pool:
+				driver, reused = self.session_pool.acquire(self, session)
+				span.fields["warm"] = reused
+			else:
+				driver, reused = self.create_driver(session), False
+			if not driver:
+				span.outcome = "failed"
+			elif self.on_driver_created and not reused:
+				self.on_driver_created(driver)
+			return driver
+
+	def create_driver(self, session=None):
+		"""Sets up and configures the WebDriver based on UI settings and the planned session."""
+		try:
+			cfg = dict(self.config)
+			if session:
+				cfg["headless"] = session["headless"]
+				cfg["profile_path"] = session["profile_path"]
+			edge_options = Options()
+			
+			if cfg["headless"]:
+				edge_options.add_argument("--headless=new")
+
+			# "eager"/"none" return from navigation before subresources load; waits check readiness instead
+			edge_options.page_load_strategy = cfg.get("page_load_strategy") or "normal"
+			if cfg.get("cdp_network_logs"):
+				# Lets wait_for_network_idle track requests via CDP Network events instead of resource timing
+				edge_options.set_capability("ms:loggingPrefs", {"performance": "ALL"})
+			if session and session.get("lean"):
+				# No image decoding, background networking or waiting for subresources (see bing_points.lean)
+				apply_lean_options(edge_options)
+			
+			# Anti-detection options
+			edge_options.add_argument("--no-sandbox")
+			edge_options.add_argument("--disable-gpu")
+			edge_options.add_argument("--disable-dev-shm-usage")
+			edge_options.add_argument("--disable-blink-features=AutomationControlled")
+			edge_options.add_argument("--disable-extensions")
+			edge_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+			edge_options.add_experimental_option("useAutomationExtension", False)
+			# Keep browser open for non-headless runs, except during Leetcode where users may opt to close it.
+			edge_options.add_experimental_option(
+				"detach",
+				not cfg["headless"] and not cfg.get("do_leetcode", False)
+			)
+			
+			edge_options.add_argument(f"user-agent={USER_AGENT}")
+			
+			# Use user-selected profile path
+			if not cfg["profile_path"] or not os.path.exists(cfg["profile_path"]):
+				error_msg = f"Profile path is invalid or not set:\n{cfg['profile_path']}"
+				self.show_error("Profile Error", error_msg)
+				raise Exception(error_msg) # This will be caught by the outer catch
+			edge_options.add_argument(f"--user-data-dir={cfg['profile_path']}") 
+
+			# Use user-selected binary location (if provided)
+			if cfg["binary_path"] and os.path.exists(cfg["binary_path"]):
+				edge_options.binary_location = cfg["binary_path"]
+			elif cfg["binary_path"] and not os.path.exists(cfg["binary_path"]):
+				# If path is given but invalid, it's an error
+				error_msg = f"Binary path is set but invalid (file not found):\n{cfg['binary_path']}"
+				self.show_error("Binary Path Error", error_msg)
+				raise Exception(error_msg)
+			
+			# Initialize the driver service
+			service = None
+			try:
+				self.log_status("Resolving Edge driver (cache, then webdriver-manager)...")
+				driver_path = DRIVER_CACHE.resolve(cfg["binary_path"], self.log_status, timer=self.metrics.span)
+				service = Service(driver_path)
+				self.remember_driver_path(driver_path)
+			
+			# Catch ALL exceptions from webdriver-manager
+			except Exception as e_manager: 
+				self.log_status(f"Driver cache/webdriver-manager failed: {e_manager}. Trying saved path.")
+				
+				user_driver_path = cfg.get("driver_path")
+				if not user_driver_path or not os.path.exists(user_driver_path):
+					self.log_status("User-defined driver path is also invalid. Prompting user.")
+					if self.on_driver_missing:
+						self.on_driver_missing()
+					return None # Stop the current bot run
+				
+				self.log_status(f"Using saved driver path: {user_driver_path}")
+				service = Service(executable_path=user_driver_path)
+
+			if not service:
+				self.log_status("Could not initialize driver service.")
+				return None
+				
+			driver = webdriver.Edge(service=service, options=edge_options)
+			driver.set_window_size(1280, 800)
+			driver.set_page_load_timeout(cfg["timeout"])
+			driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+			
+			return driver
+		
+		except SessionNotCreatedException as e:
+			error_str = str(e).lower()
+			if "cannot find msedge binary" in error_str:
+				error_msg = ("Microsoft Edge binary not found.\n\n"
+							"Please ensure Microsoft Edge is installed correctly, "
+							f"or manually provide the path to {'msedge.exe' if os.name=='nt' else 'msedge'} in the 'Binary Path' setting.")
+				self.show_error("Edge Binary Not Found", error_msg)
+			else:
+				self.show_error("Driver Session Error", f"Failed to create driver session:\n{e.msg}")
+			return None
+			
+		except Exception as e:
+			self.show_error("Driver Setup Failed", f"Failed to initialize WebDriver: {e}")
+			return None
+
+	def describe_points(self, status: PointsStatus):
+		"""Short log form of a PointsStatus."""
+		if not status.known:
+			return "unknown"
+		text = f"{status.balance} (via {status.source})"
+		if status.pc_search_max:
+			text += f", PC searches {status.pc_search_progress}/{status.pc_search_max}"
+		return text
+
+	def get_current_points(self) -> PointsStatus:
+		"""Reads the points (see read_points), timed as a "points_read" span."""
+		with self.metrics.span("points_read") as span:
+			status = self.read_points()
+			span.fields["source"] = status.source
+			if not status.known:
+				span.outcome = "unknown"
+			return status
+
+	def read_points(self) -> PointsStatus:
+		"""
+		Retrieves the current point balance: one request to the rewards API with the
+		browser's cookies, falling back to reading the rewards flyout page.
+		Returns a PointsStatus whose balance is None when the points could not be read.
+		"""
+		if not self.driver:
+			self.log_status("Driver not available. Cannot get points.", "warn")
+			return PointsStatus()
+
+		if self.config.get("points_source", "api") == "api":
+			for url in self.endpoints.routes("rewards.api"):
+				try:
+					return PointsClient(url, self.config["timeout"]).fetch_from_driver(self.driver)
+				except Exception as e:
+					self.log_status(f"Rewards API points read failed ({url}): {e}", "warn")
+					self.metrics.retry()
+			self.log_status("Reading points from the flyout instead.")
+
+		try:
+			# The flyout balance and the broader header counter are raced together
+			points_element = self.open_endpoint("rewards.flyout", "rewards.points")
+			points_str = points_element.text.replace(',', '')
+			return PointsStatus(balance=int(points_str), source="flyout")
+		except Exception as e:
+			self.log_status(f"Could not retrieve points from the flyout: {e}. Points unknown.", "warn")
+			return PointsStatus()
+		finally:
+			self.driver.switch_to.default_content()
+
+
+	def get_trending_searches(self, browser=True):
+		"""
+		Returns num_searches search terms from the shared trends cache, refreshing it when stale.
+		With `browser` False only the HTTP providers are tried and only fresh terms are returned
+		([] if there are none), leaving the browser scraper, stale terms and the fallback corpus
+		to a later call.
+		"""
+		prefetched, self.prefetched_trends = self.prefetched_trends, None
+		if prefetched:
+			return prefetched
+		if self.cancel_event.is_set():
+			self.log_status("Cancellation requested. Aborting trend fetch.")
+			return []
+		ttl_seconds = float(self.config.get("trends_ttl_minutes") or 0) * 60
+		providers = make_providers(self.config, self if browser else None)
+		if prefetched is not None:
+			# The trends task already tried the HTTP providers; only the browser scraper is left
+			providers = [provider for provider in providers if isinstance(provider, SeleniumTrendsProvider)]
+		# Fetch beyond num_searches so the cached list serves accounts with larger counts
+		limit = max(self.config["num_searches"], TRENDS_FETCH_SIZE)
+		def _fetch():
+			# Only cache misses reach here, so the span times real fetches
+			with self.metrics.span("trends_fetch", providers=[provider.name for provider in providers]) as span:
+				terms = fetch_trends(providers, limit, self.log_status)
+				span.fields["terms"] = len(terms)
+				if not terms:
+					span.outcome = "empty"
+				return terms
+		return self.trends_cache.get(_fetch, self.config["num_searches"], ttl_seconds, self.log_status, fallback=browser)
+
+	def scrape_trending_searches(self, limit):
+		"""Extracts up to `limit` trending search titles from the Google Trends page. Returns [] on failure."""
+		if not self.driver:
+			self.log_status("Driver not available. Cannot get trends.", "warn")
+			return [] # Return empty list
+
+		self.log_status("Getting trending searches from Google...")
+		try:
+			# honor cancellation
+			if self.cancel_event.is_set():
+				self.log_status("Cancellation requested. Aborting trend fetch.")
+				return []
+			self.open_endpoint("trends.page", (By.XPATH, f"{TREND_ROWS_XPATH}[1]"))
+			# Every row is read by a single script call rather than one find_element per row
+			trending_searches = extract_trends(self.driver, limit)
+			self.log_status(f"Extracted {len(trending_searches)} trends: {', '.join(trending_searches)}")
+			return trending_searches
+
+		except Exception as e:
+			self.log_status(f"Error extracting trending searches: {e}", "warn")
+		return []
+
+	def perform_trending_searches(self, initial_tab):
+		"""Performs Bing searches based on trending topics. Returns the number of completed searches."""
+		if not self.driver:
+			self.log_status("Driver not available. Skipping searches.", "warn")
+			return 0
+
+		trending_searches = self.get_trending_searches()
+		total_searches = len(trending_searches)
+		self.log_status(f"Retrieved {total_searches} trending searches.")
+
+		pacing_min, pacing_max = self.config.get("search_pacing") or (0, 0)
+		completed = 0
+		self.search_latencies = []
+		for i, search_term in enumerate(trending_searches):
+			# allow user to cancel between searches
+			if self.cancel_event.is_set():
+				self.log_status("Cancellation requested. Aborting remaining searches.")
+				break
+			self.log_status(f"Performing search {i+1}/{total_searches}: {search_term}")
+			
+			try:
+				with self.metrics.span("search", mode="serial", strategy="searchbox"):
+					search_started = time.monotonic()
+					original_handles = self.driver.window_handles
+					self.driver.execute_script("window.open(arguments[0], '_blank');", self.endpoints.url("bing.home"))
+					new_tab_handle = wait_for_new_window(self.driver, original_handles, self.config["timeout"])
+					self.driver.switch_to.window(new_tab_handle)
+
+					search_box = self.find("bing.search_box")
+					self.driver.execute_script("window.__bingPointsPending = true;")
+					search_box.send_keys(search_term)
+					search_box.send_keys(Keys.RETURN)
+					# Keep the tab until the results page has actually loaded
+					self.wait_until_ready("#b_results")
+				self.log_status(f"Searched for '{search_term}'.")
+				completed += 1
+				self.search_latencies.append({"term": search_term, "seconds": round(time.monotonic() - search_started, 3)})
+
+			except Exception as e:
+				self.log_status(f"Error during search for '{search_term}': {e}", "warn")
+			
+			finally:
+				# Close current tab and switch back
+				if len(self.driver.window_handles) > 1:
+					self.driver.close()
+				self.driver.switch_to.window(initial_tab)
+			if i + 1 < total_searches:
+				time.sleep(random.uniform(pacing_min, pacing_max)) # Configured pacing between searches
+		return completed
+
+	def perform_pipelined_searches(self, initial_tab):
+		"""
+		Performs trending searches over a window of "search_tabs" tabs kept in flight at once.
+		Each tab steps through home page -> query submitted -> results ready (or straight to the
+		results URL with the "url" search strategy), so the next query is submitted while
+		earlier result pages are still loading. Submissions are spaced by a
+		random delay within "search_pacing" [min, max] seconds instead of fixed sleeps.
+		Returns the number of completed searches.
+		"""
+		if not self.driver:
+			self.log_status("Driver not available. Skipping searches.", "warn")
+			return 0
+
+		trending_searches = self.get_trending_searches()
+		total_searches = len(trending_searches)
+		self.log_status(f"Retrieved {total_searches} trending searches.")
+		self.search_latencies = []
+		if not trending_searches:
+			return 0
+
+		timeout = self.config["timeout"]
+		use_url = self.config.get("search_strategy") == "url"
+		pacing_min, pacing_max = self.config.get("search_pacing") or (0, 0)
+		pending = deque(trending_searches)
+		completed = 0
+		next_submit_at = 0.0
+
+		# Open the tab window up front; each slot tracks one in-flight search
+		slots = []
+		for _ in range(min(max(1, int(self.config.get("search_tabs") or 1)), total_searches)):
+			original_handles = self.driver.window_handles
+			self.driver.execute_script("window.open('about:blank', '_blank');")
+			handle = wait_for_new_window(self.driver, original_handles, self.config["timeout"])
+			slots.append({"handle": handle, "term": None, "state": "idle", "started": 0.0})
+		self.log_status(f"Pipelining {total_searches} searches over {len(slots)} tabs.")
+
+		try:
+			while pending or any(slot["state"] != "idle" for slot in slots):
+				if self.cancel_event.is_set():
+					self.log_status("Cancellation requested. Aborting remaining searches.")
+					break
+				progressed = False
+				for slot in slots:
+					now = time.monotonic()
+					if slot["state"] == "idle" and (not pending or now < next_submit_at):
+						continue
+					try:
+						self.driver.switch_to.window(slot["handle"])
+						if slot["state"] == "idle":
+							slot["term"] = pending.popleft()
+							slot["started"] = now
+							slot["state"] = "results" if use_url else "home"
+							# Navigate via JS so the call returns before the page has loaded
+							self.driver.execute_script(
+								"window.__bingPointsPending = true; window.location.href = arguments[0];",
+								self.endpoints.url("bing.search", q=slot["term"]) if use_url else self.endpoints.url("bing.home")
+							)
+							next_submit_at = now + random.uniform(pacing_min, pacing_max)
+							self.log_status(f"Performing search {total_searches - len(pending)}/{total_searches}: {slot['term']}")
+							progressed = True
+						elif slot["state"] == "home":
+							if self.driver.execute_script(PAGE_READY_JS, "[name='q']"):
+								search_box = self.driver.find_element(By.NAME, "q")
+								self.driver.execute_script("window.__bingPointsPending = true;")
+								search_box.send_keys(slot["term"], Keys.RETURN)
+								slot["state"] = "results"
+								progressed = True
+						elif slot["state"] == "results":
+							if self.driver.execute_script(PAGE_READY_JS, "#b_results"):
+								seconds = round(now - slot["started"], 3)
+								self.search_latencies.append({"term": slot["term"], "seconds": seconds})
+								self.metrics.record("search", seconds, mode="pipelined", strategy="url" if use_url else "searchbox")
+								self.log_status(f"Searched for '{slot['term']}' in {seconds}s.")
+								completed += 1
+								slot["state"] = "idle"
+								progressed = True
+						if slot["state"] != "idle" and now - slot["started"] > timeout:
+							self.log_status(f"Search for '{slot['term']}' timed out in state '{slot['state']}'.", "warn")
+							self.metrics.record("search", now - slot["started"], "timeout", mode="pipelined", state=slot["state"])
+							slot["state"] = "idle"
+					except Exception as e:
+						self.log_status(f"Error during search for '{slot['term']}': {e}", "warn")
+						self.metrics.record("search", time.monotonic() - slot["started"], "error", mode="pipelined", error=str(e))
+						slot["state"] = "idle"
+				if not progressed:
+					time.sleep(0.1) # Poll interval while every tab is still loading
+		finally:
+			# Close the pipeline tabs and switch back
+			for slot in slots:
+				try:
+					self.driver.switch_to.window(slot["handle"])
+					self.driver.close()
+				except Exception as e:
+					logging.debug(f"Error closing search tab: {e}")
+			self.driver.switch_to.window(initial_tab)
+		return completed
+
+	def find(self, name, timeout=None, clickable=False, remember=True):
+		"""
+		Races every registered locator of the element (see locators.json) and returns the
+		first match, remembering the winning locator. Raises TimeoutException like WebDriverWait.
+		With `remember` False the winner is only kept until confirm_locator() is called, for
+		elements where a match alone doesn't prove the locator found the right one.
+		"""
+		hit = wait_for_any(
+			self.driver, LOCATORS.locators(name), timeout or self.config["timeout"], clickable,
+			use_js=self.config.get("locator_js_batch", True)
+		)
+		if remember:
+			LOCATORS.remember(name, hit.locator)
+		else:
+			self.unconfirmed_locators[name] = hit.locator
+		self.metrics.record("locate", hit.elapsed, element=name, rank=hit.index)
+		self.log_status(f"Found {name} via {hit.locator[0]} locator #{hit.index + 1} in {hit.elapsed:.2f}s.", "debug")
+		return hit.element
+
+	def confirm_locator(self, name):
+		"""Remembers the locator that last found the element, once the action on it is known to have worked."""
+		locator = self.unconfirmed_locators.pop(name, None)
+		if locator:
+			LOCATORS.remember(name, locator)
+
+	def open_endpoint(self, name, locator):
+		"""
+		Loads the endpoint's routes in the current tab until one shows the locator
+		(a registered element name or a (By, value) tuple).
+		Returns the element; raises the last error if no route worked.
+		"""
+		last_error = None
+		for url in self.endpoints.routes(name):
+			try:
+				self.driver.get(url)
+				if isinstance(locator, str):
+					return self.find(locator)
+				return WebDriverWait(self.driver, self.config["timeout"]).until(EC.presence_of_element_located(locator))
+			except Exception as e:
+				self.log_status(f"Route {url} for {name} failed: {e}", "debug")
+				last_error = e
+		raise last_error
+
+	def wait_until_ready(self, selector, timeout=None):
+		"""Waits until the page navigated to after the last marker has parsed and matches the selector."""
+		wait_until(self.driver, lambda driver: driver.execute_script(PAGE_READY_JS, selector), timeout or self.config["timeout"])
+
+	def search_once(self, term, strategy="url"):
+		"""
+		Performs one search in the current tab and waits for the results page.
+		"url" navigates straight to the results URL; "searchbox" loads the home page and types the query.
+		Returns the search latency in seconds.
+		"""
+		started = time.monotonic()
+		if strategy == "url":
+			self.driver.execute_script("window.__bingPointsPending = true; window.location.href = arguments[0];", self.endpoints.url("bing.search", q=term))
+		else:
+			self.driver.execute_script("window.__bingPointsPending = true; window.location.href = arguments[0];", self.endpoints.url("bing.home"))
+			self.wait_until_ready("[name='q']")
+			search_box = self.driver.find_element(By.NAME, "q")
+			self.driver.execute_script("window.__bingPointsPending = true;")
+			search_box.send_keys(term, Keys.RETURN)
+		self.wait_until_ready("#b_results")
+		return round(time.monotonic() - started, 3)
+
+	def perform_url_searches(self, initial_tab):
+		"""
+		Performs trending searches in the current tab by loading constructed results URLs,
+		skipping the home page load and search box round trips. Returns the number of completed searches.
+		"""
+		if not self.driver:
+			self.log_status("Driver not available. Skipping searches.", "warn")
+			return 0
+
+		trending_searches = self.get_trending_searches()
+		total_searches = len(trending_searches)
+		self.log_status(f"Retrieved {total_searches} trending searches.")
+		pacing_min, pacing_max = self.config.get("search_pacing") or (0, 0)
+
+		completed = 0
+		self.search_latencies = []
+		self.driver.switch_to.window(initial_tab)
+		for i, search_term in enumerate(trending_searches):
+			if self.cancel_event.is_set():
+				self.log_status("Cancellation requested. Aborting remaining searches.")
+				break
+			self.log_status(f"Performing search {i+1}/{total_searches}: {search_term}")
+			try:
+				with self.metrics.span("search", mode="serial", strategy="url"):
+					seconds = self.search_once(search_term, "url")
+				self.search_latencies.append({"term": search_term, "seconds": seconds})
+				self.log_status(f"Searched for '{search_term}' in {seconds}s.")
+				completed += 1
+			except Exception as e:
+				self.log_status(f"Error during search for '{search_term}': {e}", "warn")
+			if i + 1 < total_searches:
+				time.sleep(random.uniform(pacing_min, pacing_max))
+		return completed
+
+	def benchmark_search_strategies(self, strategies=SEARCH_STRATEGIES):
+		"""
+		Runs the same trending terms through each search strategy in one tab and returns
+		{strategy: search_stats}. Starts and quits its own driver.
+		"""
+		report = {}
+		self.driver = self.setup_driver()
+		if not self.driver:
+			return {"error": "Driver setup failed."}
+		try:
+			terms = self.get_trending_searches()
+			for strategy in strategies:
+				self.search_latencies = []
+				started = time.monotonic()
+				for term in terms:
+					if self.cancel_event.is_set():
+						break
+					try:
+						self.search_latencies.append({"term": term, "seconds": self.search_once(term, strategy)})
+					except Exception as e:
+						self.log_status(f"Benchmark search for '{term}' failed ({strategy}): {e}", "warn")
+				stats = self.search_stats(time.monotonic() - started)
+				stats["strategy"] = strategy
+				report[strategy] = stats
+				self.log_status(f"Search strategy '{strategy}': {len(self.search_latencies)} searches, mean {stats['mean_seconds']}s, total {stats['total_seconds']}s.")
+		finally:
+			self.quit_driver()
+		return report
+
+	def benchmark_lean_mode(self, endpoints=LEAN_BENCHMARK_ENDPOINTS, loads=3):
+		"""
+		Loads each endpoint `loads` times with a normal and with a lean browser (browser cache
+		disabled) and returns {"normal": ..., "lean": ...} with the mean load time and bytes per page.
+		"""
+		report = {}
+		for lean in (False, True):
+			session = {"phases": [], "headless": bool(self.config.get("headless")), "profile_path": self.config.get("profile_path") or "", "lean": lean}
+			self.driver = self.setup_driver(session)
+			if not self.driver:
+				return {"error": "Driver setup failed."}
+			try:
+				self.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+				set_resource_blocking(self.driver, lean)
+				pages = {}
+				for name in endpoints:
+					samples = []
+					for _ in range(loads):
+						if self.cancel_event.is_set():
+							break
+						try:
+							started = time.monotonic()
+							self.driver.get(self.endpoints.url(name, q="weather"))
+							# Time until the bot could use the page ("eager" in lean mode); bytes once everything loaded
+							wait_for_ready_state(self.driver, self.config["timeout"], "interactive" if lean else "complete")
+							seconds = round(time.monotonic() - started, 3)
+							wait_for_ready_state(self.driver, self.config["timeout"])
+							stats = page_stats(self.driver)
+							stats["seconds"] = seconds
+							samples.append(stats)
+						except Exception as e:
+							self.log_status(f"Lean benchmark load of {name} failed ({'lean' if lean else 'normal'}): {e}", "warn")
+					if samples:
+						pages[name] = {
+							"loads": len(samples),
+							"mean_seconds": round(sum(sample["seconds"] for sample in samples) / len(samples), 3),
+							"mean_kb": round(sum(sample["bytes"] for sample in samples) / len(samples) / 1024, 1),
+							"mean_resources": round(sum(sample["resources"] for sample in samples) / len(samples), 1),
+						}
+				mode = "lean" if lean else "normal"
+				report[mode] = {
+					"pages": pages,
+					"mean_seconds": round(sum(page["mean_seconds"] for page in pages.values()) / len(pages), 3) if pages else None,
+					"mean_kb": round(sum(page["mean_kb"] for page in pages.values()) / len(pages), 1) if pages else None,
+				}
+				self.log_status(f"Lean benchmark ({mode}): mean {report[mode]['mean_seconds']}s and {report[mode]['mean_kb']} KB per page.")
+			finally:
+				self.quit_driver()
+		return report
+
+	def search_stats(self, total_seconds):
+		"""Summarises the per-search latencies recorded by the last search phase."""
+		seconds = [entry["seconds"] for entry in self.search_latencies]
+		return {
+			"mode": self.config.get("search_mode", "serial"),
+			"strategy": self.config.get("search_strategy", "searchbox"),
+			"total_seconds": round(total_seconds, 3),
+			"mean_seconds": round(sum(seconds) / len(seconds), 3) if seconds else None,
+			"max_seconds": max(seconds) if seconds else None,
+			"latencies": self.search_latencies,
+		}
+
+	def load_offer_records(self):
+		"""Loads the offers flyout in the current tab and returns every offer tile record (None on failure)."""
+		try:
+			self.open_endpoint("rewards.flyout", (By.XPATH, OFFER_CONTAINERS_XPATH))
+			# All tiles with their ids, labels, classes, locked state and hrefs in one round trip
+			return extract_offers(self.driver)
+		except Exception as e_find:
+			self.show_error("Offer Error", f"Could not find offers container: {e_find}")
+		return None
+
+	def open_offer(self, record):
+		"""Opens an offer in a new background tab, leaving the flyout tab in place."""
+		if record["href"] and record["target"] != "_blank":
+			self.driver.execute_script("window.open(arguments[0], '_blank');", record["href"])
+		else:
+			# Links that open their own tab are clicked so the flyout's click tracking fires
+			offer_link(self.driver, record).click()
+
+	def wait_for_offer_tabs(self, known_handles, home_tab):
+		"""Waits (bounded by the page timeout overall) for newly opened offer tabs to load, then closes them."""
+		deadline = time.monotonic() + self.config["timeout"]
+		for handle in [h for h in self.driver.window_handles if h not in known_handles]:
+			try:
+				self.driver.switch_to.window(handle)
+				WebDriverWait(self.driver, max(0.1, deadline - time.monotonic()), poll_frequency=0.1).until(
+					lambda driver: driver.execute_script("return document.readyState") == "complete"
+				)
+			except Exception as e:
+				self.log_status(f"Offer tab did not finish loading: {e}", "warn")
+			finally:
+				self.driver.close()
+		self.driver.switch_to.window(home_tab)
+
+	def collect_special_offers(self, initial_tab):
+		"""
+		Snapshots every claimable offer from one flyout load, opens them in batches of
+		"offer_tabs" parallel background tabs, then verifies with a single reload.
+		Returns the number of offers confirmed completed (or opened, if verification failed)
+		and leaves the number still claimable in offers_remaining (None if unknown).
+		"""
+		self.offers_remaining = None
+		if not self.driver:
+			self.log_status("Driver not available. Skipping offers.", "warn")
+			return 0
+
+		self.log_status("Checking for special offers...")
+		opened = []
+		try:
+			self.driver.switch_to.window(initial_tab)
+			records = self.load_offer_records()
+			claimable = [record for record in records or [] if is_claimable(record)]
+			self.log_status(f"Found {len(claimable)} claimable offers: {', '.join(offer_label(r) for r in claimable) or 'none'}")
+
+			batch_size = max(1, int(self.config.get("offer_tabs") or 1))
+			for start in range(0, len(claimable), batch_size):
+				if self.cancel_event.is_set():
+					self.log_status("Cancellation requested. Aborting remaining offers.")
+					break
+				known_handles = set(self.driver.window_handles)
+				for record in claimable[start:start + batch_size]:
+					self.log_status(f"Opening offer: {offer_label(record)}")
+					try:
+						with self.metrics.span("offer_open", offer=offer_label(record)):
+							self.open_offer(record)
+						opened.append(record)
+					except Exception as e_click:
+						self.log_status(f"Failed to open offer '{offer_label(record)}': {e_click}", "warn")
+				with self.metrics.span("offer_tabs_wait", tabs=len(claimable[start:start + batch_size])):
+					self.wait_for_offer_tabs(known_handles, initial_tab)
+
+			if not opened:
+				if records is not None and not claimable:
+					self.offers_remaining = 0
+				return 0
+
+			# One reload to see which offers the flyout now reports as done
+			with self.metrics.span("offer_verify") as span:
+				after = self.load_offer_records()
+				if after is None:
+					span.outcome = "failed"
+			if after is None:
+				self.log_status("Could not verify offers after opening them.", "warn")
+				return len(opened)
+			still_open = {offer_key(record) for record in after if is_claimable(record)}
+			completed = [record for record in opened if offer_key(record) not in still_open]
+			self.offers_remaining = len(still_open)
+			self.log_status(f"Verified {len(completed)}/{len(opened)} offers completed.")
+			for record in opened:
+				if offer_key(record) in still_open:
+					self.log_status(f"Offer still open after visiting: {offer_label(record)}", "warn")
+			return len(completed)
+
+		except Exception as e:
+			self.log_status(f"Error during offer collection -> {e}", "warn")
+			return len(opened)
+
+		finally:
+			self.driver.switch_to.window(initial_tab)
+			self.log_status("Finished processing offers.")
+
+	def check_leetcode_login_status(self): # check leetcode login status by looking for the `navbar_user_avatar` id anywhere on the headers
+		"""Checks if the user is logged into Leetcode by looking for the avatar element."""
+		if not self.driver:
+			self.log_status("Driver not available. Cannot check login status.", "warn")
+			return False
+
+		try:
+			avatar = self.find("leetcode.avatar")
+			return avatar is not None
+		except Exception:
+			return False
+
+	def log_browser_state(self, context):
+		"""Logs current URL and title for diagnostics."""
+		if not self.driver:
+			return
+		try:
+			self.log_status(f"{context} | url={self.driver.current_url} | title={self.driver.title}")
+		except Exception as e:
+			logging.debug(f"Could not read browser state: {e}")
+
+	def wait_for_any(self, name, timeout, label, clickable=False, remember=True):
+		"""Races the registered locators of the element and returns it, or None (logged) if none matched."""
+		if not self.driver:
+			return None
+		try:
+			return self.find(name, timeout, clickable, remember)
+		except Exception as e:
+			self.log_status(f"Leetcode step failed: {label}. Last error: {e}", "warn")
+			self.log_browser_state(f"Leetcode failure: {label}")
+			return None
+	
+	def select_python_in_editor(self):
+		"""Selects Python3 as the language in the Leetcode editor."""
+		if not self.driver:
+			self.log_status("Driver not available. Cannot select editor language.", "warn")
+			return
+		try:
+			language_dropdown = self.wait_for_any("leetcode.language_dropdown", self.config["timeout"], "editor language dropdown", clickable=True)
+			if not language_dropdown:
+				self.log_status("Editor language dropdown not found.", "warn")
+				return False
+			
+			current_label = language_dropdown.find_element(By.XPATH, "./..").text.strip().lower()
+			if current_label == "python3" or current_label == "python 3":
+				self.log_status("Editor already set to Python3.")
+				return True
+			
+			# The option lookup below waits for the opened dropdown to become clickable
+			language_dropdown.click()
+
+			python_option = self.wait_for_any("leetcode.python_option", self.config["timeout"], "python3 language select", clickable=True)
+			if python_option:
+				self.log_status("Selecting Python3 in editor language dropdown...")
+				# The dropdown slides open; a click while it moves can land on the wrong option
+				try:
+					wait_for_element_stable(self.driver, python_option, self.config["timeout"])
+				except TimeoutException:
+					self.log_status("Python3 option kept moving; clicking it anyway.", "debug")
+				python_option.click()
+				# Monaco re-renders the editor for the new language; wait until it settles
+				wait_for_dom_quiet(self.driver, self.config["timeout"])
+				self.log_status("Switched editor language to Python3.")
+				return True
+			else:
+				self.log_status("Python3 option not found in editor language dropdown.", "warn")
+				return False
+		except Exception as e:
+			self.log_status(f"Error switching editor language: {e}", "warn")
+			return False
+
+	def find_solution(self, starter_code="") -> Solution | None:
+		"""
+		Returns the best candidate solution for the open problem, or None. Cached solutions
+		are tried first; then the top "solution_candidates" posts are fetched and cached.
+		Candidates are scored against the editor's starter code (see bing_points.scoring) and,
+		with "verify_solutions", run against the problem's examples (see bing_points.verify).
+		A candidate that fails locally is passed over for this run only (the check can be wrong,
+		so only LeetCode's verdict is cached); if every candidate fails, the best-scored one is used.
+		"""
+		slug = slug_from_url(self.driver.current_url)
+		examples = self.load_examples(slug) if self.config.get("verify_solutions") else None
+		failed_locally = set() # Code that failed the local check in this run
+		fallback = None # Best-scored (score, solution, number of candidates) among those
+		for origin in ("cache", "sources"):
+			if origin == "cache":
+				candidates = self.solution_cache.get(slug) if slug else []
+				if candidates:
+					self.log_status(f"Solution cache hit for {slug} ({len(candidates)} cached).")
+			else:
+				limit = int(self.config.get("solution_candidates") or 1)
+				candidates = fetch_solutions(make_solution_sources(self.config, self), slug, limit, self.log_status)
+				if slug and candidates:
+					self.solution_cache.put(slug, candidates)
+					# Drops code LeetCode rejected on an earlier run
+					candidates = self.solution_cache.get(slug)
+			ranked = rank_candidates(candidates, starter_code, lambda message: self.log_status(message, "debug"))
+			if candidates and not ranked:
+				self.log_status(f"None of the {len(candidates)} candidate solution(s) matches the problem.", "warn")
+			for score, solution in ranked:
+				if solution.code in failed_locally:
+					continue
+				if examples and not solution.accepted:
+					with self.metrics.span("leetcode_verify") as span:
+						verdict = verify_solution(solution.code, starter_code, *examples, timeout=self.config.get("verify_timeout") or 5)
+						span.outcome = "ok" if verdict.status == "passed" else verdict.status
+					self.log_status(f"Local check of '{solution.title or solution.source}': {verdict.status} ({verdict.reason}).", "warn" if verdict.failed else "info")
+					if verdict.failed:
+						failed_locally.add(solution.code)
+						if fallback is None or score > fallback[0]:
+							fallback = (score, solution, len(candidates))
+						continue
+				self.log_status(
+					f"Using a solution from {solution.source}"
+					+ (f": {solution.title} ({solution.votes} votes)" if solution.title else "")
+					+ f", score {score}, best of {len(candidates)}"
+					+ (", accepted before." if solution.accepted else ".")
+				)
+				return solution
+		if fallback:
+			score, solution, total = fallback
+			self.log_status(f"Every candidate failed the local check. Submitting the best-scored one from {solution.source} anyway (score {score}, best of {total}).", "warn")
+			return solution
+		return None
+
+	def load_examples(self, slug):
+		"""([Example], any_order, other_answers) of the open problem from the API, or the page's description; None if unreadable."""
+		content = None
+		if slug:
+			try:
+				url = self.endpoints.url("leetcode.graphql")
+				content = LeetCodeGraphQL(url, driver_cookies(self.driver, url), self.config.get("solution_timeout") or 10).question_content(slug)
+			except Exception as e:
+				self.log_status(f"Could not load the problem description from the API: {e}", "debug")
+		if not content:
+			try:
+				content = self.driver.execute_script(
+					"const d = document.querySelector('[data-track-load=\"description_content\"]'); return d ? d.innerHTML : '';"
+				)
+			except Exception as e:
+				self.log_status(f"Could not read the problem description: {e}", "debug")
+		try:
+			examples, any_order, other_answers = parse_examples(content or "")
+		except ValueError as e:
+			self.log_status(f"Could not parse the problem's examples, skipping local checks: {e}", "warn")
+			return None
+		if not examples:
+			self.log_status("No examples found in the problem description, skipping local checks.", "warn")
+			return None
+		if other_answers:
+			self.log_status("The problem accepts other answers than its examples show, skipping local checks.")
+			return None
+		self.log_status(f"Checking candidates against {len(examples)} example(s) before submitting.")
+		return examples, any_order, other_answers
+
+	def read_editor_code(self):
+		"""The code currently in the editor (the starter code before pasting), or "" if it can't be read."""
+		try:
+			return self.driver.execute_script("""
+				if (window.monaco && monaco.editor && monaco.editor.getModels().length) {
+					return monaco.editor.getModels()[0].getValue();
+				}
+				const textarea = document.querySelector('.monaco-editor textarea');
+				return textarea ? textarea.value : '';
+			""") or ""
+		except Exception as e:
+			self.log_status(f"Could not read the editor's starter code: {e}", "debug")
+			return ""
+
+	def get_solution_from_solutions(self):
+		"""Attempts to extract a Python3 solution from the user solutions."""
+		if not self.driver:
+			self.log_status("Driver not available. Cannot get solutions.", "warn")
+			return None
+
+		self.log_status("Attempting to retrieve Python3 solution from solutions...")
+		try:
+			if self.cancel_event.is_set():
+				return None
+			# Navigate to the solutions tab
+			solutions_tab = self.find("leetcode.solutions_tab", clickable=True)
+			solutions_tab.click()
+			
+			# wait for filters to load
+			initial_filter_tab = self.find("leetcode.solution_filters") # a span which contains text "My Solution"
+
+			# Find Python3 filter and click it
+			python_filter = None
+			filters = initial_filter_tab.find_elements(By.XPATH, '../div[1]/span') # filter options
+			for f in filters:
+				text = f.text.strip().lower()
+				if text == "python3" or text == "python":
+					python_filter = f
+					break
+			if python_filter:
+				python_filter.click()
+				self.log_status("Applied Python3 filter to solutions.")
+				self.log_status("Waiting for filtered solutions to load...")
+				# Filtering re-renders the list; wait until it stops changing
+				wait_for_dom_quiet(self.driver, self.config["timeout"])
+			else:
+				available_filters = [f.text.strip() for f in filters]
+				self.log_status(f"Python3 filter not found. Available filters: {available_filters}", "warn")
+
+			# Wait for solution list container to appear
+			flyout_container = self.find("leetcode.solutions_container") # wait for solution flyout to load 
+			
+			self.log_status("Solution flyout container found. Waiting for posts to render...")
+			# //*[@id="23df9cfb-9446-352d-672a-481995819d79"]/div/div/div[1]/div[3]/div[3]/div[1]/div[1]
+			# Poll for rendered posts (bounded by the page timeout) instead of sleeping and retrying
+			try:
+				solution_posts = wait_until(
+					self.driver,
+					lambda d: flyout_container.find_elements(By.XPATH, './div/div/div[1]/div[3]/div[3]/div[1]/div') or False,
+					self.config["timeout"]
+				)
+				self.log_status(f"Found {len(solution_posts)} solution posts.")
+			except Exception as e:
+				self.log_status(f"Could not find any solution posts: {e}", "warn")
+				return None
+			
+			post_count = len(solution_posts)
+			for idx in range(1, post_count): # skip the first one since it's usually premium content
+				if idx > 1:
+					self.metrics.retry() # every post after the first one tried counts as a retry
+				try:
+					# Wait for solution list to appear again in case of stale element after clicking a post
+					flyout_container = self.find("leetcode.solutions_container") # wait for solution flyout to load 
+					fresh_posts = flyout_container.find_elements(By.XPATH, './div/div/div[1]/div[3]/div[3]/div[1]/div')
+					if idx >= len(fresh_posts):
+						break
+					post = fresh_posts[idx]
+					post_title = post.find_element(By.XPATH, './div[1]/div/div[2]/div[2]/div/a')
+					post_title.click()
+					self.log_status("Opened a solution post.")
+
+					# Wait for solution list to appear again in case of stale element after clicking a post
+					flyout_container = self.find("leetcode.solutions_container") # wait for solution flyout to load 
+					
+					solution_flyout = WebDriverWait(flyout_container, self.config["timeout"]).until(
+						EC.presence_of_element_located((By.XPATH, './div[2]'))
+					) # wait for the flyout which contains the solution content to load
+
+					if not solution_flyout:
+						self.log_status("Solution content did not load properly, trying next post if available.", "warn")
+						continue
+					self.log_status("Solution content loaded, looking for code blocks...")
+					# Find for code blocks in the solution content by class if not found continue to next post
+					block_divs = WebDriverWait(solution_flyout, self.config["timeout"], poll_frequency=0.1).until(
+						EC.presence_of_element_located((By.XPATH, './div/div/div/div[2]/div/div[1]/div[2]/div/div/div/div'))
+					) # wait for the post body to render
+
+					if not block_divs:
+						self.log_status("No code blocks found in this solution post, trying next post if available.", "warn")
+						all_solutions_flyout = WebDriverWait(solution_flyout, self.config["timeout"]).until(
+							EC.presence_of_element_located((By.XPATH, './div/div/div/div[1]/div[1]'))
+						) # wait for the flyout which contains all solutions to load
+						all_solutions_flyout.click() # click it to open the sidebar which contains the list of all solutions which usually triggers the content to load properly and show the code blocks, then try finding the code block again
+						wait_for_dom_quiet(self.driver, self.config["timeout"]) # wait for content to load after clicking
+						continue
+					try:
+						all_code_tabs = block_divs.find_elements(By.XPATH, './/div[contains(@class, "TabBarItem_item__jKpNv")]')
+						self.log_status(f"Found {len(all_code_tabs)} code tabs in this solution post, looking for Python tab...")
+						if not all_code_tabs or len(all_code_tabs) == 0:
+							self.log_status("No code tabs found in this solution post, looking for global python solutions", "warn")
+							python_code_block = None
+							python_code_blocks = block_divs.find_elements(By.CLASS_NAME, 'language-python')
+							if python_code_blocks:
+								python_code_block = python_code_blocks[0].text.strip()
+								# Same plausibility check as the tab branch and the API source; scoring does the rest
+								if looks_like_solution(python_code_block):
+									self.log_status("Found a Python code block without tabs, using it as the solution.")
+								else:
+									self.log_status("Python code block found but does not appear to contain a valid solution, trying next post if available.", "warn")
+									continue
+
+						else:
+							for tab in all_code_tabs:
+								python_code_block = None
+								# if python or python3 is in the tab text click it to switch to the python code block
+								tab_text = tab.text.strip().lower()
+								# If tab text doesn't indicate python, continue searching other tabs
+								if "python" in tab_text or "python3" in tab_text:
+									try:
+										tab.click()
+										# wait for code block to switch to python if it's not already
+										WebDriverWait(tab, self.config["timeout"], poll_frequency=0.1).until(
+											EC.presence_of_element_located((By.XPATH, './../../div[2]/div//*[contains(@class, "language-python")]'))
+										)
+									except Exception:
+										pass
+									# try to locate a python code block after selecting the tab
+									try:
+										solution_tab_div = tab.find_element(By.XPATH, './../../div[2]/div') # the div which contains the code block for this tab
+										python_code_block = solution_tab_div.find_element(By.CLASS_NAME, 'language-python').text.strip()
+										if not looks_like_solution(python_code_block):
+											python_code_block = None
+											if tab == all_code_tabs[-1]:
+												self.log_status("No Python solution Tab can be parsed. Skipping Post", "warn")
+											continue
+									except Exception:
+										python_code_block = None
+									if python_code_block:
+										break
+
+						if not python_code_block:
+							self.log_status("No Python code block found in this solution post, trying next post if available.", "warn")
+							continue
+
+						solution_text = python_code_block
+					except Exception as e_code:
+						self.log_status(f"Error extracting code block text: {e_code}", "warn")
+						solution_text = None
+					if solution_text:
+						self.log_status(f"Successfully extracted a Python3 solution from user solutions: {solution_text[:120]}\n.\n.\n.\n{solution_text[-120:]}") # Log the first 120 and last 120 chars of the solution for verification
+					else:
+						return None
+					return solution_text
+
+				except StaleElementReferenceException as e_post:
+					# The next iteration re-waits for the post list
+					self.log_status(f"Solution post stale, retrying... -> {e_post}", "warn")
+					continue
+				except Exception as e_post:
+					self.log_status(f"Solution post skipped!! -> {e_post}", "warn")
+					try:
+						all_solutions_flyout = WebDriverWait(solution_flyout, self.config["timeout"]).until(
+							EC.presence_of_element_located((By.XPATH, './div/div/div/div[1]/div[1]'))
+						) # wait for the flyout which contains all solutions to load
+						all_solutions_flyout.click() # click it to open the sidebar which contains the list of all solutions which usually triggers the content to load properly and show the code blocks, then try finding the code block again
+						wait_for_dom_quiet(self.driver, self.config["timeout"]) # wait for content to load after clicking
+					except Exception:
+						pass
+					continue
+			return None
+
+		except Exception as e_solution:
+			self.log_status(f"Error accessing solutions: {e_solution}", "warn")
+			return None
+		
+	def paste_solution_into_editor(self, solution):
+		# paste the solution into the editor using the string we extracted from the solution post.
+		if not self.driver:
+			self.log_status("Driver not available. Cannot paste solution.", "warn")
+			return False
+		try:
+			editor_flyout = self.wait_for_any("leetcode.editor_textbox", self.config["timeout"], "editor textbox")
+			if not editor_flyout:
+				return False
+			self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", editor_flyout)
+			self.driver.execute_script("arguments[0].click();", editor_flyout)
+
+			# Prefer JS injection for Monaco editor to avoid non-interactable errors.
+			injected = self.driver.execute_script(
+				"""
+				const code = arguments[0];
+				try {
+					if (window.monaco && monaco.editor && monaco.editor.getModels().length) {
+						monaco.editor.getModels()[0].setValue(code);
+						return true;
+					}
+					const editor = document.querySelector('.monaco-editor');
+					const textarea = editor ? editor.querySelector('textarea') : null;
+					if (textarea) {
+						textarea.focus();
+						textarea.value = code;
+						textarea.dispatchEvent(new Event('input', { bubbles: true }));
+						return true;
+					}
+				} catch (e) {}
+				return false;
+				""",
+				solution
+			)
+			if injected:
+				self.log_status("Injected solution into Monaco editor via JS.")
+			else:
+				editor_flyout.send_keys(Keys.CONTROL, 'a')
+				editor_flyout.send_keys(solution)
+				self.log_status("Typed solution into editor.")
+			wait_for_dom_quiet(self.driver, self.config["timeout"]) # let the editor finish re-rendering before submitting
+			return True
+
+		except Exception as e_editor:
+			self.log_status(f"Error pasting solution into editor: {e_editor}", "warn")
+			self.show_info("Leetcode Bot", "Could not paste solution into editor.")
+			return False
+
+	def confirm_submission_result(self):
+		"""Reads the verdict of the submission and logs it. Returns True ("Accepted"), False (any other verdict) or None (no verdict found)."""
+		if not self.driver:
+			self.log_status("Driver not available. Cannot confirm submission result.", "warn")
+			return None
+
+		self.log_status("Checking submission result...")
+		try:
+			results_container = self.find("leetcode.submission_result")
+			# The verdict ("Accepted", "Wrong Answer", "Time Limit Exceeded", ...) is the element's text
+			verdict = wait_until(results_container, lambda element: element.text.strip(), self.config["timeout"])
+		except TimeoutException:
+			self.log_status("Could not find submission result. It may still be processing.", "warn")
+			return None
+		verdict = verdict.splitlines()[0]
+		self.log_status(f"Submission result: {verdict}")
+		if verdict.lower() != "accepted":
+			self.log_status(f"Submission rejected ({verdict})!!!", "warn")
+			self.show_info("Leetcode Bot", f"Submitted solution was rejected ({verdict}). Please submit a correct solution manually on Leetcode.")
+			return False
+		return True
+
+	def run_leetcode_bot(self):
+		"""Leetcode daily question solver. Returns True once the submission is confirmed accepted."""
+		if not self.driver:
+			self.log_status("Driver not available. Cannot run Leetcode bot.", "warn")
+			return
+		self.driver.get(self.endpoints.url("leetcode.problemset"))
+		self.find("leetcode.navbar")
+
+		# check login status first before trying to navigate to the page
+		self.log_status("Checking Leetcode login status...")
+		if not self.check_leetcode_login_status():
+			self.log_status("Not logged into Leetcode. Please log in and try again.", "warn")
+			self.show_info("Leetcode Login Required", "Please log into Leetcode in your Edge browser and run the bot again.")
+			return
+
+		self.log_status("Logged into Leetcode. Navigating to daily question...")
+		try:
+			if self.cancel_event.is_set():
+				return
+			with self.metrics.span("leetcode_navigate") as span:
+				# "Daily Challenge" link in the navbar
+				daily_link_button = self.find("leetcode.daily_link", clickable=True)
+				if not daily_link_button:
+					self.log_status("Daily Challenge link not found. Please try again.", "warn")
+					span.outcome = "failed"
+					return
+				try:
+					href = daily_link_button.get_attribute("href")
+					if href:
+						self.log_status(f"Navigating to: {href}")
+						self.driver.get(href)
+					else:
+						self.log_status("Could not click daily link. Please click it manually.", "warn")
+						# The editor wait below covers the manual navigation
+				except Exception:
+					known_handles = set(self.driver.window_handles)
+					old_url = self.driver.current_url
+					daily_link_button.find_element(By.XPATH, "./..").click() # try clicking the parent element if the link itself is not clickable
+					# The parent either opens a new tab or navigates this one
+					try:
+						wait_until(
+							self.driver,
+							lambda d: len(set(d.window_handles) - known_handles) > 0 or d.current_url != old_url,
+							self.config["timeout"]
+						)
+					except TimeoutException:
+						pass
+					self.driver.switch_to.window(self.driver.window_handles[-1])
+					self.log_status(f"Navigating to: {self.driver.current_url}")
+				finally:
+					editor = self.find("leetcode.editor")
+					if not editor:
+						return
+					self.log_status("Daily question page loaded.")
+
+
+			# switch the editor to python3 (if not already) by clicking the language dropdown and selecting python3
+			with self.metrics.span("leetcode_select_language") as span:
+				selected = self.select_python_in_editor()
+				if not selected:
+					span.outcome = "failed"
+			if not selected:
+				self.log_status("Failed to select Python3 in editor.", "warn")
+				return
+
+			# Community solutions come from the GraphQL API, with the solutions tab scraper as a fallback (see bing_points.solutions)
+			with self.metrics.span("leetcode_find_solution") as span:
+				candidate = self.find_solution(self.read_editor_code())
+				if candidate:
+					span.fields["source"] = candidate.source
+				else:
+					span.outcome = "not_found"
+			solution = candidate.code if candidate else None
+			if not solution:
+				self.log_status("No Python3 solution found. Cannot proceed with solving the problem.", "warn")
+				self.show_info("Leetcode Bot", "Could not find a Python3 solution in the user solutions. Please submit a correct solution manually on Leetcode and try again.")
+				return
+
+			# copy the solution to clipboard and paste it into the editor
+			try:
+				pyperclip.copy(solution)
+				self.log_status("Copied solution to clipboard.")
+			except Exception as e_clipboard:
+				self.log_status(f"Error copying solution to clipboard: {e_clipboard}", "warn")
+				self.show_info("Leetcode Bot", "Could not copy solution to clipboard. Please submit a correct solution manually on Leetcode and try again.")
+				return
+
+			with self.metrics.span("leetcode_paste") as span:
+				pasted = self.paste_solution_into_editor(solution)
+				if not pasted:
+					span.outcome = "failed"
+			if not pasted:
+				self.log_status("Failed to paste solution into editor.", "warn")
+				self.show_info("Leetcode Bot", "Could not paste solution into editor. Please submit a correct solution manually on Leetcode and try again.")
+				return
+
+			# clicking the submit button
+			try:
+				with self.metrics.span("leetcode_submit") as span:
+					# The locators are raced, so stale ones cost nothing. The winner is only remembered once a
+					# verdict shows the click really submitted (a wrong button would otherwise be ranked first for good)
+					submit_button = self.wait_for_any("leetcode.submit", self.config["timeout"], "submit button", clickable=True, remember=False)
+
+					if not submit_button:
+						self.log_status("Submit button not found. Cannot submit solution.", "warn")
+						self.show_info("Leetcode Bot", "Could not click submit button. Please submit a correct solution manually on Leetcode and try again.")
+						span.outcome = "failed"
+						return
+					submit_button.click() # confirm_submission_result waits for the result panel
+			except Exception as e_submit:
+				self.log_status(f"Error clicking submit button: {e_submit}", "warn")
+				self.show_info("Leetcode Bot", "Could not click submit button. Please submit a correct solution manually on Leetcode and try again.")
+				return
+			try:
+				with self.metrics.span("leetcode_confirm") as span:
+					confirmed = self.confirm_submission_result()
+					if not confirmed:
+						span.outcome = "failed"
+				if confirmed is not None:
+					self.confirm_locator("leetcode.submit")
+				slug = slug_from_url(self.driver.current_url)
+				if slug and confirmed is not None:
+					# Later accounts reuse accepted code and never retry rejected code
+					self.solution_cache.mark(slug, solution, confirmed)
+				if confirmed is None:
+					self.log_status("Could not confirm submission result. Please check Leetcode manually.", "warn")
+					self.show_info("Leetcode Bot", "Submitted solution but could not confirm result. Please check Leetcode manually.")
+				elif confirmed:
+					self.log_status("Submission result confirmed successfully.")
+					if self.on_leetcode_done:
+						self.on_leetcode_done()
+					return True
+			except Exception as e_confirm:
+				self.log_status(f"Error confirming submission result: {e_confirm}", "warn")
+				self.show_info("Leetcode Bot", "Submitted solution but an error occurred while confirming result. Please check Leetcode manually.")
+
+		except Exception as e:
+			self.log_status(f"Error during Leetcode bot operation: {e}", "warn")
+			self.show_error("Leetcode Bot Error", f"An error occurred while running the Leetcode bot:\n{e}")
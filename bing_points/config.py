@@ -0,0 +1,155 @@
+import os
+import sys
+import io
+import json
+import logging
+
+# --- Constants ---
+CONFIG_FILE = "config.json"
+LOG_FILE = "bing_points.log"
+# Append-only JSON lines of per-phase timing spans (see bing_points.metrics)
+METRICS_FILE = "bing_points_metrics.jsonl"
+# Append-only JSON lines of tasks each account finished today (see bing_points.ledger)
+LEDGER_FILE = "bing_points_ledger.jsonl"
+# Persistent caches (driver index, ...) live here, relative to the working directory like the config
+CACHE_DIR = "cache"
+# Sent by the browser and by the plain HTTP clients (points API, trends feed, LeetCode API) alike
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) edge/119.0.0.0 Safari/537.36"
+# Task names in run order; each maps to a "do_<task>" config flag
+TASKS = ("searches", "offers", "leetcode")
+
+# --- Default Configuration ---
+DEFAULT_CONFIG = {
+	"profile_path": "",
+	"driver_path": "",
+	"binary_path": "",
+	"headless": True,
+	"num_searches": 10,
+	"timeout": 10,
+	"do_searches": True,
+	"do_offers": False,
+	"do_leetcode": False,
+	# Optional separate Edge profile for Leetcode; lets the Bing phase stay headless while
+	# the visible Leetcode browser starts in parallel
+	"leetcode_profile_path": "",
+	# Trending terms are fetched at most once per this many minutes and shared by every run/account
+	"trends_ttl_minutes": 240,
+	# Tried in order until one returns terms: "rss" (plain HTTP feed) and "selenium" (Trends page scrape)
+	"trends_providers": ["rss", "selenium"],
+	"trends_timeout": 10,
+	# Where Leetcode solutions come from, in order: "graphql" (LeetCode API with the browser's cookies), "dom" (solutions tab scraper)
+	"solution_sources": ["graphql", "dom"],
+	"solution_timeout": 10,
+	# How many community posts are fetched and scored before one is picked
+	"solution_candidates": 5,
+	# Opt-in: run candidates against the problem's examples in a subprocess (seconds per candidate) before submitting.
+	# The subprocess is not isolated: downloaded code runs with your permissions, network and files included
+	"verify_solutions": False,
+	"verify_timeout": 5,
+	# "api" reads points from the rewards JSON API with the browser's cookies (flyout page as fallback); "flyout" skips the API
+	"points_source": "api",
+	# Offers are opened in batches of this many background tabs
+	"offer_tabs": 3,
+	# "serial" opens one tab per search; "pipelined" keeps "search_tabs" searches in flight
+	"search_mode": "serial",
+	"search_tabs": 3,
+	"search_pacing": [1.0, 2.5],
+	# "searchbox" types into the Bing home page; "url" loads bing.com/search?q=... directly
+	"search_strategy": "searchbox",
+	# Selenium page load strategy: "normal", "eager" or "none"
+	"page_load_strategy": "normal",
+	# Record CDP performance logs so network-idle waits see in-flight requests (otherwise resource timing is polled)
+	"cdp_network_logs": False,
+	# Phases ("bing", "leetcode") that block images, media, fonts and trackers; a browser used only by
+	# lean phases also starts without background networking and with the "eager" page load strategy
+	"lean_phases": [],
+	# URLs come from the endpoint registry (bing_points.endpoints). "region" (e.g. "us", "cn"; "" for none)
+	# picks regional mirrors and the Trends geo; "base_urls" replaces a site's root ({"bing": ..., "rewards": ..., "trends": ..., "leetcode": ...});
+	# "endpoints" pins single endpoints to full URLs ({"rewards.flyout": "http://localhost:8080/flyout"})
+	"region": "",
+	"base_urls": {},
+	"endpoints": {},
+	# Resolve all candidate locators of an element with one injected script per poll (WebDriver lookups otherwise)
+	"locator_js_batch": True,
+	# Seconds before a run step is given up on ("driver", "trends", "points", "searches", "offers", "leetcode");
+	# a step without an entry may take as long as it needs
+	"task_timeouts": {"driver": 180, "trends": 60, "points": 90},
+	# Timing spans of every phase are appended here; "" disables metrics
+	"metrics_file": "bing_points_metrics.jsonl",
+	# Tasks finished today are recorded per account here and skipped on the next run; "" disables the ledger
+	"ledger_file": "bing_points_ledger.jsonl",
+	"skip_completed": True,
+	# Multi-account mode: list of profile paths or {"profile_path": ..., "name": ..., <overrides>} dicts
+	"profiles": [],
+	"max_workers": 2,
+	# Keep-warm daemon (python -m bing_points --daemon): local port, idle minutes before a warm
+	# browser is closed, and seconds between health checks of the warm browsers
+	"daemon_port": 8765,
+	"daemon_idle_minutes": 30,
+	"daemon_health_seconds": 30
+}
+
+# --- Logging Setup ---
+def setup_logging(stream=None):
+	"""
+	Sets up file-based logging using UTF-8 for file and a console wrapper that replaces unencodable chars.
+	Console output goes to stdout unless another stream (e.g. sys.stderr for the CLI) is given.
+	"""
+	stream = stream or sys.stdout
+	root_logger = logging.getLogger()
+	root_logger.setLevel(logging.INFO)
+
+	# File handler uses UTF-8
+	fh = logging.FileHandler(LOG_FILE, mode='w', encoding='utf-8')
+	fh.setLevel(logging.INFO)
+	formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+	fh.setFormatter(formatter)
+
+	# Wrap the console stream so any characters that cannot be encoded are replaced
+	try:
+		stream_wrapper = io.TextIOWrapper(stream.buffer, encoding='utf-8', errors='replace', line_buffering=True)
+		sh = logging.StreamHandler(stream_wrapper)
+		sh.setLevel(logging.INFO)
+		sh.setFormatter(formatter)
+	except Exception:
+		# Fallback to default stream handler if wrapping fails
+		sh = logging.StreamHandler(stream)
+		sh.setLevel(logging.INFO)
+		sh.setFormatter(formatter)
+
+	# Clear existing handlers to avoid duplicates in repeated imports/runs
+	if root_logger.handlers:
+		for h in list(root_logger.handlers):
+			root_logger.removeHandler(h)
+
+	root_logger.addHandler(fh)
+	root_logger.addHandler(sh)
+	root_logger.info("Logging initialized.")
+
+# --- Config Persistence ---
+def load_config(path=CONFIG_FILE):
+	"""Loads configuration from JSON, merging with defaults."""
+	logging.info(f"Loading config from {path}")
+	if not os.path.exists(path):
+		logging.warning("Config file not found. Creating with defaults.")
+		with open(path, 'w') as f:
+			json.dump(DEFAULT_CONFIG, f, indent=4)
+		return DEFAULT_CONFIG.copy()
+
+	try:
+		with open(path, 'r') as f:
+			saved_config = json.load(f)
+		# Merge defaults with saved config to ensure all keys exist
+		config = DEFAULT_CONFIG.copy()
+		config.update(saved_config)
+		return config
+	except json.JSONDecodeError:
+		logging.error(f"Failed to decode {path}. Using defaults.")
+		return DEFAULT_CONFIG.copy()
+
+def save_config(config, path=CONFIG_FILE):
+	"""Writes the given settings to the config file. Raises on I/O errors."""
+	logging.info("Saving configuration...")
+	with open(path, 'w') as f:
+		json.dump(config, f, indent=4)
+	logging.info("Configuration saved successfully.")
@@ -0,0 +1,296 @@
+"""
+Keep-warm daemon: a long-lived process that owns one Edge session per profile
+and runs the bot in it on request, so scheduled runs skip the browser cold start.
+
+	python -m bing_points --daemon                 # serve until stopped
+	python -m bing_points --use-daemon [--tasks ...] # submit a run, print its result
+	python -m bing_points --daemon-status | --daemon-stop
+
+The API is one JSON object per line over a TCP socket bound to 127.0.0.1
+("daemon_port"); every request gets one JSON line back:
+	{"cmd": "ping"} / {"cmd": "status"} / {"cmd": "shutdown"}
+	{"cmd": "run", "profile": <name or path>, "tasks": [...], "num_searches": N, "force": false}
+A run may only pick a profile from the daemon's config and override the task
+selection, search count and ledger skipping, so a local client can't make the daemon launch
+arbitrary binaries or profiles. Runs are executed one at a time.
+
+Warm sessions are health-checked every "daemon_health_seconds" (a crashed
+browser is restarted right away) and quit after "daemon_idle_minutes" unused.
+"""
+import os
+import json
+import time
+import socket
+import logging
+import threading
+import socketserver
+
+from .config import TASKS
+from .bot import BingBot
+from .pool import ProfilePool, expand_profiles
+
+DEFAULT_HOST = "127.0.0.1"
+
+def profile_key(profile_path):
+	return os.path.normcase(os.path.abspath(profile_path or ""))
+
+def launch_signature(config, session):
+	"""The settings a browser was started with; a warm session is only reused for a matching launch."""
+	return (
+		bool(session["headless"]),
+		bool(session.get("lean")),
+		config.get("binary_path") or "",
+		config.get("page_load_strategy") or "normal",
+		bool(config.get("cdp_network_logs")),
+	)
+
+def default_session(config):
+	"""The session setup_driver() starts when it isn't given a planned one."""
+	return {"phases": [], "headless": bool(config.get("headless")), "profile_path": config.get("profile_path") or ""}
+
+class WarmSession:
+	"""A running browser kept for one profile."""
+	def __init__(self, driver, signature, session, config):
+		self.driver = driver
+		self.signature = signature
+		self.session = session
+		self.config = config # Used to restart the browser after a crash
+		self.in_use = False
+		self.last_used = time.monotonic()
+		self.runs = 0
+
+class SessionPool:
+	"""
+	Hands warm browsers to BingBot (its `session_pool`) instead of starting new ones.
+	acquire() returns (driver, reused); release() takes the driver back instead of quitting it.
+	"""
+	def __init__(self):
+		self.sessions: dict[str, WarmSession] = {}
+		self._lock = threading.Lock()
+
+	def acquire(self, bot, session=None):
+		session = session or default_session(bot.config)
+		key = profile_key(session["profile_path"])
+		signature = launch_signature(bot.config, session)
+		with self._lock:
+			warm = self.sessions.get(key)
+			if warm and not warm.in_use and warm.signature == signature and self.is_healthy(warm.driver):
+				warm.in_use = True
+			else:
+				stale, warm = warm, None
+				if stale and not stale.in_use:
+					# Edge locks the profile, so a mismatched or dead browser must go first
+					self.sessions.pop(key, None)
+					self.quit(stale.driver)
+		if warm:
+			bot.log_status(f"Reusing warm browser session ({warm.runs} previous run(s)).")
+			self.reset(warm.driver)
+			return warm.driver, True
+		driver = bot.create_driver(session)
+		if driver:
+			warm = WarmSession(driver, signature, session, dict(bot.config))
+			warm.in_use = True
+			with self._lock:
+				self.sessions[key] = warm
+		return driver, False
+
+	def release(self, driver):
+		with self._lock:
+			for warm in self.sessions.values():
+				if warm.driver is driver:
+					warm.in_use = False
+					warm.last_used = time.monotonic()
+					warm.runs += 1
+					return
+		# Not pooled (e.g. the pool was closed meanwhile)
+		self.quit(driver)
+
+	def is_healthy(self, driver):
+		try:
+			return driver.execute_script("return 1") == 1
+		except Exception:
+			return False
+
+	def reset(self, driver):
+		"""Closes leftover tabs and blanks the page so a reused browser starts like a new one."""
+		try:
+			handles = driver.window_handles
+			for handle in handles[1:]:
+				driver.switch_to.window(handle)
+				driver.close()
+			driver.switch_to.window(handles[0])
+			driver.get("about:blank")
+		except Exception as e:
+			logging.debug(f"Could not reset warm browser: {e}")
+
+	def quit(self, driver):
+		try:
+			driver.quit()
+		except Exception as e:
+			logging.debug(f"Error while quitting warm browser: {e}")
+
+	def maintain(self, idle_timeout):
+		"""Quits sessions idle for longer than idle_timeout seconds and restarts crashed ones."""
+		now = time.monotonic()
+		with self._lock:
+			idle = [(key, warm) for key, warm in self.sessions.items() if not warm.in_use]
+		for key, warm in idle:
+			if now - warm.last_used > idle_timeout:
+				logging.info(f"Closing warm browser for {warm.session['profile_path']} after {int(now - warm.last_used)}s idle.")
+			elif self.is_healthy(warm.driver):
+				continue
+			else:
+				logging.warning(f"Warm browser for {warm.session['profile_path']} stopped responding. Restarting it.")
+			with self._lock:
+				if self.sessions.get(key) is not warm or warm.in_use:
+					continue
+				del self.sessions[key]
+			self.quit(warm.driver)
+			if now - warm.last_used <= idle_timeout:
+				self.restart(key, warm)
+
+	def restart(self, key, warm):
+		driver = BingBot(warm.config).create_driver(warm.session)
+		if not driver:
+			logging.warning(f"Could not restart the browser for {warm.session['profile_path']}.")
+			return
+		restarted = WarmSession(driver, warm.signature, warm.session, warm.config)
+		restarted.last_used, restarted.runs = warm.last_used, warm.runs
+		with self._lock:
+			if key in self.sessions:
+				self.quit(driver)
+			else:
+				self.sessions[key] = restarted
+
+	def describe(self):
+		now = time.monotonic()
+		with self._lock:
+			return [{
+				"profile_path": warm.session["profile_path"],
+				"headless": warm.session["headless"],
+				"lean": bool(warm.session.get("lean")),
+				"in_use": warm.in_use,
+				"idle_seconds": round(now - warm.last_used, 1),
+				"runs": warm.runs,
+			} for warm in self.sessions.values()]
+
+	def close(self):
+		with self._lock:
+			sessions, self.sessions = list(self.sessions.values()), {}
+		for warm in sessions:
+			self.quit(warm.driver)
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+	def handle(self):
+		try:
+			request = json.loads(self.rfile.readline() or b"{}")
+			response = self.server.owner.handle_request(request)
+		except Exception as e:
+			response = {"ok": False, "error": str(e)}
+		self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+class BrowserDaemon:
+	"""Serves the socket API and maintains the warm sessions until shutdown()."""
+	def __init__(self, config, host=DEFAULT_HOST, port=None, config_path=None):
+		self.config = config
+		self.config_path = config_path
+		self.idle_timeout = float(config.get("daemon_idle_minutes", 30)) * 60
+		self.health_interval = float(config.get("daemon_health_seconds", 30))
+		self.pool = SessionPool()
+		self.started = time.monotonic()
+		self.runs = 0
+		self._run_lock = threading.Lock()
+		self._stop = threading.Event()
+		self.server = socketserver.ThreadingTCPServer((host, int(port or config.get("daemon_port") or 0)), DaemonHandler)
+		self.server.daemon_threads = True
+		self.server.owner = self
+
+	@property
+	def address(self):
+		return self.server.server_address[:2]
+
+	def handle_request(self, request):
+		cmd = request.get("cmd")
+		if cmd == "ping":
+			return {"ok": True}
+		if cmd == "status":
+			return {
+				"ok": True,
+				"uptime_seconds": round(time.monotonic() - self.started, 1),
+				"runs": self.runs,
+				"busy": self._run_lock.locked(),
+				"sessions": self.pool.describe(),
+			}
+		if cmd == "shutdown":
+			threading.Thread(target=self.shutdown, daemon=True).start()
+			return {"ok": True}
+		if cmd == "run":
+			return {"ok": True, "result": self.run(request)}
+		return {"ok": False, "error": f"Unknown command: {cmd}"}
+
+	def run_config(self, request):
+		"""The daemon's config with the overrides a request is allowed to make."""
+		config = dict(self.config)
+		profile = request.get("profile")
+		if profile:
+			matches = [entry for entry in expand_profiles(self.config) if profile in (entry["name"], entry["profile_path"])]
+			if matches:
+				config = matches[0]
+			elif profile_key(profile) != profile_key(self.config.get("profile_path")):
+				raise ValueError(f"Profile is not configured: {profile}")
+		if request.get("tasks") is not None:
+			unknown = [task for task in request["tasks"] if task not in TASKS]
+			if unknown:
+				raise ValueError(f"Unknown task(s): {', '.join(unknown)}")
+			for task in TASKS:
+				config[f"do_{task}"] = task in request["tasks"]
+		if request.get("num_searches") is not None:
+			config["num_searches"] = int(request["num_searches"])
+		if request.get("force"):
+			config["skip_completed"] = False
+		if profile and config.get("profiles"):
+			config["profiles"] = []
+		return config
+
+	def run(self, request):
+		config = self.run_config(request)
+		with self._run_lock:
+			self.runs += 1
+			if config.get("profiles"):
+				return ProfilePool(config, config_path=self.config_path, session_pool=self.pool).run()
+			return BingBot(config, name=request.get("profile"), config_path=self.config_path, session_pool=self.pool).run()
+
+	def maintain(self):
+		while not self._stop.wait(self.health_interval):
+			if self._run_lock.locked():
+				continue
+			try:
+				self.pool.maintain(self.idle_timeout)
+			except Exception as e:
+				logging.debug(f"Warm session maintenance failed: {e}")
+
+	def serve_forever(self):
+		host, port = self.address
+		logging.info(f"Bing Points daemon listening on {host}:{port} (idle timeout {int(self.idle_timeout)}s).")
+		threading.Thread(target=self.maintain, daemon=True).start()
+		try:
+			self.server.serve_forever()
+		finally:
+			self._stop.set()
+			self.pool.close()
+			self.server.server_close()
+			logging.info("Bing Points daemon stopped.")
+
+	def shutdown(self):
+		self._stop.set()
+		self.server.shutdown()
+
+def send_request(request, port, host=DEFAULT_HOST, timeout=None):
+	"""Sends one request to a running daemon and returns its response. Raises OSError if none is listening."""
+	with socket.create_connection((host, port), timeout=timeout) as conn:
+		conn.sendall((json.dumps(request) + "\n").encode("utf-8"))
+		with conn.makefile("rb") as reader:
+			line = reader.readline()
+	if not line:
+		raise ConnectionError("The daemon closed the connection without a response.")
+	return json.loads(line)
@@ -0,0 +1,169 @@
+"""
+Persistent msedgedriver cache keyed by the installed Edge version.
+
+webdriver-manager resolves the driver version over the network on every call.
+The cache remembers which driver worked for which Edge version, so a run only
+has to read the Edge version from disk to find its driver. webdriver-manager is
+consulted again only when Edge's version changes.
+"""
+import os
+import re
+import sys
+import json
+import shutil
+import logging
+import threading
+import subprocess
+from contextlib import nullcontext
+
+from .config import CACHE_DIR
+
+DRIVER_CACHE_FILE = os.path.join(CACHE_DIR, "drivers.json")
+VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+def default_install():
+	"""Installs the matching driver through webdriver-manager and returns its path."""
+	from webdriver_manager.microsoft import EdgeChromiumDriverManager
+	return EdgeChromiumDriverManager().install()
+
+def default_edge_binary():
+	"""The Edge binary at its default install location (used when "binary_path" is empty), or None."""
+	if sys.platform == "win32":
+		candidates = [
+			os.path.join(os.environ.get(variable) or "", "Microsoft", "Edge", "Application", "msedge.exe")
+			for variable in ("PROGRAMFILES(X86)", "PROGRAMFILES", "LOCALAPPDATA") if os.environ.get(variable)
+		]
+	elif sys.platform == "darwin":
+		candidates = ["/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"]
+	else:
+		candidates = [shutil.which(name) for name in ("microsoft-edge", "microsoft-edge-stable")] + ["/opt/microsoft/msedge/msedge"]
+	return next((path for path in candidates if path and os.path.exists(path)), None)
+
+def detect_edge_version(binary_path):
+	"""
+	Reads the Edge version for the given binary, or None if it can't be determined.
+	Windows installs keep a version-named folder next to msedge.exe, which is read
+	without starting anything; otherwise the binary is asked with --version.
+	"""
+	if not binary_path or not os.path.exists(binary_path):
+		return None
+	try:
+		versions = [name for name in os.listdir(os.path.dirname(binary_path)) if VERSION_RE.fullmatch(name)]
+		if versions:
+			return max(versions, key=lambda v: tuple(int(part) for part in v.split(".")))
+	except OSError:
+		pass
+	try:
+		output = subprocess.run([binary_path, "--version"], capture_output=True, text=True, timeout=10).stdout
+		match = VERSION_RE.search(output)
+		return match.group(0) if match else None
+	except Exception as e:
+		logging.debug(f"Could not read Edge version from {binary_path}: {e}")
+		return None
+
+def major(version):
+	return version.split(".")[0] if version else None
+
+class DriverCache:
+	"""On-disk index of {edge version: driver path} plus the last binary seen and its version."""
+	def __init__(self, path=DRIVER_CACHE_FILE, install=default_install):
+		self.path = path
+		self.install = install
+		self._lock = threading.Lock() # Guards the index file
+		self._install_lock = threading.Lock() # webdriver-manager's own cache is not safe for concurrent installs
+		self._revalidating = None
+
+	def load(self):
+		try:
+			with open(self.path, "r") as f:
+				return json.load(f)
+		except (OSError, json.JSONDecodeError):
+			return {"drivers": {}}
+
+	def save(self, index):
+		os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+		tmp_path = f"{self.path}.tmp"
+		with open(tmp_path, "w") as f:
+			json.dump(index, f, indent=4)
+		os.replace(tmp_path, self.path)
+
+	def edge_version(self, index, binary_path):
+		"""Returns the Edge version, reusing the cached one while the binary is unchanged."""
+		try:
+			stamp = os.path.getmtime(binary_path) if binary_path else None
+		except OSError:
+			stamp = None
+		binary = index.get("binary") or {}
+		if stamp is not None and binary.get("path") == binary_path and binary.get("mtime") == stamp:
+			return binary.get("version")
+		version = detect_edge_version(binary_path)
+		index["binary"] = {"path": binary_path, "mtime": stamp, "version": version}
+		return version
+
+	def record(self, version, driver_path):
+		"""Stores a freshly installed driver for the Edge version (None = unknown version)."""
+		with self._lock:
+			index = self.load()
+			if version:
+				index.setdefault("drivers", {})[version] = driver_path
+			index["last"] = {"version": version, "path": driver_path}
+			self.save(index)
+
+	def _revalidate(self, version):
+		try:
+			with self._install_lock:
+				driver_path = self.install()
+			self.record(version, driver_path)
+			logging.info(f"Driver cache revalidated in background: {driver_path}")
+		except Exception as e:
+			logging.warning(f"Background driver revalidation failed: {e}")
+
+	def revalidate_in_background(self, version):
+		"""Runs webdriver-manager off the critical path, at most once at a time."""
+		if self._revalidating and self._revalidating.is_alive():
+			return
+		self._revalidating = threading.Thread(target=self._revalidate, args=(version,), daemon=True)
+		self._revalidating.start()
+
+	def resolve(self, binary_path, log=logging.info, timer=None):
+		"""
+		Returns a driver path for the Edge binary.
+		Without a binary path, Edge is looked up at its default install location.
+		- Cached driver for this exact Edge version: returned straight from disk.
+		- Edge version unknown: the last driver is returned as-is; with no version
+		  there is no change to revalidate against.
+		- Edge updated within the same major version: the last driver is returned at
+		  once and webdriver-manager refreshes the cache in the background.
+		- New major version or empty cache: webdriver-manager installs synchronously.
+		`timer(phase)` optionally returns a context manager that times the synchronous install.
+		"""
+		binary_path = binary_path or default_edge_binary()
+		with self._lock:
+			index = self.load()
+			version = self.edge_version(index, binary_path)
+			self.save(index)
+		driver_path = (index.get("drivers") or {}).get(version) if version else None
+		if driver_path and os.path.exists(driver_path):
+			log(f"Driver cache hit for Edge {version}: {driver_path}")
+			return driver_path
+
+		last = index.get("last") or {}
+		last_path = last.get("path")
+		if last_path and os.path.exists(last_path) and not version:
+			log(f"Edge version unknown; using cached driver: {last_path}")
+			return last_path
+		if last_path and os.path.exists(last_path) and major(last.get("version")) == major(version):
+			log(f"Edge version changed to {version}; using cached driver and revalidating in background.")
+			self.revalidate_in_background(version)
+			return last_path
+
+		with self._install_lock:
+			# Another worker may have installed it while we waited
+			driver_path = (self.load().get("drivers") or {}).get(version) if version else None
+			if driver_path and os.path.exists(driver_path):
+				return driver_path
+			log(f"Driver cache miss for Edge {version or 'unknown'}. Installing via webdriver-manager...")
+			with (timer or (lambda phase: nullcontext()))("driver_install"):
+				driver_path = self.install()
+		self.record(version, driver_path)
+		return driver_path
@@ -0,0 +1,124 @@
+"""
+Endpoint registry: every URL the bot opens, by logical name, resolved from
+built-in defaults, a region, config.json and environment variables.
+
+An endpoint is a site (whose base URL can be swapped as a whole) plus a path,
+with optional alternate routes tried in order when the primary one fails.
+Resolution order, first match wins:
+	1. BING_POINTS_ENDPOINT_<NAME> env var (name upper-cased, dots as underscores), full URL
+	2. config["endpoints"][name], full URL
+	3. site base: BING_POINTS_BASE_URL_<SITE> env var, config["base_urls"][site],
+	   the region's mirror, then the default in SITES
+The region comes from BING_POINTS_REGION or config["region"]; it picks regional
+mirrors and the Trends "geo". Without a region the Trends page is opened without a
+geo (Google picks the visitor's country) and the RSS feed, which needs one, uses US.
+A pinned endpoint (1 or 2) has no alternate routes. It may use the same {placeholders}
+as the built-in path and must use those the caller fills in ({q} for "bing.search");
+literal braces are written {{ and }}.
+"""
+import os
+import string
+from urllib.parse import quote_plus
+
+SITES = {
+	"bing": "https://www.bing.com",
+	"rewards": "https://rewards.bing.com",
+	"trends": "https://trends.google.com",
+	"leetcode": "https://leetcode.com",
+}
+
+# name: (site, path, alternate paths). Paths are str.format()ed with the url() params, "geo" (the region's
+# country code, US without one) and "geo_query" ("?geo=<region>", empty without a region).
+ENDPOINTS = {
+	"bing.home": ("bing", "/", ()),
+	"bing.search": ("bing", "/search?q={q}&form=QBLH", ()),
+	"rewards.flyout": ("bing", "/rewards/panelflyout", ("/rewardsapp/flyout",)),
+	"rewards.api": ("rewards", "/api/getuserinfo?type=1", ()),
+	"trends.page": ("trends", "/trending{geo_query}", ()),
+	"trends.rss": ("trends", "/trending/rss?geo={geo}", ()),
+	"leetcode.problemset": ("leetcode", "/problemset/", ()),
+	"leetcode.graphql": ("leetcode", "/graphql/", ()),
+}
+
+# Regions whose sites have their own mirrors; any other region code only sets the Trends geo
+REGION_SITES = {
+	"cn": {"bing": "https://cn.bing.com", "leetcode": "https://leetcode.cn"},
+}
+# Country of the Trends feed when no region is configured
+DEFAULT_GEO = "US"
+# Placeholders filled from the region rather than by the caller
+GEO_FIELDS = {"geo", "geo_query"}
+
+def url_fields(template):
+	"""The {placeholder} names of a URL template. Raises ValueError on unbalanced braces."""
+	return {field for _, field, _, _ in string.Formatter().parse(template) if field is not None}
+
+def env_name(prefix, name):
+	return prefix + name.upper().replace(".", "_").replace("-", "_")
+
+class EndpointRegistry:
+	"""Resolves endpoint names to URLs for one config (and environment)."""
+	def __init__(self, config=None, environ=None):
+		self.config = config or {}
+		self.environ = os.environ if environ is None else environ
+		self.region = (self.environ.get("BING_POINTS_REGION") or self.config.get("region") or "").lower()
+
+	def base(self, site):
+		"""The base URL of a site, without a trailing slash."""
+		base = (
+			self.environ.get(env_name("BING_POINTS_BASE_URL_", site))
+			or (self.config.get("base_urls") or {}).get(site)
+			or REGION_SITES.get(self.region, {}).get(site)
+			or SITES[site]
+		)
+		return base.rstrip("/")
+
+	def pinned(self, name):
+		"""
+		A full-URL override of the endpoint from the environment or config, or None.
+		Raises ValueError if its placeholders don't fit the endpoint.
+		"""
+		url = self.environ.get(env_name("BING_POINTS_ENDPOINT_", name)) or (self.config.get("endpoints") or {}).get(name)
+		if not url:
+			return None
+		allowed = url_fields(ENDPOINTS[name][1])
+		try:
+			fields = url_fields(url)
+		except ValueError as e:
+			raise ValueError(f"Pinned URL of {name} is malformed ({e}; write literal braces as {{{{ and }}}}): {url}") from None
+		unknown = fields - allowed
+		if unknown:
+			raise ValueError(
+				f"Pinned URL of {name} has unknown placeholder(s) {', '.join(f'{{{field}}}' for field in sorted(unknown))} "
+				f"(allowed: {', '.join(f'{{{field}}}' for field in sorted(allowed)) or 'none'}): {url}"
+			)
+		missing = allowed - GEO_FIELDS - fields
+		if missing:
+			raise ValueError(f"Pinned URL of {name} lacks {', '.join(f'{{{field}}}' for field in sorted(missing))}: {url}")
+		return url
+
+	def _fields(self, params):
+		"""Format values of a route: the URL-quoted params plus the region's geo."""
+		geo = self.region.upper()
+		return {
+			"geo": geo or DEFAULT_GEO,
+			"geo_query": f"?geo={geo}" if geo else "",
+			**{key: quote_plus(str(value)) for key, value in params.items()},
+		}
+
+	def routes(self, name, **params):
+		"""Every URL to try for the endpoint, primary first. Params (e.g. q=...) are URL-quoted."""
+		fields = self._fields(params)
+		pinned = self.pinned(name)
+		if pinned:
+			return [pinned.format(**fields)]
+		site, path, alternates = ENDPOINTS[name]
+		return [self.base(site) + route.format(**fields) for route in (path, *alternates)]
+
+	def url(self, name, **params):
+		"""The primary URL of the endpoint."""
+		return self.routes(name, **params)[0]
+
+	def describe(self):
+		"""{name: [routes]} for every endpoint, as resolved for this config."""
+		return {name: self.routes(name, q="example") for name in ENDPOINTS}
@@ -0,0 +1,88 @@
+"""
+Bulk DOM extraction: one execute_script call per page returns every record the
+bot needs as a JSON list, instead of one WebDriver round trip per row/attribute.
+The XPaths are the same ones the element-by-element code used.
+"""
+
+TREND_ROWS_XPATH = '//*[@id="trend-table"]/div[1]/table/tbody[2]/tr'
+OFFER_CONTAINERS_XPATH = '//*[@id="bingRewards"]/div/div[@class="flyout_control_halfUnit"]'
+
+TRENDS_JS = """
+const [rowsXPath, limit] = arguments;
+const rows = document.evaluate(rowsXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const terms = [];
+for (let i = 0; i < rows.snapshotLength && terms.length < limit; i++) {
+	const row = rows.snapshotItem(i);
+	const title = document.evaluate('./td[2]/div[1]', row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+	terms.push(((title || row).innerText || '').trim());
+}
+return terms;
+"""
+
+OFFERS_JS = """
+const containers = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+if (!containers.snapshotLength) {
+	return null;
+}
+const parent = containers.snapshotItem(containers.snapshotLength - 1);
+return Array.from(parent.children).filter(div => div.tagName === 'DIV').map((div, index) => {
+	const link = div.querySelector('a');
+	const img = div.querySelector('img');
+	return {
+		index: index,
+		id: div.id || '',
+		aria_label: div.getAttribute('aria-label') || '',
+		class_name: div.getAttribute('class') || '',
+		href: link ? link.href : null,
+		target: link ? (link.getAttribute('target') || '') : '',
+		has_link: !!link,
+		locked: !!img && img.getAttribute('alt') === 'Locked Image',
+		slim_link: !!link && Array.from(link.children).some(child => child.tagName === 'DIV' && (child.getAttribute('class') || '').includes('slim')),
+	};
+});
+"""
+
+OFFER_LINK_JS = """
+const containers = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+if (!containers.snapshotLength) {
+	return null;
+}
+const parent = containers.snapshotItem(containers.snapshotLength - 1);
+const div = Array.from(parent.children).filter(child => child.tagName === 'DIV')[arguments[1]];
+return div ? div.querySelector('a') : null;
+"""
+
+def extract_trends(driver, limit):
+	"""Returns up to `limit` trend titles from the Trends table in one round trip."""
+	terms = driver.execute_script(TRENDS_JS, TREND_ROWS_XPATH, limit) or []
+	return [term for term in terms if term and len(term) < 100]
+
+def extract_offers(driver):
+	"""Returns one record per offer tile in the flyout, or None if the offers container is missing."""
+	return driver.execute_script(OFFERS_JS, OFFER_CONTAINERS_XPATH)
+
+def offer_key(record):
+	"""Identifies an offer tile across reloads of the flyout."""
+	return record["id"] or record["aria_label"].split("-")[0].strip()
+
+def offer_label(record):
+	"""Human readable offer name for logs."""
+	if record["id"] == "exclusive_promo_cont":
+		return "Exclusive Promo"
+	return record["aria_label"].split("-")[0].strip()
+
+def is_claimable(record):
+	"""Applies the offer rules: unlocked, unclaimed exclusive promo, or any uncompleted non-referral offer."""
+	if not record["has_link"]:
+		return False
+	if record["id"] == "exclusive_promo_cont":
+		# Skip locked or already claimed exclusive promo
+		return not record["locked"] and not record["slim_link"]
+	aria_label = record["aria_label"]
+	if aria_label.lower() == "turn referrals into rewards - offer not completed":
+		return False # Skip referral offer
+	return "slim" not in record["class_name"] and "Offer not Completed" in aria_label
+
+def offer_link(driver, record):
+	"""Returns the <a> element of an extracted offer so it can be clicked."""
+	return driver.execute_script(OFFER_LINK_JS, OFFER_CONTAINERS_XPATH, record["index"])
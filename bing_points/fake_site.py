@@ -0,0 +1,319 @@
+"""
+Local stand-in for the pages the bot drives, for offline benchmarks.
+
+Serves minimal replicas of the DOM structures the bot's locators depend on
+(Bing home/search box and results, the rewards flyout with its points and offer
+tiles, the rewards JSON API, the Trends table and RSS feed, and the Leetcode
+problem list, editor, solutions and submission result) from one HTTP server.
+Each site lives under its own prefix so the bot can be pointed at it through
+"base_urls":
+
+	/bing       /bing/search?q=...   /bing/rewards/panelflyout (or /rewardsapp/flyout)   /bing/offer/<id>
+	/rewards/api/getuserinfo
+	/trends/trending   /trends/trending/rss
+	/leetcode/problemset/   /leetcode/problems/<slug>/   POST /leetcode/graphql/
+
+Searches and visited offers are credited so points and offer verification behave
+like the real flyout. "latency" delays every response to emulate network time.
+LeetCode GraphQL queries are answered from recorded responses (leetcode_graphql.json),
+picked by the query's operation name.
+"""
+import os
+import re
+import json
+import time
+import html
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+TREND_TERMS = [f"offline trend {i}" for i in range(1, 31)]
+OFFERS = [
+	("offer_daily_set_1", "Daily poll"),
+	("offer_daily_set_2", "Daily quiz"),
+	("offer_daily_set_3", "This or that"),
+	("offer_more_1", "Explore on Bing"),
+	("offer_more_2", "Word of the day"),
+]
+SEARCH_POINTS = 3
+PC_SEARCH_MAX = 90
+OFFER_POINTS = 10
+SOLUTION = """class Solution:
+    def twoSum(self, nums: List[int], target: int) -> List[int]:
+        seen = {}
+        for i, num in enumerate(nums):
+            if target - num in seen:
+                return [seen[target - num], i]
+            seen[num] = i
+        return []"""
+
+GRAPHQL_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "leetcode_graphql.json")
+OPERATION_RE = re.compile(r"(?:query|mutation)\s+(\w+)")
+
+STARTER = """# Definition for a helper class.
+# class ListNode:
+#     def __init__(self, val=0, next=None):
+class Solution:
+    def twoSum(self, nums: List[int], target: int) -> List[int]:
+        """
+
+DESCRIPTION = """<p>Return indices of the two numbers that add up to <code>target</code>. You can return the answer in any order.</p>
+<pre><strong>Input:</strong> nums = [2,7,11,15], target = 9
+<strong>Output:</strong> [0,1]</pre>
+<pre><strong>Input:</strong> nums = [3,2,4], target = 6
+<strong>Output:</strong> [1,2]</pre>"""
+
+PAGE = "<!DOCTYPE html><html><head><meta charset='utf-8'><title>{title}</title></head><body>{body}</body></html>"
+
+class FakeSiteState:
+	"""Points and offer progress of the fake account; shared by every request."""
+	def __init__(self, points=1000):
+		self.lock = threading.Lock()
+		self.points = points
+		self.pc_search_progress = 0
+		self.completed_offers = set()
+		self.requests = 0
+
+	def credit_search(self):
+		with self.lock:
+			if self.pc_search_progress < PC_SEARCH_MAX:
+				self.pc_search_progress += SEARCH_POINTS
+				self.points += SEARCH_POINTS
+
+	def complete_offer(self, offer_id):
+		with self.lock:
+			if offer_id not in self.completed_offers:
+				self.completed_offers.add(offer_id)
+				self.points += OFFER_POINTS
+
+# --- Pages ---
+def bing_home(prefix):
+	return PAGE.format(title="Bing", body=f"""
+<form action="{prefix}/search" method="get"><input name="q" type="search" /><input type="hidden" name="form" value="QBLH" /></form>
+""")
+
+def bing_results(term):
+	results = "".join(f"<li class='b_algo'><h2><a href='#'>{html.escape(term)} result {i}</a></h2></li>" for i in range(1, 11))
+	return PAGE.format(title=f"{html.escape(term)} - Search", body=f"<ol id='b_results'>{results}</ol>")
+
+def rewards_flyout(prefix, state):
+	tiles = []
+	for offer_id, label in OFFERS:
+		done = offer_id in state.completed_offers
+		status = "Offer Completed" if done else "Offer not Completed"
+		tiles.append(
+			f"<div id='{offer_id}' aria-label='{label} - {status}' class='promo_cont'>"
+			f"<a href='{prefix}/offer/{offer_id}' target=''><div class='content'>{label}</div></a></div>"
+		)
+	# //*[@id="bingRewards"]/div/div[1]/div[1]/div/div[1]/span holds the balance
+	return PAGE.format(title="Rewards", body=f"""
+<div id="bingRewards"><div>
+	<div><div><div><div><span>{state.points:,}</span></div></div></div></div>
+	<div class="flyout_control_halfUnit">{''.join(tiles)}</div>
+</div></div>
+""")
+
+def user_info(state):
+	return {"dashboard": {"userStatus": {
+		"availablePoints": state.points,
+		"counters": {
+			"pcSearch": [{"pointProgress": state.pc_search_progress, "pointProgressMax": PC_SEARCH_MAX}],
+			"mobileSearch": [{"pointProgress": 0, "pointProgressMax": 60}],
+			"dailyPoint": [{"pointProgress": len(state.completed_offers) * OFFER_POINTS, "pointProgressMax": len(OFFERS) * OFFER_POINTS}],
+		},
+	}}}
+
+def trends_page():
+	rows = "".join(f"<tr><td>{i}</td><td><div>{html.escape(term)}</div><div>20K+ searches</div></td></tr>" for i, term in enumerate(TREND_TERMS, 1))
+	# //*[@id="trend-table"]/div[1]/table/tbody[2]/tr
+	return PAGE.format(title="Trends", body=f"""
+<div id="trend-table"><div><table><tbody><tr><th>#</th><th>Trend</th></tr></tbody><tbody>{rows}</tbody></table></div></div>
+""")
+
+def trends_rss():
+	items = "".join(f"<item><title>{html.escape(term)}</title></item>" for term in TREND_TERMS)
+	return f"<?xml version='1.0' encoding='UTF-8'?><rss version='2.0'><channel><title>Trends</title>{items}</channel></rss>"
+
+def leetcode_problemset(prefix):
+	# //*[@id='leetcode-navbar']/div[1]/div/div/div[3]/button/a is the daily question link
+	return PAGE.format(title="Problems - LeetCode", body=f"""
+<nav id="leetcode-navbar"><div><div><div>
+	<div><a href="{prefix}/problemset/">Problems</a></div><div></div>
+	<div><button><a href="{prefix}/problems/two-sum/">Daily Challenge</a></button></div>
+</div></div></div><img id="navbar_user_avatar" alt="avatar" /></nav>
+""")
+
+def leetcode_problem():
+	post = lambda n: (
+		"<div><div><div><div></div><div><div></div><div><div>"
+		f"<a href='#'>Solution post {n}</a></div></div></div></div></div></div>"
+	)
+	escaped = html.escape(SOLUTION)
+	return PAGE.format(title="Two Sum - LeetCode", body=f"""
+<div id="description_tabbar_outer"><div><div>
+	<div>Description</div><div>Editorial</div><div>Submissions</div><div>Notes</div><div>Solutions</div>
+</div></div></div>
+<div id="qd-content"><div>
+	<div></div><div></div><div></div><div></div><div></div>
+	<div>
+		<div><div><div>
+			<div></div><div></div>
+			<div><div></div><div></div><div><div>{post(1)}{post(2)}{post(3)}</div></div></div>
+		</div></div></div>
+		<div><div><div><div>
+			<div><div></div></div>
+			<div><div><div>
+				<div></div>
+				<div><div><div><div><div>
+					<div><div><div class="TabBarItem_item__jKpNv">Python3</div></div>
+					<div><div><pre><code class="language-python">{escaped}</code></pre></div></div></div>
+				</div></div></div></div></div>
+			</div></div></div>
+		</div></div></div></div>
+	</div>
+	<div><span>Python3</span></div>
+	<div><div><span>All</span><span>Python3</span></div><span>My Solution</span></div>
+</div></div>
+<div id="editor">
+	<div><div><div><button>Python3</button></div></div></div>
+	<div><div class="monaco-editor"><div><div><div>
+		<div></div>
+		<div><div><div></div><div></div><div></div><div></div><div><textarea>{html.escape(STARTER)}</textarea></div></div></div>
+	</div></div></div></div></div>
+</div>
+<div id="ide-top-btns"><div><div><div><div></div><div><div><div></div><div><div><div></div><div></div>
+	<div><div></div><div></div><div><div><button data-e2e-locator="console-submit-button" onclick="submitSolution()">Submit</button></div></div></div>
+</div></div></div></div></div></div></div></div>
+<div data-track-load="description_content">{DESCRIPTION}</div>
+<div id="result-panel"></div>
+<script>
+function submitSolution() {{
+	setTimeout(() => {{
+		document.getElementById('result-panel').innerHTML =
+			"<div data-e2e-locator='submission-result'>Accepted</div><div><span>63 / 63 testcases passed</span></div>";
+	}}, 200);
+}}
+</script>
+""")
+
+def graphql_response(body, fixture):
+	"""The recorded response for a GraphQL request body, or a GraphQL error payload."""
+	request = json.loads(body or b"{}")
+	match = OPERATION_RE.search(request.get("query") or "")
+	recorded = fixture.get(match.group(1)) if match else None
+	if recorded and "data" not in recorded:
+		# Recorded per variable value (e.g. per topicId)
+		recorded = recorded.get(str(next(iter((request.get("variables") or {}).values()), "")))
+	return recorded or {"errors": [{"message": f"No recorded response for {match.group(1) if match else 'query'}"}]}
+
+class FakeSiteHandler(BaseHTTPRequestHandler):
+	server_version = "FakeSite/1.0"
+
+	def log_message(self, format, *args):
+		pass # Keep benchmark output clean
+
+	def send_body(self, body, content_type="text/html; charset=utf-8", status=200):
+		data = body.encode("utf-8")
+		self.send_response(status)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(data)))
+		self.send_header("Cache-Control", "no-store")
+		self.end_headers()
+		self.wfile.write(data)
+
+	def do_GET(self):
+		state = self.server.state
+		with state.lock:
+			state.requests += 1
+		if self.server.latency:
+			time.sleep(self.server.latency)
+		url = urlparse(self.path)
+		path = url.path.rstrip("/") or "/"
+		query = parse_qs(url.query)
+
+		if path == "/bing":
+			self.send_body(bing_home("/bing"))
+		elif path == "/bing/search":
+			state.credit_search()
+			self.send_body(bing_results((query.get("q") or [""])[0]))
+		elif path in ("/bing/rewards/panelflyout", "/bing/rewardsapp/flyout"):
+			self.send_body(rewards_flyout("/bing", state))
+		elif path.startswith("/bing/offer/"):
+			state.complete_offer(path.rsplit("/", 1)[-1])
+			self.send_body(PAGE.format(title="Offer", body="<h1>Offer</h1>"))
+		elif path == "/rewards/api/getuserinfo":
+			self.send_body(json.dumps(user_info(state)), "application/json")
+		elif path == "/trends/trending":
+			self.send_body(trends_page())
+		elif path == "/trends/trending/rss":
+			self.send_body(trends_rss(), "application/rss+xml; charset=utf-8")
+		elif path == "/leetcode/problemset":
+			self.send_body(leetcode_problemset("/leetcode"))
+		elif path.startswith("/leetcode/problems/"):
+			self.send_body(leetcode_problem())
+		else:
+			self.send_body(PAGE.format(title="Not found", body="Not found"), status=404)
+
+	def do_POST(self):
+		state = self.server.state
+		with state.lock:
+			state.requests += 1
+		if self.server.latency:
+			time.sleep(self.server.latency)
+		body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+		if urlparse(self.path).path.rstrip("/") == "/leetcode/graphql":
+			self.send_body(json.dumps(graphql_response(body, self.server.graphql)), "application/json")
+		else:
+			self.send_body(PAGE.format(title="Not found", body="Not found"), status=404)
+
+class FakeSite:
+	"""Runs the fake site on a background thread. Use as a context manager or start()/stop()."""
+	def __init__(self, host="127.0.0.1", port=0, latency=0.0):
+		self.server = ThreadingHTTPServer((host, port), FakeSiteHandler)
+		self.server.daemon_threads = True
+		self.server.state = FakeSiteState()
+		self.server.latency = latency
+		with open(GRAPHQL_FIXTURE, "r", encoding="utf-8") as f:
+			self.server.graphql = json.load(f)
+		self._thread = None
+
+	@property
+	def state(self):
+		return self.server.state
+
+	@property
+	def origin(self):
+		host, port = self.server.server_address[:2]
+		return f"http://{host}:{port}"
+
+	def base_urls(self):
+		"""The "base_urls" config value that points the bot at this server."""
+		return {
+			"bing": f"{self.origin}/bing",
+			"rewards": f"{self.origin}/rewards",
+			"trends": f"{self.origin}/trends",
+			"leetcode": f"{self.origin}/leetcode",
+		}
+
+	def config_overrides(self):
+		"""Every config value that needs to change so a run only talks to this server."""
+		return {"base_urls": self.base_urls(), "endpoints": {}}
+
+	def reset(self):
+		"""Starts the next run with a fresh account."""
+		self.server.state = FakeSiteState()
+
+	def start(self):
+		self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+		self._thread.start()
+		return self
+
+	def stop(self):
+		self.server.shutdown()
+		self.server.server_close()
+
+	def __enter__(self):
+		return self.start()
+
+	def __exit__(self, *exc):
+		self.stop()
@@ -0,0 +1,71 @@
+"""
+Daily ledger: which tasks each account already finished today, so a re-run
+skips them instead of searching, reloading offers and re-solving Leetcode again.
+
+One JSON line per finished task (or points read) is appended to the ledger file:
+	{"ts": 1700000000.0, "date": "2024-01-01", "account": "/path/to/profile",
+	 "task": "searches", "status": "done", "searches": 30, "pc_search_progress": 90}
+"date" is the local calendar day; the Rewards day resets overnight, so a new day
+starts with every task open again. Only today's lines are read back.
+"""
+import os
+import json
+import time
+import logging
+import threading
+from datetime import date
+
+from .config import LEDGER_FILE
+
+# Every runner in the process appends to the same file
+_WRITE_LOCK = threading.Lock()
+
+def account_key(profile_path):
+	"""Identifies an account by its Edge profile, independent of how the path was written."""
+	return os.path.normcase(os.path.abspath(profile_path or ""))
+
+class Ledger:
+	"""Today's entries of one ledger file. An empty path disables it (nothing is done, nothing is written)."""
+	def __init__(self, path=LEDGER_FILE):
+		self.path = path
+
+	def today(self, account=None):
+		"""Today's entries, optionally of one account only."""
+		if not self.path:
+			return []
+		today = date.today().isoformat()
+		entries = []
+		try:
+			with open(self.path, "r", encoding="utf-8") as f:
+				for line in f:
+					try:
+						entry = json.loads(line)
+					except json.JSONDecodeError:
+						continue
+					if entry.get("date") == today and (account is None or entry.get("account") == account):
+						entries.append(entry)
+		except OSError:
+			pass
+		return entries
+
+	def done_today(self, account):
+		"""The tasks the account finished today."""
+		return {entry["task"] for entry in self.today(account) if entry.get("status") == "done"}
+
+	def record(self, account, task, status="done", **fields):
+		"""Appends one entry. Failures to write are logged and otherwise ignored."""
+		if not self.path:
+			return
+		entry = {
+			"ts": round(time.time(), 3),
+			"date": date.today().isoformat(),
+			"account": account,
+			"task": task,
+			"status": status,
+			**fields,
+		}
+		try:
+			with _WRITE_LOCK, open(self.path, "a", encoding="utf-8") as f:
+				f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+		except OSError as e:
+			logging.debug(f"Could not write the ledger {self.path}: {e}")
@@ -0,0 +1,91 @@
+"""
+Locator registry: every page element the bot looks up, by logical name, with
+ranked alternative locators loaded from locators.json.
+
+All alternatives of an element are raced in one polling loop (see
+waits.wait_for_any), so a stale locator no longer costs a full timeout before
+the next is tried. The locator that matched last is remembered on disk
+(cache/locators.json) and ranked first next time. A learned locator that is no
+longer in the data file is ignored. Fallbacks should be no broader than the
+primary locator; otherwise a fallback matching the wrong element would be learned.
+"""
+import os
+import json
+import logging
+import threading
+
+from selenium.webdriver.common.by import By
+
+from .config import CACHE_DIR
+
+LOCATORS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locators.json")
+LEARNED_LOCATORS_FILE = os.path.join(CACHE_DIR, "locators.json")
+
+STRATEGIES = {
+	"xpath": By.XPATH,
+	"css": By.CSS_SELECTOR,
+	"id": By.ID,
+	"name": By.NAME,
+	"class": By.CLASS_NAME,
+}
+
+def load_locators(path=LOCATORS_FILE):
+	"""Reads {name: [(By, value), ...]} from the data file. Raises on unknown strategies."""
+	with open(path, "r", encoding="utf-8") as f:
+		data = json.load(f)
+	locators = {}
+	for name, entries in data.items():
+		try:
+			locators[name] = [(STRATEGIES[strategy], value) for strategy, value in entries]
+		except KeyError as e:
+			raise ValueError(f"Unknown locator strategy {e} for '{name}' in {path}") from None
+	return locators
+
+class LocatorRegistry:
+	"""Ranked locators per element plus the on-disk record of which one matched last."""
+	def __init__(self, path=LOCATORS_FILE, learned_path=LEARNED_LOCATORS_FILE):
+		self.path = path
+		self.learned_path = learned_path
+		self._locators = None
+		self._learned = None
+		self._lock = threading.Lock()
+
+	def _load(self):
+		if self._locators is None:
+			self._locators = load_locators(self.path)
+			try:
+				with open(self.learned_path, "r", encoding="utf-8") as f:
+					self._learned = json.load(f)
+			except (OSError, json.JSONDecodeError):
+				self._learned = {}
+
+	def locators(self, name):
+		"""The element's locators, the last winner first and the rest in data-file order."""
+		with self._lock:
+			self._load()
+			if name not in self._locators:
+				raise KeyError(f"No locators registered for '{name}'")
+			ranked = list(self._locators[name])
+			learned = self._learned.get(name)
+			if learned:
+				learned = tuple(learned)
+				if learned in ranked:
+					ranked.remove(learned)
+					ranked.insert(0, learned)
+			return ranked
+
+	def remember(self, name, locator):
+		"""Records the locator that just matched, writing the file only when the winner changed."""
+		with self._lock:
+			self._load()
+			if self._learned.get(name) == list(locator):
+				return
+			self._learned[name] = list(locator)
+			try:
+				os.makedirs(os.path.dirname(self.learned_path) or ".", exist_ok=True)
+				tmp_path = f"{self.learned_path}.tmp"
+				with open(tmp_path, "w", encoding="utf-8") as f:
+					json.dump(self._learned, f, indent=4)
+				os.replace(tmp_path, self.learned_path)
+			except OSError as e:
+				logging.debug(f"Could not save learned locators: {e}")
@@ -0,0 +1,153 @@
+"""
+Run metrics: timing spans for every phase (driver setup, trends fetch, each search,
+each offer, points reads, Leetcode steps) appended as JSON lines to the metrics file,
+and the per-phase p50/p95 summary across runs read back from it.
+
+A span line looks like:
+	{"ts": 1700000000.0, "run_id": "...", "profile": "work", "phase": "search",
+	 "seconds": 1.234, "outcome": "ok", "retries": 0, "term": "..."}
+"""
+import json
+import time
+import uuid
+import logging
+import threading
+from contextlib import contextmanager
+
+from .config import METRICS_FILE
+
+# Every runner in the process appends to the same file
+_WRITE_LOCK = threading.Lock()
+
+class Span:
+	"""One timed phase. The body may set `outcome`, bump `retries` or add fields."""
+	def __init__(self, phase, fields):
+		self.phase = phase
+		self.fields = fields
+		self.outcome = "ok"
+		self.retries = 0
+		self.started = time.monotonic()
+
+class Metrics:
+	"""Records spans for one run. An empty path disables writing (spans are still timed)."""
+	def __init__(self, path=METRICS_FILE, profile=None):
+		self.path = path
+		self.profile = profile
+		self.run_id = None
+		self._local = threading.local() # Per-thread stack of open spans (the pre-warm thread times its own setup)
+		self.new_run()
+
+	def new_run(self):
+		"""Starts a new run id; spans of one run share it."""
+		self.run_id = uuid.uuid4().hex[:12]
+		return self.run_id
+
+	def _stack(self):
+		if not hasattr(self._local, "stack"):
+			self._local.stack = []
+		return self._local.stack
+
+	@property
+	def current(self):
+		"""The innermost open span of the calling thread, or None."""
+		stack = self._stack()
+		return stack[-1] if stack else None
+
+	def retry(self):
+		"""Counts a retry against the innermost open span."""
+		if self.current:
+			self.current.retries += 1
+
+	@contextmanager
+	def span(self, phase, **fields):
+		"""
+		Times the block as `phase`. An exception escaping the block marks the span
+		"error" and is re-raised; other outcomes are set by the block.
+		"""
+		span = Span(phase, fields)
+		stack = self._stack()
+		stack.append(span)
+		try:
+			yield span
+		except Exception as e:
+			span.outcome = "error"
+			span.fields.setdefault("error", str(e))
+			raise
+		finally:
+			stack.remove(span)
+			self.record(phase, time.monotonic() - span.started, span.outcome, span.retries, **span.fields)
+
+	def record(self, phase, seconds, outcome="ok", retries=0, **fields):
+		"""Appends one span line. Failures to write are logged and otherwise ignored."""
+		if not self.path:
+			return
+		entry = {
+			"ts": round(time.time(), 3),
+			"run_id": self.run_id,
+			"profile": self.profile,
+			"phase": phase,
+			"seconds": round(seconds, 4),
+			"outcome": outcome,
+			"retries": retries,
+			**fields,
+		}
+		try:
+			with _WRITE_LOCK, open(self.path, "a", encoding="utf-8") as f:
+				f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+		except OSError as e:
+			logging.debug(f"Could not write metrics to {self.path}: {e}")
+
+def load_spans(path=METRICS_FILE):
+	"""Reads every span from the metrics file, skipping lines that don't parse."""
+	spans = []
+	try:
+		with open(path, "r", encoding="utf-8") as f:
+			for line in f:
+				try:
+					spans.append(json.loads(line))
+				except json.JSONDecodeError:
+					continue
+	except OSError:
+		pass
+	return spans
+
+def percentile(values, pct):
+	"""Linearly interpolated percentile of a non-empty list."""
+	ordered = sorted(values)
+	position = (len(ordered) - 1) * pct / 100
+	lower = int(position)
+	upper = min(lower + 1, len(ordered) - 1)
+	return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def summarize(spans):
+	"""
+	Groups spans by phase and returns {phase: {"count", "errors", "retries", "p50", "p95",
+	"max", "total"}} in seconds, sorted by total time spent (where wall time goes).
+	"""
+	by_phase = {}
+	for span in spans:
+		by_phase.setdefault(span.get("phase", "?"), []).append(span)
+	summary = {}
+	for phase, entries in by_phase.items():
+		seconds = [float(entry.get("seconds") or 0) for entry in entries]
+		summary[phase] = {
+			"count": len(entries),
+			"errors": sum(1 for entry in entries if entry.get("outcome") != "ok"),
+			"retries": sum(int(entry.get("retries") or 0) for entry in entries),
+			"p50": round(percentile(seconds, 50), 3),
+			"p95": round(percentile(seconds, 95), 3),
+			"max": round(max(seconds), 3),
+			"total": round(sum(seconds), 3),
+		}
+	return dict(sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True))
+
+def format_summary(summary, runs=None):
+	"""Renders a summarize() result as a plain-text table."""
+	header = f"{'phase':<26}{'count':>7}{'errors':>8}{'retries':>9}{'p50 s':>9}{'p95 s':>9}{'max s':>9}{'total s':>10}"
+	lines = [f"{runs} run(s)" if runs is not None else "", header, "-" * len(header)]
+	for phase, stats in summary.items():
+		lines.append(
+			f"{phase:<26}{stats['count']:>7}{stats['errors']:>8}{stats['retries']:>9}"
+			f"{stats['p50']:>9.3f}{stats['p95']:>9.3f}{stats['max']:>9.3f}{stats['total']:>10.3f}"
+		)
+	return "\n".join(line for line in lines if line)
@@ -0,0 +1,155 @@
+"""
+Task orchestration for a run: the steps of BingBot.run() (driver setup, trends
+fetch, points reads, searches, offers, Leetcode) as asyncio tasks with
+dependencies, timeouts and cooperative cancellation.
+
+A task starts once every task in `deps` succeeded (it is skipped otherwise) and
+every task in `after` finished in any state. Tasks naming the same `exclusive`
+resource (the browser) never overlap; everything else runs concurrently, so the
+HTTP trends fetch overlaps the browser start and the first points read.
+
+Task bodies are plain blocking functions (Selenium is synchronous) run in worker
+threads, or coroutine functions. Cancellation is cooperative: when the cancel
+event is set, tasks that haven't started are cancelled and running bodies are
+expected to notice the same event. Cancelling the orchestrator itself (Ctrl+C
+under asyncio.run) sets the event too, since asyncio.run waits for the worker
+threads before it re-raises. A body that times out is reported as "timeout"
+right away (its dependents are skipped) and its task's `on_timeout` is called
+to make it stop (e.g. by closing the browser it is blocked on); it keeps its
+exclusive resource until the thread returns, so nothing else drives the browser under it.
+
+Every state change is passed to `on_event` as a dict:
+	{"task": "searches", "state": "started" | "done" | "failed" | "timeout" | "skipped" | "cancelled",
+	 "seconds": 12.3, "error": "..."}
+"""
+import time
+import asyncio
+import logging
+import threading
+
+TASK_STATES = ("pending", "started", "done", "failed", "timeout", "skipped", "cancelled")
+
+class Task:
+	"""One unit of work of a run."""
+	def __init__(self, name, func, deps=(), after=(), timeout=None, exclusive=None, on_timeout=None):
+		self.name = name
+		self.func = func
+		self.deps = tuple(deps)
+		self.after = tuple(after)
+		self.timeout = timeout
+		self.exclusive = exclusive
+		self.on_timeout = on_timeout # Called (in a worker thread) to stop a body that ran out of time
+
+class TaskResult:
+	"""Final state, return value or error, and duration of a task."""
+	def __init__(self):
+		self.state = "pending"
+		self.value = None
+		self.error = None
+		self.seconds = 0.0
+
+	@property
+	def ok(self):
+		return self.state == "done"
+
+class Orchestrator:
+	"""Runs a set of tasks by their dependencies. run() is a coroutine; run_sync() blocks."""
+	def __init__(self, tasks, cancel_event=None, on_event=None, poll_interval=0.2):
+		self.tasks = {task.name: task for task in tasks}
+		for task in tasks:
+			unknown = [name for name in task.deps + task.after if name not in self.tasks]
+			if unknown:
+				raise ValueError(f"Task '{task.name}' depends on unknown task(s): {', '.join(unknown)}")
+		self.cancel_event = cancel_event or threading.Event()
+		self.on_event = on_event
+		self.poll_interval = poll_interval
+		self.results = {name: TaskResult() for name in self.tasks}
+
+	def emit(self, name, state, error=None):
+		result = self.results[name]
+		result.state = state
+		if error is not None:
+			result.error = str(error)
+		if self.on_event:
+			try:
+				self.on_event({"task": name, "state": state, "seconds": round(result.seconds, 3), "error": result.error})
+			except Exception as e:
+				logging.debug(f"Progress listener failed on {name}/{state}: {e}")
+
+	async def _run_task(self, task, finished, locks):
+		result = self.results[task.name]
+		try:
+			for name in task.deps + task.after:
+				await finished[name].wait()
+			failed = [name for name in task.deps if not self.results[name].ok]
+			if failed:
+				self.emit(task.name, "skipped", f"needs {', '.join(failed)}")
+				return
+			lock = locks[task.exclusive] if task.exclusive else None
+			if lock:
+				await lock.acquire()
+			try:
+				if self.cancel_event.is_set():
+					self.emit(task.name, "cancelled")
+					return
+				started = time.monotonic()
+				self.emit(task.name, "started")
+				if asyncio.iscoroutinefunction(task.func):
+					work = asyncio.ensure_future(task.func())
+				else:
+					work = asyncio.ensure_future(asyncio.to_thread(task.func))
+				done, _ = await asyncio.wait({work}, timeout=task.timeout)
+				result.seconds = time.monotonic() - started
+				if not done:
+					self.emit(task.name, "timeout", f"no result after {task.timeout}s")
+					finished[task.name].set() # Dependents stop waiting now...
+					if task.on_timeout:
+						try:
+							await asyncio.to_thread(task.on_timeout)
+						except Exception as e:
+							logging.debug(f"Stopping timed out task {task.name} failed: {e}")
+					try:
+						await work # ...but the resource stays held until the body returns
+					except BaseException:
+						pass
+					return
+				try:
+					result.value = work.result()
+					self.emit(task.name, "done")
+				except Exception as e:
+					logging.debug(f"Task {task.name} failed: {e}")
+					self.emit(task.name, "failed", e)
+			finally:
+				if lock:
+					lock.release()
+		except asyncio.CancelledError:
+			# Bodies running in threads only stop once they see the event
+			self.cancel_event.set()
+			if result.state in ("pending", "started"):
+				self.emit(task.name, "cancelled")
+		finally:
+			finished[task.name].set()
+
+	async def _watch_cancel(self, running):
+		while not all(job.done() for job in running.values()):
+			if self.cancel_event.is_set():
+				for name, job in running.items():
+					# Bodies already running are left to notice the cancel event themselves
+					if self.results[name].state == "pending":
+						job.cancel()
+				return
+			await asyncio.sleep(self.poll_interval)
+
+	async def run(self):
+		"""Runs every task and returns {name: TaskResult}."""
+		finished = {name: asyncio.Event() for name in self.tasks}
+		locks = {task.exclusive: asyncio.Lock() for task in self.tasks.values() if task.exclusive}
+		running = {name: asyncio.ensure_future(self._run_task(task, finished, locks)) for name, task in self.tasks.items()}
+		watcher = asyncio.ensure_future(self._watch_cancel(running))
+		await asyncio.gather(*running.values(), return_exceptions=True)
+		watcher.cancel()
+		return self.results
+
+	def run_sync(self):
+		"""Runs the tasks on a fresh event loop in the calling thread."""
+		return asyncio.run(self.run())
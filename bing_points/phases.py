@@ -0,0 +1,63 @@
+"""
+Plans the browser sessions a run needs before any browser is started.
+
+Bing searches/offers can run headless; the Leetcode bot needs a visible window.
+Edge locks a user data dir to one running browser, so a headless and a visible
+session can only coexist when Leetcode has its own profile ("leetcode_profile_path").
+"""
+import os
+
+BING_PHASE = "bing"
+LEETCODE_PHASE = "leetcode"
+
+def selected_phases(config):
+	"""Returns the phases enabled by the config's do_* flags, in run order."""
+	phases = []
+	if config.get("do_searches") or config.get("do_offers"):
+		phases.append(BING_PHASE)
+	if config.get("do_leetcode"):
+		phases.append(LEETCODE_PHASE)
+	return phases
+
+def same_path(a, b):
+	return os.path.normcase(os.path.abspath(a or "")) == os.path.normcase(os.path.abspath(b or ""))
+
+def plan_sessions(config):
+	"""
+	Returns the browser sessions for the run, in start order, as
+	[{"phases": [...], "headless": bool, "profile_path": str, "lean": bool}, ...].
+	- One session whenever every phase can share a browser; it is visible if Leetcode runs.
+	- Two sessions only when Leetcode uses a different profile: the Bing session keeps the
+	  configured headless mode and the Leetcode session can be started alongside it.
+	A session is launched lean (see bing_points.lean) when all of its phases are in "lean_phases".
+	"""
+	phases = selected_phases(config)
+	if not phases:
+		return []
+	headless = bool(config.get("headless"))
+	profile_path = config.get("profile_path") or ""
+	leetcode_profile_path = config.get("leetcode_profile_path") or profile_path
+
+	if LEETCODE_PHASE not in phases:
+		sessions = [{"phases": phases, "headless": headless, "profile_path": profile_path}]
+	elif BING_PHASE not in phases:
+		sessions = [{"phases": phases, "headless": False, "profile_path": leetcode_profile_path}]
+	elif not same_path(leetcode_profile_path, profile_path):
+		sessions = [
+			{"phases": [BING_PHASE], "headless": headless, "profile_path": profile_path},
+			{"phases": [LEETCODE_PHASE], "headless": False, "profile_path": leetcode_profile_path},
+		]
+	else:
+		sessions = [{"phases": phases, "headless": False, "profile_path": profile_path}]
+
+	lean_phases = set(config.get("lean_phases") or [])
+	for session in sessions:
+		session["lean"] = all(phase in lean_phases for phase in session["phases"])
+	return sessions
+
+def describe_plan(sessions):
+	"""One-line human readable summary of a session plan."""
+	return "; ".join(
+		f"{'+'.join(session['phases'])} ({'headless' if session['headless'] else 'visible'}{', lean' if session.get('lean') else ''})"
+		for session in sessions
+	)
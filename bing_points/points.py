@@ -0,0 +1,105 @@
+"""
+Points client: reads the Rewards balance and daily counters with one HTTP request
+to the rewards JSON API, authenticated with cookies exported from the live
+browser session, instead of rendering the rewards flyout.
+"""
+import json
+import logging
+import urllib.request
+from dataclasses import dataclass, asdict
+from urllib.parse import urlparse
+
+from .config import USER_AGENT
+
+@dataclass
+class PointsStatus:
+	"""Point balance and daily progress. balance None means the points are unknown (never 0 by default)."""
+	balance: int | None = None
+	daily_points: int | None = None
+	pc_search_progress: int | None = None
+	pc_search_max: int | None = None
+	mobile_search_progress: int | None = None
+	mobile_search_max: int | None = None
+	source: str = "unknown"
+
+	@property
+	def known(self):
+		return self.balance is not None
+
+	@property
+	def searches_done(self):
+		"""True once today's PC search points are maxed out (None if unknown)."""
+		if self.pc_search_max is None or self.pc_search_progress is None:
+			return None
+		return self.pc_search_progress >= self.pc_search_max
+
+	def to_dict(self):
+		return asdict(self)
+
+def _counter(counters, name):
+	"""Sums pointProgress/pointProgressMax over a counters entry (a list of promotions)."""
+	entries = counters.get(name) or []
+	if isinstance(entries, dict):
+		entries = [entries]
+	if not entries:
+		return None, None
+	progress = sum(int(entry.get("pointProgress") or 0) for entry in entries)
+	maximum = sum(int(entry.get("pointProgressMax") or 0) for entry in entries)
+	return progress, maximum
+
+def parse_user_info(payload):
+	"""Builds a PointsStatus from the getuserinfo JSON payload. Raises ValueError if it has no balance."""
+	user_status = (payload.get("dashboard") or {}).get("userStatus") or {}
+	if "availablePoints" not in user_status:
+		raise ValueError("Response has no dashboard.userStatus.availablePoints")
+	counters = user_status.get("counters") or {}
+	pc_progress, pc_max = _counter(counters, "pcSearch")
+	mobile_progress, mobile_max = _counter(counters, "mobileSearch")
+	daily_points, _ = _counter(counters, "dailyPoint")
+	return PointsStatus(
+		balance=int(user_status["availablePoints"]),
+		daily_points=daily_points,
+		pc_search_progress=pc_progress,
+		pc_search_max=pc_max,
+		mobile_search_progress=mobile_progress,
+		mobile_search_max=mobile_max,
+		source="api",
+	)
+
+def driver_cookies(driver, url):
+	"""
+	Exports the browser session's cookies that apply to the URL's host.
+	CDP returns cookies for every domain; plain WebDriver only those of the current page.
+	"""
+	host = urlparse(url).hostname or ""
+	try:
+		cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+	except Exception as e:
+		logging.debug(f"CDP cookie export failed, using page cookies: {e}")
+		cookies = driver.get_cookies()
+	matching = []
+	for cookie in cookies:
+		domain = (cookie.get("domain") or host).lstrip(".")
+		if host == domain or host.endswith(f".{domain}"):
+			matching.append(cookie)
+	return matching
+
+class PointsClient:
+	"""Fetches PointsStatus from the rewards API with a browser's cookies."""
+	def __init__(self, url, timeout=10):
+		self.url = url
+		self.timeout = timeout
+
+	def fetch(self, cookies):
+		"""Performs the request. Raises on network, HTTP or payload errors."""
+		cookie_header = "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+		request = urllib.request.Request(self.url, headers={
+			"User-Agent": USER_AGENT,
+			"Accept": "application/json",
+			"Cookie": cookie_header,
+		})
+		with urllib.request.urlopen(request, timeout=self.timeout) as response:
+			return parse_user_info(json.loads(response.read().decode("utf-8")))
+
+	def fetch_from_driver(self, driver):
+		return self.fetch(driver_cookies(driver, self.url))
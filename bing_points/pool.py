@@ -0,0 +1,134 @@
+"""
+Multi-account runner: runs BingBot for every entry of config["profiles"] on a
+bounded pool of worker threads, each owning its own Edge session.
+"""
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .bot import BingBot
+
+def default_names(paths):
+	"""
+	Names each profile dir by the shortest tail of its path no other profile shares, so
+	".../Edge1/User Data/Default" and ".../Edge2/User Data/Default" become "Edge1/User Data/Default"
+	and "Edge2/User Data/Default" while a lone ".../Profile 2" stays "Profile 2".
+	"""
+	parts = [[part for part in os.path.normpath(path).split(os.sep) if part] or [path] for path in paths]
+	names = []
+	for index, own in enumerate(parts):
+		for depth in range(1, len(own) + 1):
+			tail = own[-depth:]
+			if all(other[-depth:] != tail for other_index, other in enumerate(parts) if other_index != index):
+				break
+		names.append("/".join(tail))
+	return names
+
+def expand_profiles(config):
+	"""
+	Builds one config per entry of config["profiles"].
+	An entry is either a profile path or a dict with "profile_path" plus any
+	per-account overrides (e.g. "name", "num_searches", "do_leetcode").
+	Profiles without a "name" get a unique one from their path; duplicate names raise ValueError,
+	as does an Edge profile used by two accounts (counting the Leetcode profile of each).
+	"""
+	profile_configs = []
+	seen_paths = set()
+	for entry in config.get("profiles") or []:
+		if isinstance(entry, str):
+			entry = {"profile_path": entry}
+		profile_config = {key: value for key, value in config.items() if key not in ("profiles", "max_workers")}
+		profile_config.update(entry)
+
+		path = profile_config.get("profile_path") or ""
+		# Edge locks its user data dir, so two sessions can never share one. The Leetcode session
+		# may use its own profile, and a top-level leetcode_profile_path is inherited by every entry.
+		browser_paths = {os.path.normcase(os.path.abspath(path)): path}
+		if profile_config.get("do_leetcode") and profile_config.get("leetcode_profile_path"):
+			leetcode_path = profile_config["leetcode_profile_path"]
+			browser_paths.setdefault(os.path.normcase(os.path.abspath(leetcode_path)), leetcode_path)
+		for normalized, browser_path in browser_paths.items():
+			if normalized in seen_paths:
+				raise ValueError(
+					f"Profile path used by more than one account: {browser_path}"
+					+ (" (give each profile its own leetcode_profile_path)" if browser_path != path else "")
+				)
+			seen_paths.add(normalized)
+
+		profile_configs.append(profile_config)
+
+	unnamed = [profile_config for profile_config in profile_configs if not profile_config.get("name")]
+	for profile_config, name in zip(unnamed, default_names([profile_config.get("profile_path") or "" for profile_config in unnamed])):
+		profile_config["name"] = name
+	# Names prefix log lines and select a profile for the daemon, so they must not be ambiguous
+	seen_names = set()
+	for profile_config in profile_configs:
+		if profile_config["name"] in seen_names:
+			raise ValueError(f"Profile name used more than once: {profile_config['name']}")
+		seen_names.add(profile_config["name"])
+	return profile_configs
+
+class ProfilePool:
+	"""Runs several profiles concurrently and summarises the results."""
+	def __init__(self, config, max_workers=None, cancel_event=None, on_status=None, config_path=None, session_pool=None):
+		self.profile_configs = expand_profiles(config)
+		self.max_workers = max(1, int(max_workers or config.get("max_workers") or 1))
+		self.cancel_event = cancel_event or threading.Event()
+		self.on_status = on_status
+		self.config_path = config_path
+		self.session_pool = session_pool # Warm browsers from the daemon (bing_points.daemon), if any
+		self.bots: list[BingBot] = []
+		self._lock = threading.Lock()
+
+	def run_profile(self, profile_config):
+		"""Worker body: runs one profile and returns its result record."""
+		name = profile_config["name"]
+		if self.cancel_event.is_set():
+			return {"profile": name, "profile_path": profile_config.get("profile_path"), "status": "cancelled"}
+		bot = BingBot(profile_config, cancel_event=self.cancel_event, on_status=self.on_status, name=name, config_path=self.config_path, session_pool=self.session_pool)
+		with self._lock:
+			self.bots.append(bot)
+		try:
+			result = bot.run()
+		except Exception as e:
+			# run() handles its own errors; this only guards against bugs in a worker
+			logging.exception(f"[{name}] Worker crashed: {e}")
+			result = {"status": "error", "error": str(e)}
+		return {"profile": name, "profile_path": profile_config.get("profile_path"), **result}
+
+	def run(self):
+		"""Runs every profile on the worker pool and returns the summary dict."""
+		started = time.monotonic()
+		logging.info(f"Running {len(self.profile_configs)} profile(s) with {self.max_workers} worker(s).")
+		with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="profile") as executor:
+			try:
+				records = list(executor.map(self.run_profile, self.profile_configs))
+			except KeyboardInterrupt:
+				# Stop the workers before the executor waits on them
+				self.cancel()
+				raise
+
+		# Keyed by path, which expand_profiles() keeps unique
+		points_gained = {record["profile_path"]: record.get("points_gained") for record in records}
+		summary = {
+			"status": "ok" if all(record.get("status") == "ok" for record in records) else "failed",
+			"wall_time": round(time.monotonic() - started, 3),
+			"max_workers": self.max_workers,
+			"points_gained": points_gained,
+			"total_points_gained": sum(gained for gained in points_gained.values() if gained),
+			"profiles": records,
+		}
+		for record in records:
+			logging.info(f"[{record['profile']}] status={record.get('status')} points_gained={record.get('points_gained')} duration={record.get('duration')}s")
+		logging.info(f"All profiles finished in {summary['wall_time']}s. Total points gained: {summary['total_points_gained']}")
+		return summary
+
+	def cancel(self):
+		"""Cancels every running profile."""
+		self.cancel_event.set()
+		with self._lock:
+			bots = list(self.bots)
+		for bot in bots:
+			bot.cancel()
@@ -0,0 +1,93 @@
+"""
+Static scoring of candidate Leetcode solutions, so the best of several posts is
+submitted instead of the first one that mentions "class Solution".
+
+A candidate is rejected when it doesn't parse (ast.parse), has no Solution class,
+or misses a method of the editor's starter code. Survivors are ranked by how
+closely their method signatures match the starter code, then by community votes,
+with solutions already accepted on a previous submission first.
+"""
+import re
+import ast
+import math
+import logging
+
+# The starter code has no method bodies, so its signatures are read textually
+STARTER_DEF_RE = re.compile(r"def\s+(\w+)\s*\(([^)]*)\)")
+
+def starter_signatures(starter_code):
+	"""{method name: [parameter names]} of the editor's starter code."""
+	signatures = {}
+	# Starter code often documents helper classes (ListNode, TreeNode) in comments
+	code = "\n".join(line for line in (starter_code or "").splitlines() if not line.lstrip().startswith("#"))
+	for name, params in STARTER_DEF_RE.findall(code):
+		# Split on top-level commas only (Dict[int, str] has one inside), then drop annotations and defaults
+		names = []
+		depth = 0
+		current = ""
+		for char in params + ",":
+			if char in "[(":
+				depth += 1
+			elif char in "])":
+				depth -= 1
+			if char == "," and depth == 0:
+				names.append(current.split(":")[0].split("=")[0].strip().lstrip("*"))
+				current = ""
+			else:
+				current += char
+		signatures[name] = [param for param in names if param]
+	return signatures
+
+def solution_methods(tree):
+	"""{method name: [parameter names]} of the Solution class in a parsed module, or None without one."""
+	for node in ast.walk(tree):
+		if isinstance(node, ast.ClassDef) and node.name == "Solution":
+			return {
+				item.name: [arg.arg for arg in item.args.posonlyargs + item.args.args + [item.args.vararg] + item.args.kwonlyargs if arg]
+				for item in node.body if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+			}
+	return None
+
+def score_candidate(solution, starter_code=""):
+	"""
+	Returns (score, reason). score is None for a rejected candidate; higher is better otherwise.
+	An exact signature match is worth 100, a match on names and arity only 60.
+	"""
+	try:
+		tree = ast.parse(solution.code)
+	except SyntaxError as e:
+		return None, f"does not parse ({e.msg}, line {e.lineno})"
+	methods = solution_methods(tree)
+	if not methods:
+		return None, "no Solution class"
+	score = 0.0
+	expected = starter_signatures(starter_code)
+	for name, params in expected.items():
+		if name not in methods:
+			return None, f"missing method {name}"
+		if methods[name] == params:
+			score += 100
+		elif len(methods[name]) == len(params):
+			score += 60
+		else:
+			return None, f"{name} takes {len(methods[name])} parameters, expected {len(params)}"
+	if not expected:
+		score += 50 # Nothing to compare against; any Solution class will do
+	score += 10 * math.log10(max(solution.votes or 0, 0) + 1)
+	if solution.accepted:
+		score += 1000
+	return round(score, 2), "ok"
+
+def rank_candidates(candidates, starter_code="", log=logging.debug):
+	"""Scores every candidate and returns the accepted ones as [(score, solution)], best first."""
+	ranked = []
+	for index, solution in enumerate(candidates):
+		score, reason = score_candidate(solution, starter_code)
+		label = solution.title or f"{solution.source} #{index + 1}"
+		if score is None:
+			log(f"Rejected candidate '{label}': {reason}.")
+			continue
+		log(f"Candidate '{label}' scored {score} ({solution.votes or 0} votes).")
+		ranked.append((score, index, solution))
+	ranked.sort(key=lambda item: (-item[0], item[1]))
+	return [(score, solution) for score, _, solution in ranked]
@@ -0,0 +1,157 @@
+"""
+On-disk cache of Leetcode solutions, keyed by question slug and language and
+shared by every account and run, so the daily problem is researched once a day
+rather than once per account.
+
+Code is stored content-addressed (cache/solutions/<sha256>.py; identical code
+from different posts or problems is kept once) and indexed in
+cache/solutions/index.json with its source post and verdict:
+	{"two-sum:python3": {"last_used": ..., "solutions": [
+		{"sha256": "...", "source": "graphql", "title": "...", "votes": 1840,
+		 "url": "...", "accepted": true, "stored_at": ...}]}}
+"accepted" is true once a submission of the code was accepted, false once one
+was rejected and null while unverified. Rejected code is never handed out again.
+Problems are evicted least recently used first, past "max_problems" or when
+the stored code exceeds "max_bytes".
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+from .config import CACHE_DIR
+from .solutions import Solution
+
+SOLUTIONS_CACHE_DIR = os.path.join(CACHE_DIR, "solutions")
+
+def code_hash(code):
+	return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+class SolutionCache:
+	"""Solutions per (slug, language), best first: accepted, then unverified by votes."""
+	def __init__(self, path=SOLUTIONS_CACHE_DIR, max_problems=200, max_bytes=5 * 1024 * 1024):
+		self.path = path
+		self.max_problems = max_problems
+		self.max_bytes = max_bytes
+		self._lock = threading.Lock()
+
+	@property
+	def index_path(self):
+		return os.path.join(self.path, "index.json")
+
+	def blob_path(self, digest):
+		return os.path.join(self.path, f"{digest}.py")
+
+	def load(self):
+		try:
+			with open(self.index_path, "r", encoding="utf-8") as f:
+				return json.load(f)
+		except (OSError, json.JSONDecodeError):
+			return {}
+
+	def save(self, index):
+		os.makedirs(self.path, exist_ok=True)
+		tmp_path = f"{self.index_path}.tmp"
+		with open(tmp_path, "w", encoding="utf-8") as f:
+			json.dump(index, f, indent=4, ensure_ascii=False)
+		os.replace(tmp_path, self.index_path)
+
+	def get(self, slug, language="python3"):
+		"""Every usable cached solution of the problem, best first ([] on a miss)."""
+		with self._lock:
+			index = self.load()
+			entry = index.get(f"{slug}:{language}")
+			if not entry:
+				return []
+			solutions = []
+			for record in entry["solutions"]:
+				if record.get("accepted") is False:
+					continue
+				try:
+					with open(self.blob_path(record["sha256"]), "r", encoding="utf-8") as f:
+						code = f.read()
+				except OSError:
+					continue # Evicted or deleted by hand
+				solutions.append(Solution(
+					code, record.get("source") or "cache", record.get("title") or "", record.get("votes"),
+					record.get("url"), record.get("accepted"),
+				))
+			entry["last_used"] = time.time()
+			self._save_quietly(index)
+		return sorted(solutions, key=lambda solution: (solution.accepted is not True, -(solution.votes or 0)))
+
+	def put(self, slug, solutions, language="python3"):
+		"""Adds candidate solutions of the problem. Known code keeps its verdict."""
+		with self._lock:
+			index = self.load()
+			entry = index.setdefault(f"{slug}:{language}", {"solutions": []})
+			known = {record["sha256"] for record in entry["solutions"]}
+			for solution in solutions:
+				digest = code_hash(solution.code)
+				if digest in known:
+					continue
+				known.add(digest)
+				try:
+					self._write_blob(digest, solution.code)
+				except OSError as e:
+					logging.debug(f"Could not cache solution {digest[:12]}: {e}")
+					continue
+				entry["solutions"].append({
+					"sha256": digest,
+					"source": solution.source,
+					"title": solution.title,
+					"votes": solution.votes,
+					"url": solution.url,
+					"accepted": solution.accepted,
+					"stored_at": time.time(),
+				})
+			entry["last_used"] = time.time()
+			self._evict(index)
+			self._save_quietly(index)
+
+	def mark(self, slug, code, accepted, language="python3"):
+		"""Records the verdict of a submission of `code` (adding the code if it isn't cached yet)."""
+		digest = code_hash(code)
+		with self._lock:
+			index = self.load()
+			entry = index.get(f"{slug}:{language}")
+			for record in (entry or {}).get("solutions", []):
+				if record["sha256"] == digest:
+					record["accepted"] = accepted
+					self._save_quietly(index)
+					return
+		self.put(slug, [Solution(code, "submission", accepted=accepted)], language)
+
+	def _write_blob(self, digest, code):
+		path = self.blob_path(digest)
+		if os.path.exists(path):
+			return
+		os.makedirs(self.path, exist_ok=True)
+		tmp_path = f"{path}.tmp"
+		with open(tmp_path, "w", encoding="utf-8") as f:
+			f.write(code)
+		os.replace(tmp_path, path)
+
+	def _evict(self, index):
+		"""Drops least recently used problems past the limits, then code no problem refers to."""
+		def stored_bytes():
+			digests = {record["sha256"] for entry in index.values() for record in entry["solutions"]}
+			return sum(os.path.getsize(self.blob_path(digest)) for digest in digests if os.path.exists(self.blob_path(digest)))
+		by_age = sorted(index, key=lambda key: index[key].get("last_used", 0))
+		while by_age and (len(index) > self.max_problems or (len(index) > 1 and stored_bytes() > self.max_bytes)):
+			del index[by_age.pop(0)]
+		referenced = {record["sha256"] for entry in index.values() for record in entry["solutions"]}
+		try:
+			for name in os.listdir(self.path):
+				if name.endswith(".py") and name[:-3] not in referenced:
+					os.remove(os.path.join(self.path, name))
+		except OSError as e:
+			logging.debug(f"Could not clean up the solution cache: {e}")
+
+	def _save_quietly(self, index):
+		try:
+			self.save(index)
+		except OSError as e:
+			logging.debug(f"Could not save the solution cache index: {e}")
@@ -0,0 +1,248 @@
+"""
+Leetcode solution sources for the daily question.
+
+Sources are tried in the configured order ("solution_sources"): LeetCode's
+GraphQL API over plain HTTP first (the daily question, then the top community
+solutions tagged with the language, then each post's markdown), authenticated
+with the cookies of the live browser session; the Selenium scraper of the
+solutions tab as a fallback. Python code is taken from the posts' fenced code
+blocks, including the "```Python3 []" tab groups LeetCode posts use.
+
+The GraphQL source only needs an HTTP endpoint ("leetcode.graphql"), so it can
+be pointed at the fake site (bing_points.fake_site), which replays recorded
+responses of the three queries.
+"""
+import re
+import json
+import time
+import logging
+import urllib.request
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from urllib.parse import urlparse
+
+from .endpoints import EndpointRegistry
+from .config import USER_AGENT
+from .points import driver_cookies
+
+DAILY_QUESTION_QUERY = """
+query questionOfToday {
+	activeDailyCodingChallengeQuestion {
+		date
+		link
+		question { questionFrontendId title titleSlug }
+	}
+}
+"""
+SOLUTION_LIST_QUERY = """
+query communitySolutions($questionSlug: String!, $skip: Int!, $first: Int!, $orderBy: TopicSortingOption, $languageTags: [String!]) {
+	questionSolutions(filters: {questionSlug: $questionSlug, skip: $skip, first: $first, orderBy: $orderBy, languageTags: $languageTags}) {
+		totalNum
+		solutions { id title post { id voteCount } }
+	}
+}
+"""
+SOLUTION_CONTENT_QUERY = """
+query communitySolution($topicId: Int!) {
+	topic(id: $topicId) { id title post { id voteCount content } }
+}
+"""
+QUESTION_CONTENT_QUERY = """
+query questionContent($titleSlug: String!) {
+	question(titleSlug: $titleSlug) { content }
+}
+"""
+
+PYTHON_LANGUAGES = ("python3", "python", "py")
+# ```lang [tab-name] ... ``` ; the info string may be empty
+CODE_BLOCK_RE = re.compile(r"```[ \t]*([\w+#-]*)[^\n]*\n(.*?)```", re.DOTALL)
+PROBLEM_URL_RE = re.compile(r"/problems/([\w-]+)")
+
+@dataclass
+class Solution:
+	"""A candidate solution: its code, where it came from and (once submitted) whether it was accepted."""
+	code: str
+	source: str
+	title: str = ""
+	votes: int | None = None
+	url: str | None = None
+	accepted: bool | None = None
+
+	def to_dict(self):
+		return asdict(self)
+
+def extract_code_blocks(markdown, languages=PYTHON_LANGUAGES):
+	"""Returns the fenced code blocks of the markdown whose language is one of `languages`, in order."""
+	if "\n" not in markdown and "\\n" in markdown:
+		# Some API responses return the post body with escaped newlines
+		markdown = markdown.replace("\\n", "\n").replace("\\t", "\t")
+	return [
+		code.strip()
+		for language, code in CODE_BLOCK_RE.findall(markdown)
+		if language.lower() in languages and code.strip()
+	]
+
+def looks_like_solution(code):
+	"""Cheap plausibility check: a Solution class with a method that returns something."""
+	lowered = code.lower()
+	return "class solution" in lowered and "def " in lowered and "return" in lowered
+
+def slug_from_url(url):
+	"""The problem slug of a /problems/<slug>/... URL, or None."""
+	match = PROBLEM_URL_RE.search(urlparse(url or "").path)
+	return match.group(1) if match else None
+
+# --- GraphQL ---
+class LeetCodeGraphQL:
+	"""Minimal LeetCode GraphQL client authenticated with exported browser cookies."""
+	def __init__(self, url, cookies=(), timeout=10):
+		self.url = url
+		self.site = url.rstrip("/").rsplit("/graphql", 1)[0] # Pages live next to the API endpoint
+		self.cookies = list(cookies)
+		self.timeout = timeout
+
+	def query(self, query, variables=None, referer=None):
+		"""Posts one query and returns its "data". Raises on network, HTTP or GraphQL errors."""
+		cookie_header = "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in self.cookies)
+		csrf_token = next((cookie["value"] for cookie in self.cookies if cookie["name"] == "csrftoken"), "")
+		origin = "{0.scheme}://{0.netloc}".format(urlparse(self.url))
+		request = urllib.request.Request(
+			self.url,
+			data=json.dumps({"query": query, "variables": variables or {}}).encode("utf-8"),
+			headers={
+				"User-Agent": USER_AGENT,
+				"Content-Type": "application/json",
+				"Accept": "application/json",
+				"Cookie": cookie_header,
+				"x-csrftoken": csrf_token,
+				"Origin": origin,
+				"Referer": referer or f"{self.site}/problemset/",
+			},
+		)
+		with urllib.request.urlopen(request, timeout=self.timeout) as response:
+			payload = json.loads(response.read().decode("utf-8"))
+		if payload.get("errors"):
+			raise ValueError(f"GraphQL error: {payload['errors'][0].get('message', payload['errors'][0])}")
+		return payload.get("data") or {}
+
+	def daily_question_slug(self):
+		data = self.query(DAILY_QUESTION_QUERY)
+		challenge = data.get("activeDailyCodingChallengeQuestion") or {}
+		slug = (challenge.get("question") or {}).get("titleSlug")
+		if not slug:
+			raise ValueError("Response has no daily question slug")
+		return slug
+
+	def solution_posts(self, slug, language_tags=("python3",), first=10):
+		"""The most voted community solutions for the question as [{"id", "title", "votes"}]."""
+		data = self.query(SOLUTION_LIST_QUERY, {
+			"questionSlug": slug,
+			"skip": 0,
+			"first": first,
+			"orderBy": "most_votes",
+			"languageTags": list(language_tags),
+		}, referer=self.problem_url(slug))
+		solutions = (data.get("questionSolutions") or {}).get("solutions") or []
+		return [{
+			"id": int(solution["id"]),
+			"title": solution.get("title") or "",
+			"votes": (solution.get("post") or {}).get("voteCount"),
+		} for solution in solutions if solution.get("id")]
+
+	def post_content(self, topic_id, slug=None):
+		"""The markdown body of a solution post."""
+		data = self.query(SOLUTION_CONTENT_QUERY, {"topicId": int(topic_id)}, referer=self.problem_url(slug) if slug else None)
+		return ((data.get("topic") or {}).get("post") or {}).get("content") or ""
+
+	def question_content(self, slug):
+		"""The problem description as HTML (with its examples)."""
+		data = self.query(QUESTION_CONTENT_QUERY, {"titleSlug": slug}, referer=f"{self.site}/problems/{slug}/")
+		content = (data.get("question") or {}).get("content")
+		if not content:
+			raise ValueError("Response has no question content")
+		return content
+
+	def problem_url(self, slug):
+		return f"{self.site}/problems/{slug}/solutions/"
+
+# --- Sources ---
+class SolutionSource(ABC):
+	"""A source of candidate solutions. fetch() returns up to `limit` Solutions and may raise."""
+	name = "base"
+
+	@abstractmethod
+	def fetch(self, slug, limit):
+		...
+
+class GraphQLSolutionSource(SolutionSource):
+	"""Community solutions through the GraphQL API, with the cookies of the bot's browser session."""
+	name = "graphql"
+
+	def __init__(self, url, driver=None, timeout=10, posts=10):
+		self.url = url
+		self.driver = driver
+		self.timeout = timeout
+		self.posts = posts
+
+	def fetch(self, slug, limit):
+		"""Loads the top posts concurrently and returns a candidate for each of the first `limit` with Python code."""
+		client = LeetCodeGraphQL(self.url, driver_cookies(self.driver, self.url) if self.driver else (), self.timeout)
+		slug = slug or client.daily_question_slug()
+		posts = client.solution_posts(slug, first=max(self.posts, limit))
+		def _candidate(post):
+			try:
+				markdown = client.post_content(post["id"], slug)
+			except Exception as e:
+				logging.debug(f"Could not load solution post {post['id']}: {e}")
+				return None
+			for code in extract_code_blocks(markdown):
+				if looks_like_solution(code):
+					# One candidate per post
+					return Solution(code, self.name, post["title"], post["votes"], f"{client.problem_url(slug)}{post['id']}/")
+			return None
+		with ThreadPoolExecutor(max_workers=min(8, len(posts)) or 1, thread_name_prefix="solution") as executor:
+			candidates = [candidate for candidate in executor.map(_candidate, posts) if candidate]
+		return candidates[:limit]
+
+class DomSolutionSource(SolutionSource):
+	"""Scrapes the solutions tab of the open problem page in the bot's browser."""
+	name = "dom"
+
+	def __init__(self, bot):
+		self.bot = bot
+
+	def fetch(self, slug, limit):
+		code = self.bot.get_solution_from_solutions()
+		return [Solution(code, self.name)] if code else []
+
+def make_solution_sources(config, bot=None):
+	"""Builds the sources named in config["solution_sources"], in order."""
+	sources = []
+	for name in config.get("solution_sources") or ["graphql", "dom"]:
+		if name == "graphql":
+			sources.append(GraphQLSolutionSource(
+				EndpointRegistry(config).url("leetcode.graphql"),
+				bot.driver if bot is not None else None,
+				config.get("solution_timeout") or config.get("timeout") or 10,
+			))
+		elif name == "dom" and bot is not None:
+			sources.append(DomSolutionSource(bot))
+		elif name != "dom":
+			logging.warning(f"Unknown solution source '{name}' ignored.")
+	return sources
+
+def fetch_solutions(sources, slug, limit=1, log=logging.info):
+	"""Returns the candidates of the first source that yields any, or []."""
+	for source in sources:
+		started = time.monotonic()
+		try:
+			candidates = source.fetch(slug, limit)
+		except Exception as e:
+			log(f"Solution source '{source.name}' failed: {e}")
+			continue
+		if candidates:
+			log(f"Solution source '{source.name}' returned {len(candidates)} candidate(s) in {time.monotonic() - started:.2f}s.")
+			return candidates
+		log(f"Solution source '{source.name}' returned no candidates.")
+	return []
@@ -0,0 +1,204 @@
+"""
+Trending-terms providers and the on-disk cache shared across runs and accounts.
+
+Providers are tried in the configured order ("trends_providers"): the RSS feed
+over plain HTTP first, the Selenium scraper of the Trends page as a fallback.
+Trends are fetched at most once per TTL; a failed fetch falls back to the last
+cached terms (however old) and then to a rotating offline corpus, so repeated
+runs don't send the same fallback queries every time.
+"""
+import os
+import json
+import time
+import logging
+import threading
+import urllib.request
+import xml.etree.ElementTree as ET
+from abc import ABC, abstractmethod
+
+from .config import CACHE_DIR, USER_AGENT
+from .endpoints import EndpointRegistry
+
+TRENDS_CACHE_FILE = os.path.join(CACHE_DIR, "trends.json")
+# How many terms a fetch should try to collect, so accounts with different num_searches share one fetch
+TRENDS_FETCH_SIZE = 25
+
+# Offline fallback queries; dict.fromkeys drops accidental duplicates while keeping the order
+FALLBACK_CORPUS = list(dict.fromkeys([
+	"news", "weather", "sports", "technology", "entertainment",
+	"health", "science", "finance", "travel", "food",
+	"music", "movies", "books", "fashion", "gaming",
+	"shopping", "education", "business", "fitness", "politics",
+	"weather tomorrow", "stock market today", "football scores", "cricket live score", "basketball highlights",
+	"new movies this week", "top songs this week", "best tv series", "book recommendations", "podcast recommendations",
+	"healthy breakfast ideas", "easy dinner recipes", "vegetarian recipes", "baking bread at home", "coffee brewing methods",
+	"home workout routine", "yoga for beginners", "running tips", "how to sleep better", "meditation techniques",
+	"budget travel destinations", "cheap flights", "national parks", "best beaches in the world", "travel packing list",
+	"electric cars", "smartphone reviews", "laptop deals", "best headphones", "smart home devices",
+	"artificial intelligence news", "space exploration", "mars rover", "climate change", "renewable energy",
+	"history of the internet", "ancient egypt", "world war 2 facts", "famous inventors", "roman empire",
+	"learn a new language", "online courses", "how to code", "python tutorial", "math puzzles",
+	"gardening tips", "indoor plants", "diy home projects", "interior design ideas", "minimalist living",
+	"personal finance tips", "how to save money", "cryptocurrency news", "real estate market", "credit score",
+	"job interview tips", "resume templates", "remote work tools", "productivity apps", "time management",
+	"video game releases", "board games", "chess openings", "puzzle games", "esports tournaments",
+	"dog training tips", "cat breeds", "bird watching", "aquarium fish", "wildlife photography",
+	"photography tips", "drawing for beginners", "guitar chords", "piano lessons", "film festivals",
+	"local events this weekend", "concerts near me", "museum exhibitions", "theatre shows", "food festivals",
+	"ocean facts", "volcano eruptions", "northern lights", "meteor shower", "solar eclipse",
+	"car maintenance tips", "bike repair", "hiking trails", "camping gear", "fishing tips",
+	"world cup", "olympics", "tennis grand slam", "formula 1 results", "marathon training",
+	"fun facts", "riddles", "trivia questions", "word of the day", "quotes of the day",
+]))
+
+# --- Providers ---
+class TrendsProvider(ABC):
+	"""A source of trending search terms. fetch() returns up to `limit` terms and may raise."""
+	name = "base"
+
+	@abstractmethod
+	def fetch(self, limit):
+		...
+
+def parse_rss_titles(xml_bytes, limit):
+	"""Returns the <item><title> texts of an RSS document."""
+	root = ET.fromstring(xml_bytes)
+	titles = []
+	for item in root.iter("item"):
+		title = (item.findtext("title") or "").strip()
+		if title and len(title) < 100:
+			titles.append(title)
+		if len(titles) >= limit:
+			break
+	return titles
+
+class RssTrendsProvider(TrendsProvider):
+	"""Reads the Google Trends RSS feed with urllib; no browser involved. Routes are tried in order."""
+	name = "rss"
+
+	def __init__(self, urls=None, timeout=10):
+		self.urls = [urls] if isinstance(urls, str) else list(urls or EndpointRegistry().routes("trends.rss"))
+		self.timeout = timeout
+
+	def fetch(self, limit):
+		last_error = None
+		for url in self.urls:
+			request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+			try:
+				with urllib.request.urlopen(request, timeout=self.timeout) as response:
+					return parse_rss_titles(response.read(), limit)
+			except Exception as e:
+				logging.debug(f"Trends RSS route {url} failed: {e}")
+				last_error = e
+		raise last_error
+
+class SeleniumTrendsProvider(TrendsProvider):
+	"""Scrapes the Trends page in the bot's browser session."""
+	name = "selenium"
+
+	def __init__(self, bot):
+		self.bot = bot
+
+	def fetch(self, limit):
+		return self.bot.scrape_trending_searches(limit)
+
+def make_providers(config, bot=None):
+	"""Builds the providers named in config["trends_providers"], in order."""
+	providers = []
+	for name in config.get("trends_providers") or ["rss"]:
+		if name == "rss":
+			providers.append(RssTrendsProvider(
+				EndpointRegistry(config).routes("trends.rss"),
+				config.get("trends_timeout") or config.get("timeout") or 10,
+			))
+		elif name == "selenium" and bot is not None:
+			providers.append(SeleniumTrendsProvider(bot))
+		elif name != "selenium":
+			logging.warning(f"Unknown trends provider '{name}' ignored.")
+	return providers
+
+def fetch_trends(providers, limit, log=logging.info):
+	"""Returns the terms of the first provider that yields any, or []."""
+	for provider in providers:
+		started = time.monotonic()
+		try:
+			terms = provider.fetch(limit)
+		except Exception as e:
+			log(f"Trends provider '{provider.name}' failed: {e}")
+			continue
+		if terms:
+			log(f"Trends provider '{provider.name}' returned {len(terms)} terms in {time.monotonic() - started:.2f}s.")
+			return terms
+		log(f"Trends provider '{provider.name}' returned no terms.")
+	return []
+
+# --- Cache ---
+class TrendsCache:
+	"""Trending terms persisted with their fetch time, plus the fallback corpus rotation offset."""
+	def __init__(self, path=TRENDS_CACHE_FILE):
+		self.path = path
+		self._lock = threading.Lock()
+
+	def load(self):
+		try:
+			with open(self.path, "r", encoding="utf-8") as f:
+				return json.load(f)
+		except (OSError, json.JSONDecodeError):
+			return {}
+
+	def save(self, data):
+		os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+		tmp_path = f"{self.path}.tmp"
+		with open(tmp_path, "w", encoding="utf-8") as f:
+			json.dump(data, f, indent=4, ensure_ascii=False)
+		os.replace(tmp_path, self.path)
+
+	def fallback_terms(self, data, count):
+		"""Takes the next `count` corpus terms after the persisted offset and advances it."""
+		offset = data.get("fallback_offset", 0) % len(FALLBACK_CORPUS)
+		terms = [FALLBACK_CORPUS[(offset + i) % len(FALLBACK_CORPUS)] for i in range(min(count, len(FALLBACK_CORPUS)))]
+		data["fallback_offset"] = (offset + len(terms)) % len(FALLBACK_CORPUS)
+		return terms
+
+	def get(self, fetch, count, ttl_seconds, log=logging.info, fallback=True):
+		"""
+		Returns `count` search terms. Fresh cached terms are returned as-is; otherwise
+		`fetch()` is called (once, even with concurrent callers) and its result cached.
+		Terms missing to reach `count` are filled from the rotating fallback corpus.
+		Without `fallback` only fresh terms are returned, and [] if there are none, so
+		the caller can still try another fetch before settling for stale or corpus terms.
+		"""
+		with self._lock:
+			data = self.load()
+			terms = data.get("terms") or []
+			age = time.time() - data.get("fetched_at", 0)
+			if terms and age < ttl_seconds:
+				log(f"Trends cache hit ({len(terms)} terms, age {int(age)}s).")
+			else:
+				log(f"Trends cache miss ({'empty' if not terms else f'stale, age {int(age)}s'}). Fetching trends...")
+				try:
+					fetched = list(dict.fromkeys(fetch() or []))
+				except Exception as e:
+					log(f"Trend fetch failed: {e}")
+					fetched = []
+				if fetched:
+					terms = fetched
+					data["terms"] = terms
+					data["fetched_at"] = time.time()
+				elif not fallback:
+					return []
+				elif terms:
+					log(f"Using stale cached trends (age {int(age)}s).")
+
+			result = terms[:count]
+			if len(result) < count:
+				log(f"Filling {count - len(result)} search(es) from the fallback corpus.")
+				result += [term for term in self.fallback_terms(data, count) if term not in result][:count - len(result)]
+			self._save_quietly(data)
+			return result
+
+	def _save_quietly(self, data):
+		try:
+			self.save(data)
+		except OSError as e:
+			logging.debug(f"Could not save the trends cache: {e}")
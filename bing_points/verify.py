@@ -0,0 +1,158 @@
+"""
+Local pre-submission check of Leetcode candidates against the problem's examples.
+
+The examples ("Input: nums = [2,7,11,15], target = 9 / Output: [0,1]") are read
+from the problem description, either the HTML "content" from the GraphQL API or
+the description text of the open page. Each candidate runs in a separate Python
+process ("python -I", empty working directory, minimal environment, CPU and
+memory limits where the platform has them) with a wall-clock limit, and its
+results are compared with the expected outputs. This keeps obviously wrong
+code from burning a submission; it is not a security boundary: the candidate
+can still read the user's files and use the network. That is why the check is
+off unless "verify_solutions" is set.
+
+Problems the harness can't express (linked lists, trees, design classes,
+non-JSON values) or whose examples are one of several valid answers ("\"aba\"
+is also a valid answer") are "unverifiable" and are left to LeetCode.
+"""
+import os
+import re
+import sys
+import json
+import html
+import tempfile
+import subprocess
+from dataclasses import dataclass
+
+from .scoring import starter_signatures
+
+EXAMPLE_RE = re.compile(r"Input:?\s*(.+?)\s*Output:?\s*(.+?)\s*(?:\n|Explanation:|$)", re.DOTALL)
+ASSIGNMENT_SPLIT_RE = re.compile(r"(?:^|,\s*)([A-Za-z_]\w*)\s*=\s*")
+UNSUPPORTED_TYPES = ("ListNode", "TreeNode", "Node")
+# Descriptions accepting answers other than the example outputs; exact comparison would reject correct code
+OTHER_ANSWERS_RE = re.compile(
+	r"also (?:a |an )?(?:valid|correct|accepted)|(?:return|output|print) any (?:of them|one of them|valid|such)"
+	r"|multiple (?:valid |possible |correct )?(?:answers|solutions)|more than one (?:valid |possible )?answer"
+	r"|any (?:valid |correct )?(?:answer|solution) (?:is|will be) accepted|other (?:valid |correct )?answers",
+	re.IGNORECASE,
+)
+
+# Runs in the child process: reads {"code", "method", "cases", "in_place"} on stdin, prints one JSON result per case.
+# Limits are set here rather than with preexec_fn, which can deadlock when the parent has other threads.
+HARNESS = r"""
+try:
+	import resource
+	resource.setrlimit(resource.RLIMIT_CPU, (10, 10))
+	resource.setrlimit(resource.RLIMIT_AS, (1024 * 1024 * 1024, 1024 * 1024 * 1024))
+except (ImportError, ValueError, OSError):
+	pass # No rlimits on this platform
+import io, sys, json
+from typing import *
+import collections, heapq, math, bisect, itertools, functools, string, re, operator
+from collections import *
+from heapq import *
+from functools import lru_cache, cache, reduce
+from itertools import *
+from math import inf
+request = json.load(sys.stdin)
+results = sys.stdout
+sys.stdout = io.StringIO() # Debug prints of the candidate must not mix with the results
+namespace = dict(globals())
+exec(request["code"], namespace)
+for args in request["cases"]:
+	try:
+		result = getattr(namespace["Solution"](), request["method"])(*args)
+		results.write(json.dumps({"ok": True, "result": args[0] if request["in_place"] else result}) + "\n")
+	except Exception as e:
+		results.write(json.dumps({"ok": False, "error": f"{type(e).__name__}: {e}"}) + "\n")
+	results.flush()
+"""
+
+@dataclass
+class Example:
+	args: list
+	expected: object
+
+@dataclass
+class Verdict:
+	"""Outcome of a local check: "passed", "failed" or "unverifiable", with a reason."""
+	status: str
+	reason: str = ""
+
+	@property
+	def failed(self):
+		return self.status == "failed"
+
+def description_text(content):
+	"""Plain text of a problem description given as HTML (API) or text (page)."""
+	text = re.sub(r"<br\s*/?>|</(p|pre|li|div)>", "\n", content or "", flags=re.IGNORECASE)
+	return html.unescape(re.sub(r"<[^>]+>", "", text)).replace("\xa0", " ")
+
+def parse_value(text):
+	return json.loads(text.strip().rstrip(","))
+
+def parse_examples(content):
+	"""
+	Returns ([Example], any_order, other_answers) from a problem description; other_answers is True when the
+	description accepts answers besides the example outputs. Raises ValueError if an example can't be read.
+	"""
+	text = description_text(content)
+	examples = []
+	for inputs, output in EXAMPLE_RE.findall(text):
+		parts = ASSIGNMENT_SPLIT_RE.split(inputs.strip())
+		if len(parts) < 3 or parts[0].strip():
+			raise ValueError(f"Unreadable example input: {inputs!r}")
+		try:
+			args = [parse_value(value) for value in parts[2::2]]
+			expected = parse_value(output)
+		except json.JSONDecodeError as e:
+			raise ValueError(f"Example value is not JSON ({e}): {inputs!r} -> {output!r}")
+		examples.append(Example(args, expected))
+	return examples, "any order" in text.lower(), bool(OTHER_ANSWERS_RE.search(text))
+
+def normalise(value, any_order):
+	if isinstance(value, float):
+		return round(value, 5)
+	if isinstance(value, list):
+		items = [normalise(item, any_order) for item in value]
+		return sorted(items, key=json.dumps) if any_order else items
+	return value
+
+def verify_solution(code, starter_code, examples, any_order=False, other_answers=False, timeout=5):
+	"""Runs the candidate on every example in a subprocess and returns a Verdict."""
+	if not examples:
+		return Verdict("unverifiable", "no examples")
+	if other_answers:
+		return Verdict("unverifiable", "the problem accepts other answers than the examples show")
+	signatures = starter_signatures(starter_code)
+	if "class Solution" not in (starter_code or "") or len(signatures) != 1:
+		return Verdict("unverifiable", "not a single-method Solution class (design problem?)")
+	# Helper classes are documented in comments; only the signature itself matters
+	code_lines = "\n".join(line for line in starter_code.splitlines() if not line.lstrip().startswith("#"))
+	if re.search(rf"\b({'|'.join(UNSUPPORTED_TYPES)})\b", code_lines):
+		return Verdict("unverifiable", "linked list or tree arguments")
+	(method, params), = signatures.items()
+	if any(len(example.args) != len(params) - 1 for example in examples):
+		return Verdict("unverifiable", "examples don't match the method's parameters")
+	in_place = bool(re.search(rf"def\s+{method}\s*\([^)]*\)\s*->\s*None", starter_code))
+	request = {"code": code, "method": method, "cases": [example.args for example in examples], "in_place": in_place}
+	with tempfile.TemporaryDirectory(prefix="bing_points_verify_") as work_dir:
+		try:
+			completed = subprocess.run(
+				[sys.executable, "-I", "-c", HARNESS],
+				input=json.dumps(request), capture_output=True, text=True, timeout=timeout, cwd=work_dir,
+				env={"PATH": os.environ.get("PATH", ""), "SYSTEMROOT": os.environ.get("SYSTEMROOT", "")},
+			)
+		except subprocess.TimeoutExpired:
+			return Verdict("failed", f"timed out after {timeout}s")
+	lines = completed.stdout.splitlines()
+	if len(lines) < len(examples):
+		error = completed.stderr.strip().splitlines()[-1:] or ["no output"]
+		return Verdict("failed", f"crashed: {error[0]}")
+	for number, (example, line) in enumerate(zip(examples, lines), 1):
+		outcome = json.loads(line)
+		if not outcome["ok"]:
+			return Verdict("failed", f"example {number} raised {outcome['error']}")
+		if normalise(outcome["result"], any_order) != normalise(example.expected, any_order):
+			return Verdict("failed", f"example {number} returned {json.dumps(outcome['result'])}, expected {json.dumps(example.expected)}")
+	return Verdict("passed", f"{len(examples)} example(s)")
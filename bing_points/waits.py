@@ -0,0 +1,199 @@
+"""
+Condition-based waits used instead of fixed time.sleep calls.
+
+Every wait is bounded by a timeout and returns as soon as the page is actually
+ready. Waits that merely smooth over rendering (DOM quiet, network idle) return
+False on timeout instead of raising, since the caller can usually carry on.
+"""
+import json
+import time
+import logging
+from typing import NamedTuple
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, JavascriptException
+
+POLL_FREQUENCY = 0.1
+
+# Records the time of the last DOM mutation on the page (installed once per document)
+DOM_QUIET_JS = """
+const quietMs = arguments[0];
+if (!window.__bingPointsObserver) {
+	window.__bingPointsLastMutation = performance.now();
+	window.__bingPointsObserver = new MutationObserver(() => { window.__bingPointsLastMutation = performance.now(); });
+	window.__bingPointsObserver.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+	return false;
+}
+return performance.now() - window.__bingPointsLastMutation >= quietMs;
+"""
+
+# Resolves [strategy, value] locators (Selenium By values) in order; returns [index, element] of the first match
+RACE_JS = """
+const [locators, clickable] = arguments;
+const usable = el => !clickable || (el.getClientRects().length > 0 && !el.disabled);
+const lookup = (by, value) => {
+	switch (by) {
+		case 'xpath': {
+			const r = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+			return Array.from({length: r.snapshotLength}, (_, i) => r.snapshotItem(i));
+		}
+		case 'css selector': return Array.from(document.querySelectorAll(value));
+		case 'id': return Array.from(document.querySelectorAll('#' + CSS.escape(value)));
+		case 'name': return Array.from(document.getElementsByName(value));
+		case 'class name': return Array.from(document.getElementsByClassName(value));
+		case 'tag name': return Array.from(document.getElementsByTagName(value));
+		case 'link text': return Array.from(document.links).filter(a => a.innerText.trim() === value);
+	}
+	return [];
+};
+for (let i = 0; i < locators.length; i++) {
+	let found = [];
+	try { found = lookup(locators[i][0], locators[i][1]); } catch (e) {}
+	const hit = found.find(usable);
+	if (hit) return [i, hit];
+}
+return null;
+"""
+
+# Fallback network-idle check: no new resource timing entries and nothing still loading
+RESOURCE_COUNT_JS = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+def wait_until(driver, condition, timeout, poll_frequency=POLL_FREQUENCY, message=""):
+	"""WebDriverWait with a fast poll; raises TimeoutException like WebDriverWait does."""
+	return WebDriverWait(driver, timeout, poll_frequency=poll_frequency,
+						ignored_exceptions=(StaleElementReferenceException,)).until(condition, message)
+
+class LocatorHit(NamedTuple):
+	"""Result of wait_for_any: the element, the locator that found it, its rank and the wait time."""
+	element: object
+	locator: tuple
+	index: int
+	elapsed: float
+
+def _first_match_webdriver(driver, locators, clickable):
+	"""One WebDriver find_elements round trip per locator."""
+	for index, locator in enumerate(locators):
+		for element in driver.find_elements(*locator):
+			if not clickable or (element.is_displayed() and element.is_enabled()):
+				return index, element
+	return None
+
+def _first_match_js(driver, locators, clickable):
+	"""Every locator resolved by a single injected script."""
+	match = driver.execute_script(RACE_JS, [list(locator) for locator in locators], clickable)
+	return (match[0], match[1]) if match else None
+
+def wait_for_any(driver, locators, timeout, clickable=False, use_js=False):
+	"""
+	Polls every locator in one combined condition, so the worst case is one timeout however
+	many locators there are, and returns a LocatorHit for the first match (displayed and
+	enabled if `clickable`; earlier locators win ties). With `use_js` each poll is a single
+	script evaluating all locators in the page instead of one round trip per locator; it
+	falls back to WebDriver lookups if the script fails. Raises TimeoutException.
+	"""
+	started = time.monotonic()
+	state = {"use_js": use_js}
+	def _first(d):
+		match = None
+		if state["use_js"]:
+			try:
+				match = _first_match_js(d, locators, clickable)
+			except JavascriptException as e:
+				logging.debug(f"Locator race script failed, polling with WebDriver lookups: {e}")
+				state["use_js"] = False
+		if not state["use_js"]:
+			match = _first_match_webdriver(d, locators, clickable)
+		return match or False
+	index, element = wait_until(driver, _first, timeout, message=f"none of {len(locators)} locators matched")
+	return LocatorHit(element, locators[index], index, time.monotonic() - started)
+
+def wait_for_ready_state(driver, timeout, state="complete"):
+	"""Waits until document.readyState reaches `state` ("interactive" also accepts "complete")."""
+	accepted = ("interactive", "complete") if state == "interactive" else ("complete",)
+	return wait_until(driver, lambda d: d.execute_script("return document.readyState") in accepted, timeout)
+
+def wait_for_dom_quiet(driver, timeout, quiet_ms=300):
+	"""Waits until no DOM mutation happened for `quiet_ms`. Returns False if the DOM never settled."""
+	try:
+		return wait_until(driver, lambda d: d.execute_script(DOM_QUIET_JS, quiet_ms), timeout)
+	except TimeoutException:
+		logging.debug(f"DOM did not settle within {timeout}s.")
+		return False
+
+def wait_for_element_stable(driver, element, timeout, stable_polls=2):
+	"""
+	Waits until the element is displayed and its bounding box stayed the same for
+	`stable_polls` consecutive polls (i.e. it stopped animating/re-rendering). Returns the element.
+	"""
+	state = {"rect": None, "count": 0}
+	def _stable(d):
+		if not element.is_displayed():
+			state["count"] = 0
+			return False
+		rect = element.rect
+		if rect == state["rect"]:
+			state["count"] += 1
+		else:
+			state["rect"], state["count"] = rect, 0
+		return element if state["count"] >= stable_polls else False
+	return wait_until(driver, _stable, timeout, message="element never became stable")
+
+def wait_for_new_window(driver, known_handles, timeout):
+	"""Waits for a window handle that isn't in `known_handles` and returns it."""
+	def _new_handle(d):
+		handles = [h for h in d.window_handles if h not in known_handles]
+		return handles[0] if handles else False
+	return wait_until(driver, _new_handle, timeout, message="no new window opened")
+
+class NetworkIdleWatcher:
+	"""
+	Tracks in-flight requests from the CDP Network events in the browser's performance log.
+	Needs the driver started with performance logging enabled; otherwise falls back
+	to watching resource timing entries from the page.
+	"""
+	def __init__(self, driver):
+		self.driver = driver
+		self.in_flight = set()
+		self.cdp_available = True
+
+	def _drain(self):
+		"""Consumes pending performance log entries and updates the in-flight set. Returns True if any arrived."""
+		entries = self.driver.get_log("performance")
+		for entry in entries:
+			message = json.loads(entry["message"])["message"]
+			method = message.get("method")
+			request_id = message.get("params", {}).get("requestId")
+			if method == "Network.requestWillBeSent":
+				self.in_flight.add(request_id)
+			elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+				self.in_flight.discard(request_id)
+		return bool(entries)
+
+	def wait(self, timeout, idle_ms=500):
+		"""Waits until no request has been in flight for `idle_ms`. Returns False on timeout."""
+		deadline = time.monotonic() + timeout
+		idle_since = time.monotonic()
+		last_count = None
+		while time.monotonic() < deadline:
+			busy = False
+			if self.cdp_available:
+				try:
+					busy = self._drain() or bool(self.in_flight)
+				except Exception as e:
+					logging.debug(f"Performance log unavailable, using resource timing: {e}")
+					self.cdp_available = False
+			if not self.cdp_available:
+				ready_state, count = self.driver.execute_script(RESOURCE_COUNT_JS)
+				busy = ready_state != "complete" or count != last_count
+				last_count = count
+			if busy:
+				idle_since = time.monotonic()
+			elif (time.monotonic() - idle_since) * 1000 >= idle_ms:
+				return True
+			time.sleep(POLL_FREQUENCY) # Poll interval, not a readiness guess
+		logging.debug(f"Network did not go idle within {timeout}s.")
+		return False
+
+def wait_for_network_idle(driver, timeout, idle_ms=500):
+	"""Waits until the page's network activity has been idle for `idle_ms`. Returns False on timeout."""
+	return NetworkIdleWatcher(driver).wait(timeout, idle_ms)
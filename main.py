@@ -1,76 +1,12 @@
-from cProfile import label
 import os
-import json
-import time
-import random
 import logging
 import threading
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, font
+from tkinter import ttk, filedialog, messagebox
 from typing import Literal
 
-import pyperclip
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.edge.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.edge.service import Service
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-# Import the specific exception
-from selenium.common.exceptions import SessionNotCreatedException, StaleElementReferenceException
-
-# --- Constants ---
-CONFIG_FILE = "config.json"
-LOG_FILE = "bing_points.log"
-
-# --- Default Configuration ---
-DEFAULT_CONFIG = {
-	"profile_path": "",
-	"driver_path": "",
-	"binary_path": "",
-	"headless": True,
-	"num_searches": 10,
-	"timeout": 10,
-	"do_searches": True,
-	"do_offers": False,
-	"do_leetcode": False
-}
-
-# --- Logging Setup ---
-def setup_logging():
-	"""Sets up file-based logging using UTF-8 for file and a stdout wrapper that replaces unencodable chars."""
-	import sys, io
-	root_logger = logging.getLogger()
-	root_logger.setLevel(logging.INFO)
-
-	# File handler uses UTF-8
-	fh = logging.FileHandler(LOG_FILE, mode='w', encoding='utf-8')
-	fh.setLevel(logging.INFO)
-	formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-	fh.setFormatter(formatter)
-
-	# Wrap stdout so any characters that cannot be encoded on the console are replaced
-	try:
-		stdout_wrapper = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
-		sh = logging.StreamHandler(stdout_wrapper)
-		sh.setLevel(logging.INFO)
-		sh.setFormatter(formatter)
-	except Exception:
-		# Fallback to default stream handler if wrapping fails
-		sh = logging.StreamHandler()
-		sh.setLevel(logging.INFO)
-		sh.setFormatter(formatter)
-
-	# Clear existing handlers to avoid duplicates in repeated imports/runs
-	if root_logger.handlers:
-		for h in list(root_logger.handlers):
-			root_logger.removeHandler(h)
-
-	root_logger.addHandler(fh)
-	root_logger.addHandler(sh)
-	root_logger.info("Logging initialized.")
+from bing_points.config import CONFIG_FILE, setup_logging, load_config, save_config
+from bing_points.bot import BingBot
 
 # --- Main Application Class ---
 class BingPointsApp(tk.Tk):
@@ -87,7 +23,7 @@ class BingPointsApp(tk.Tk):
 		# Prevent resizing
 		self.resizable(True, True)
 
-		self.config = self.load_config()
+		self.config = load_config(CONFIG_FILE)
 		self.vars = {
 			"profile_path": tk.StringVar(value=self.config.get("profile_path")),
 			"driver_path": tk.StringVar(value=self.config.get("driver_path")),
@@ -98,42 +34,27 @@ class BingPointsApp(tk.Tk):
 			"do_searches": tk.BooleanVar(value=self.config.get("do_searches")),
 			"do_offers": tk.BooleanVar(value=self.config.get("do_offers")),
 			"do_leetcode": tk.BooleanVar(value=self.config.get("do_leetcode")),
-			"status": tk.StringVar(value="Ready. Fill settings and click Run.")
+			"status": tk.StringVar(value="Ready. Fill settings and click Run."),
+			"progress": tk.StringVar(value="")
 		}
 		
-		self.driver: webdriver.Edge | None = None # Explicitly type hint
+		self.bot: BingBot | None = None # Runner of the active (or last) bot run
 		self.cancel_event = threading.Event()  # Event to signal cancellation from UI
+		self.task_states: dict[str, str] = {} # Latest state of every task of the active run, in start order
 		self.create_widgets()
 
-	def load_config(self):
-		"""Loads configuration from JSON, merging with defaults."""
-		logging.info(f"Loading config from {CONFIG_FILE}")
-		if not os.path.exists(CONFIG_FILE):
-			logging.warning("Config file not found. Creating with defaults.")
-			with open(CONFIG_FILE, 'w') as f:
-				json.dump(DEFAULT_CONFIG, f, indent=4)
-			return DEFAULT_CONFIG
-		
-		try:
-			with open(CONFIG_FILE, 'r') as f:
-				saved_config = json.load(f)
-			# Merge defaults with saved config to ensure all keys exist
-			config = DEFAULT_CONFIG.copy()
-			config.update(saved_config)
-			return config
-		except json.JSONDecodeError:
-			logging.error("Failed to decode config.json. Using defaults.")
-			return DEFAULT_CONFIG
+	def current_config(self):
+		"""Returns the loaded config updated with the current UI settings."""
+		config = self.config.copy() # Keep settings that have no widget
+		config.update({key: var.get() for key, var in self.vars.items() if key not in ("status", "progress")})
+		return config
 
 	def save_config(self):
 		"""Saves current settings from UI to config.json."""
-		logging.info("Saving configuration...")
-		current_config = {key: var.get() for key, var in self.vars.items() if key != "status"}
+		self.config = self.current_config()
 		try:
-			with open(CONFIG_FILE, 'w') as f:
-				json.dump(current_config, f, indent=4)
+			save_config(self.config, CONFIG_FILE)
 			self.vars["status"].set("Configuration saved.")
-			logging.info("Configuration saved successfully.")
 		except Exception as e:
 			self.show_error("Save Error", f"Failed to save config: {e}")
 
@@ -266,6 +187,7 @@ class BingPointsApp(tk.Tk):
 		# --- Status Bar ---
 		status_bar = ttk.Frame(self, relief="sunken", padding=(5, 2))
 		status_bar.pack(side="bottom", fill="x")
+		ttk.Label(status_bar, textvariable=self.vars["progress"]).pack(side="right") # Task states of the run
 		ttk.Label(status_bar, textvariable=self.vars["status"]).pack(side="left", fill="x", expand=True) # Allow status label to expand
 
 	def update_widget_states(self):
@@ -389,7 +311,8 @@ class BingPointsApp(tk.Tk):
 
 	def prompt_close_driver(self):
 		"""Ask the user whether to close the active driver."""
-		if not self.driver:
+		bot = self.bot
+		if not bot or not bot.driver:
 			return
 		def _ask():
 			try:
@@ -397,9 +320,8 @@ class BingPointsApp(tk.Tk):
 					"Close Browser?",
 					"Leetcode completed successfully. Close the browser now?"
 				)
-				if should_close and self.driver:
-					self.driver.quit()
-					self.driver = None
+				if should_close and bot.driver:
+					bot.quit_driver()
 					self.log_status("Browser closed after Leetcode completion.")
 			except Exception as e:
 				logging.debug(f"Error while prompting to close driver: {e}")
@@ -417,6 +339,12 @@ class BingPointsApp(tk.Tk):
 		self.save_button.config(state="normal")
 		self.log_status("Ready. Please save settings and try again.")
 
+	def update_progress(self, event):
+		"""Shows the state of every task of the run in the status bar. Runs on the UI thread."""
+		marks = {"started": "…", "done": "✓", "failed": "✗", "timeout": "✗", "skipped": "–", "cancelled": "–"}
+		self.task_states[event["task"]] = event["state"]
+		self.vars["progress"].set("  ".join(f"{task} {marks.get(state, '')}" for task, state in self.task_states.items()))
+
 	def _finalize_run(self):
 		"""
 		Thread-safe method to re-enable UI elements after a bot run.
@@ -453,900 +381,51 @@ class BingPointsApp(tk.Tk):
 		self.save_button.config(state="disabled")
 		self.log_status("Starting bot...")
 		
-		# Reset cancel event and create a copy of config for the thread
+		# Reset cancel event and hand a copy of the config to the runner
 		self.cancel_event.clear()
-		self.thread_config = {key: var.get() for key, var in self.vars.items() if key != "status"}
-		
-		bot_thread = threading.Thread(target=self.run_bot_logic, daemon=True)
-		bot_thread.start()
+		self.task_states = {}
+		self.vars["progress"].set("")
+		self.bot = BingBot(
+			self.current_config(),
+			cancel_event=self.cancel_event,
+			# Callbacks fire on the worker thread; route UI work through the Tk event loop
+			on_status=lambda message: self.after(0, self.vars["status"].set, message),
+			on_error=self.show_error,
+			on_info=self.show_info,
+			on_driver_missing=lambda: self.after(0, self._prompt_for_driver_path),
+			on_leetcode_done=self.prompt_close_driver,
+			config_path=CONFIG_FILE,
+			on_driver_resolved=lambda path: self.after(0, self.vars["driver_path"].set, path),
+			on_progress=lambda event: self.after(0, self.update_progress, event),
+		)
 
-	def cancel_bot(self):
-		"""Signal the worker thread to stop and attempt to quit the browser."""
-		self.cancel_event.set()
-		self.log_status("Cancellation requested. Attempting to stop...")
-		# Try to close the browser immediately from the main thread to accelerate shutdown
-		try:
-			if self.driver:
-				self.driver.quit()
-		except Exception as e:
-			logging.debug(f"Error while quitting driver on cancel: {e}")
+		bot_thread = threading.Thread(target=self.run_bot_logic, args=(self.bot,), daemon=True)
+		bot_thread.start()
 
-	def run_bot_logic(self):
-		"""The main Selenium automation logic. Runs in a thread."""
+	def run_bot_logic(self, bot):
+		"""Runs the bot in the worker thread and restores the UI afterwards."""
 		try:
-			# --- 1. Setup Driver ---
-			self.log_status("[1/5] Setting up Edge driver...")
-			self.driver = self.setup_driver()
-			if not self.driver:
-				# setup_driver() will have already shown a specific error
-				# and logged it. We just need to stop this thread, which
-				# will trigger the 'finally' block for cleanup.
-				self.log_status("Driver setup failed. Halting bot run.")
-				return # Simply exit the function
-
-			# If cancellation requested right after setup, stop early
-			if self.cancel_event.is_set():
-				self.log_status("Run cancelled before navigation.")
-				return
-
-			# --- 2. Get Initial Points ---
-			if self.thread_config["do_searches"] or self.thread_config["do_offers"]:
-				self.log_status("[2/4] Retrieving initial points...")
-				points_before = self.get_current_points()
-				self.log_status(f"Points before: {points_before}")
-				
-				initial_tab = self.driver.current_window_handle
-
-				# --- 3. Perform Searches ---
-				if self.thread_config["do_searches"]:
-					self.log_status("[3/4] Performing trending searches...")
-					self.perform_trending_searches(initial_tab)
-					self.driver.switch_to.window(initial_tab)
-					self.driver.get("https://www.bing.com/") # Refresh
-					time.sleep(2)
-				else:
-					self.log_status("[3/4] Skipping searches.")
-
-				# --- 4. Collect Offers ---
-				if self.thread_config["do_offers"]:
-					self.log_status("[4/4] Collecting special offers...")
-					self.collect_special_offers(initial_tab)
-					self.driver.switch_to.window(initial_tab)
-					self.driver.get("https://www.bing.com/") # Refresh
-					time.sleep(3)
-				else:
-					self.log_status("[4/4] Skipping offers. Feature coming soon.")
-
-				# --- 5. Get Final Points ---
-				self.log_status("Retrieving final points...")
-				points_after = self.get_current_points()
-				self.log_status(f"Points after: {points_after}")
-
-				# Handle case where points couldn't be read
-				if points_before == 0 and points_after == 0:
-					self.log_status("Could not read points before or after. Check UI manually.")
-					self.show_info("Bing Bot Finished", "Bot run complete.\n\nCould not read point values. Please check Bing manually.")
-				else:
-					total_gained = points_after - points_before
-					self.log_status(f"Total points gained: {total_gained}")
-					self.show_info("Bing Bot Finished", f"Bot run complete.\n\nPoints Gained: {total_gained}\nPoints Before: {points_before}\nPoints After: {points_after}")
-
-			# --- 6. Leetcode Bot ---
-			if self.thread_config["do_leetcode"]:
-				self.log_status("Preparing Leetcode bot...")
-				if self.thread_config["headless"]:
-					self.log_status("Leetcode requires non-headless mode. Restarting driver...")
-					try:
-						if self.driver:
-							self.driver.quit()
-					except Exception as e_close:
-						logging.debug(f"Error while closing driver before Leetcode: {e_close}")
-
-					self.driver = None
-					self.thread_config["headless"] = False
-					self.driver = self.setup_driver()
-					if not self.driver:
-						self.log_status("Driver restart failed. Skipping Leetcode bot.")
-						return
-				else:
-					self.log_status("Non-headless mode already enabled. Continuing with current driver.")
-
-				self.log_status("Running Leetcode bot...")
-				self.run_leetcode_bot()
-				self.log_status("Leetcode bot finished.")
-				
-		except Exception as e:
-			self.show_error("Bing Bot Error", f"An error occurred during bot operation:\n{e}")
+			bot.run()
 		finally:
-			# --- 7. Cleanup ---
-			if self.driver:
-				if self.thread_config["headless"]:
-					self.log_status("Headless mode: Quitting driver.")
-					self.driver.quit()
-				else:
-					self.log_status("Browser left open. Close UI to quit driver (if not detached).")
-			
-			self.driver = None
-			
 			# Schedule the UI update on the main thread to avoid race conditions.
 			self.after(0, self._finalize_run)
 
+	def cancel_bot(self):
+		"""Signal the worker thread to stop and attempt to quit the browser."""
+		# Quitting the browser from the main thread accelerates shutdown
+		if self.bot:
+			self.bot.cancel()
+		else:
+			self.cancel_event.set()
+
 	def on_closing(self):
 		"""Handle window close event."""
-		if self.driver:
+		if self.bot and self.bot.driver:
 			logging.info("UI closing, quitting active driver.")
-			try:
-				self.driver.quit()
-			except Exception as e:
-				logging.error(f"Error while quitting driver on close: {e}")
+			self.bot.quit_driver()
 		self.destroy()
 
-	# --- Selenium Core Functions ---
-	def setup_driver(self):
-		"""Sets up and configures the WebDriver based on UI settings."""
-		try:
-			cfg = self.thread_config
-			edge_options = Options()
-			
-			if cfg["headless"]:
-				edge_options.add_argument("--headless=new")
-			
-			# Anti-detection options
-			edge_options.add_argument("--no-sandbox")
-			edge_options.add_argument("--disable-gpu")
-			edge_options.add_argument("--disable-dev-shm-usage")
-			edge_options.add_argument("--disable-blink-features=AutomationControlled")
-			edge_options.add_argument("--disable-extensions")
-			edge_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-			edge_options.add_experimental_option("useAutomationExtension", False)
-			# Keep browser open for non-headless runs, except during Leetcode where users may opt to close it.
-			edge_options.add_experimental_option(
-				"detach",
-				not cfg["headless"] and not cfg.get("do_leetcode", False)
-			)
-			
-			edge_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) edge/119.0.0.0 Safari/537.36")
-			
-			# Use user-selected profile path
-			if not cfg["profile_path"] or not os.path.exists(cfg["profile_path"]):
-				error_msg = f"Profile path is invalid or not set:\n{cfg['profile_path']}"
-				self.show_error("Profile Error", error_msg)
-				raise Exception(error_msg) # This will be caught by the outer catch
-			edge_options.add_argument(f"--user-data-dir={cfg['profile_path']}") 
-
-			# Use user-selected binary location (if provided)
-			if cfg["binary_path"] and os.path.exists(cfg["binary_path"]):
-				edge_options.binary_location = cfg["binary_path"]
-			elif cfg["binary_path"] and not os.path.exists(cfg["binary_path"]):
-				# If path is given but invalid, it's an error
-				error_msg = f"Binary path is set but invalid (file not found):\n{cfg['binary_path']}"
-				self.show_error("Binary Path Error", error_msg)
-				raise Exception(error_msg)
-			
-			# Initialize the driver service
-			service = None
-			try:
-				self.log_status("Attempting driver install via webdriver-manager...")
-				service = Service(EdgeChromiumDriverManager().install())
-				self.log_status("webdriver-manager successful.")
-			
-			# Catch ALL exceptions from webdriver-manager
-			except Exception as e_manager: 
-				self.log_status(f"webdriver-manager failed: {e_manager}. Trying saved path.")
-				
-				user_driver_path = cfg.get("driver_path")
-				if not user_driver_path or not os.path.exists(user_driver_path):
-					self.log_status("User-defined driver path is also invalid. Prompting user.")
-					self.after(0, self._prompt_for_driver_path) # Schedule prompt on main thread
-					return None # Stop the current bot run
-				
-				self.log_status(f"Using saved driver path: {user_driver_path}")
-				service = Service(executable_path=user_driver_path)
-
-			if not service:
-				self.log_status("Could not initialize driver service.")
-				return None
-				
-			driver = webdriver.Edge(service=service, options=edge_options)
-			driver.set_window_size(1280, 800)
-			driver.set_page_load_timeout(cfg["timeout"])
-			driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-			
-			return driver
-		
-		except SessionNotCreatedException as e:
-			error_str = str(e).lower()
-			if "cannot find msedge binary" in error_str:
-				error_msg = ("Microsoft Edge binary not found.\n\n"
-							"Please ensure Microsoft Edge is installed correctly, "
-							f"or manually provide the path to {'msedge.exe' if os.name=='nt' else 'msedge'} in the 'Binary Path' setting.")
-				self.show_error("Edge Binary Not Found", error_msg)
-			else:
-				self.show_error("Driver Session Error", f"Failed to create driver session:\n{e.msg}")
-			return None
-			
-		except Exception as e:
-			self.show_error("Driver Setup Failed", f"Failed to initialize WebDriver: {e}")
-			return None
-
-	def get_current_points(self):
-		"""Retrieves the current point balance from the Bing page."""
-		if not self.driver:
-			self.log_status("Driver not available. Cannot get points.", "warn")
-			return 0
-
-		try:
-			self.driver.get("https://www.bing.com/rewards/panelflyout")
-			points_element = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-				EC.presence_of_element_located((By.XPATH, '//*[@id="bingRewards"]/div/div[1]/div[1]/div/div[1]/span'))
-			)
-			points_str = points_element.text.replace(',', '')
-			return int(points_str)
-		except Exception as e:
-			self.log_status(f"Could not retrieve points. Defaulting to 0. {e}", "warn")
-			# Try one more time with a broader selector
-			try:
-				points_element = self.driver.find_element(By.ID, "id_rc")
-				points_str = points_element.text.replace(',', '')
-				return int(points_str)
-			except Exception as e2:
-				self.log_status(f"Second attempt to get points failed: {e2}. Defaulting to 0.", "warn")
-				return 0
-		finally:
-			self.driver.switch_to.default_content()
-
-
-	def get_trending_searches(self):
-		"""Extracts trending search titles from Google Trends."""
-		if not self.driver:
-			self.log_status("Driver not available. Cannot get trends.", "warn")
-			return [] # Return empty list
-
-		self.log_status("Getting trending searches from Google...")
-		try:
-			# honor cancellation
-			if self.cancel_event.is_set():
-				self.log_status("Cancellation requested. Aborting trend fetch.")
-				return []
-			self.driver.get("https://trends.google.com/trending")
-			timeout = self.thread_config["timeout"]
-			
-			WebDriverWait(self.driver, timeout).until(
-				EC.presence_of_element_located((By.XPATH, '//*[@id="trend-table"]/div[1]/table/tbody[2]/tr[1]'))
-			)
-			tbody_element =self.driver.find_element(By.XPATH, '//*[@id="trend-table"]/div[1]/table/tbody[2]')
-			tr_elements = tbody_element.find_elements(By.TAG_NAME, 'tr')
-			
-			self.log_status(f"Found {len(tr_elements)} potential trend elements.")
-			
-			trending_searches = []
-			for i, tr in enumerate(tr_elements):
-				if i >= self.thread_config["num_searches"]:
-					break
-				# Check for cancellation inside the loop
-				if self.cancel_event.is_set():
-					self.log_status("Cancellation requested. Stopping trend extraction.")
-					break
-				try:
-					# Try multiple ways to extract text
-					term = None
-					try:
-						search_title_element = tr.find_element(By.XPATH, './td[2]/div[1]')
-						term = search_title_element.text.strip()
-
-					except Exception:
-						term = tr.text.strip()
-					
-					if term and len(term) > 0 and len(term) < 100:
-						trending_searches.append(term)
-						self.log_status(f"Extracted trend: {term}")
-				except Exception as e_row:
-					self.log_status(f"Could not extract a search title: {e_row}", "warn")
-			
-			if trending_searches:
-				return trending_searches
-
-		except Exception as e:
-			self.log_status(f"Error extracting trending searches: {e}", "warn")
-		
-		# Fallback list
-		self.log_status("Using fallback search list.", "warn")
-		return [
-			"news", "weather", "sports", "technology", "entertainment",
-			"health", "science", "finance", "travel", "food",
-			"music", "movies", "books", "fashion", "gaming",
-			"shopping", "education", "business", "fitness", "politics"
-		][:self.thread_config["num_searches"]] # Ensure list is correct length
-
-	def perform_trending_searches(self, initial_tab):
-		"""Performs Bing searches based on trending topics."""
-		if not self.driver:
-			self.log_status("Driver not available. Skipping searches.", "warn")
-			return
-
-		trending_searches = self.get_trending_searches()
-		total_searches = len(trending_searches)
-		self.log_status(f"Retrieved {total_searches} trending searches.")
-
-		for i, search_term in enumerate(trending_searches):
-			# allow user to cancel between searches
-			if self.cancel_event.is_set():
-				self.log_status("Cancellation requested. Aborting remaining searches.")
-				break
-			self.log_status(f"Performing search {i+1}/{total_searches}: {search_term}")
-			
-			try:
-				original_handles = self.driver.window_handles
-				self.driver.execute_script("window.open('https://www.bing.com/', '_blank');")
-				time.sleep(1) # Short wait for new tab to open
-				
-				new_tab_handle = [h for h in self.driver.window_handles if h not in original_handles][0]
-				self.driver.switch_to.window(new_tab_handle)
-
-				search_box = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-					EC.presence_of_element_located((By.NAME, "q"))
-				)
-				search_box.send_keys(search_term)
-				search_box.send_keys(Keys.RETURN)
-				self.log_status(f"Searched for '{search_term}'.")
-				time.sleep(random.uniform(3, 5))
-
-			except Exception as e:
-				self.log_status(f"Error during search for '{search_term}': {e}", "warn")
-			
-			finally:
-				# Close current tab and switch back
-				if len(self.driver.window_handles) > 1:
-					self.driver.close()
-				self.driver.switch_to.window(initial_tab)
-				time.sleep(0.5)
-
-	def find_offer(self):
-		"""Finds clickable offer elements in the offers flyout."""
-		if not self.driver:
-			self.log_status("Driver not available. Cannot find offers.", "warn")
-			return []
-
-		self.driver.get("https://www.bing.com/rewards/panelflyout")
-		try:
-			WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-				EC.presence_of_element_located((By.XPATH, '//*[@id="bingRewards"]/div/div[@class="flyout_control_halfUnit"]'))
-			)
-			offers_parent_div = self.driver.find_elements(By.XPATH, '//*[@id="bingRewards"]/div/div[@class="flyout_control_halfUnit"]')
-			all_offers = offers_parent_div[-1].find_elements(By.XPATH, './div')
-			
-			for div in all_offers:
-				try:
-					aria_label = str(div.get_attribute("aria-label"))
-					div_id = str(div.get_attribute('id'))
-					class_name = str(div.get_attribute('class'))
-					a_tag = div.find_element(By.TAG_NAME, 'a')
-
-					if div_id == "exclusive_promo_cont":
-						check_locked = div.find_element(By.TAG_NAME, 'img')
-						if check_locked.get_attribute('alt') == "Locked Image" \
-							or a_tag.find_elements(By.XPATH, './div[contains(@class, "slim")]'): # Check for already claimed exclusive promo
-							continue # Skip locked exclusive promo
-						return (a_tag, "Exclusive Promo")
-
-					if aria_label.lower() == "Turn referrals into Rewards - Offer not Completed":
-						continue # Skip referral offer
-
-					elif "slim" not in class_name and "Offer not Completed" in aria_label:
-						return (a_tag, aria_label.split("-")[0].strip())
-
-				except Exception as e_offer:
-					self.log_status(f"Error parsing one offer: {e_offer}", "warn")
-			
-		except Exception as e_find:
-			self.show_error("Offer Error", f"Could not find offers container: {e_find}")
-		return None
-
-	def collect_special_offers(self, initial_tab):
-		"""Clicks through all available special offers."""
-		if not self.driver:
-			self.log_status("Driver not available. Skipping offers.", "warn")
-			return
-
-		self.log_status("Checking for special offers...")
-		try:
-			offer = self.find_offer()
-			while offer:
-				offer_element, offer_label = offer
-				self.log_status(f"Attempting to click offer: {offer_label}")
-				try:
-					offer_element.click()
-					time.sleep(2)
-				except Exception as e_click:
-					self.log_status(f"Failed to click offer '{offer_label}': {e_click}", "warn")
-				offer = self.find_offer() # Look for next offer after clicking
-
-		except Exception as e:
-			self.log_status(f"Error during offer collection -> {e}", "warn")
-
-		finally:
-			# Close current tab and switch back
-			if len(self.driver.window_handles) > 1:
-				self.driver.close()
-			self.driver.switch_to.window(initial_tab)
-			time.sleep(0.5)
-			
-		self.log_status("Finished processing offers.")
-
-	def check_leetcode_login_status(self): # check leetcode login status by looking for the `navbar_user_avatar` id anywhere on the headers
-		"""Checks if the user is logged into Leetcode by looking for the avatar element."""
-		if not self.driver:
-			self.log_status("Driver not available. Cannot check login status.", "warn")
-			return False
-
-		try:
-			avatar = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-				EC.presence_of_element_located((By.ID, "navbar_user_avatar"))
-			)
-			return avatar is not None
-		except Exception:
-			return False
-
-	def log_browser_state(self, context):
-		"""Logs current URL and title for diagnostics."""
-		if not self.driver:
-			return
-		try:
-			self.log_status(f"{context} | url={self.driver.current_url} | title={self.driver.title}")
-		except Exception as e:
-			logging.debug(f"Could not read browser state: {e}")
-
-	def wait_for_any(self, locators, timeout, label, clickable=False):
-		"""Waits for the first matching locator and returns the element."""
-		if not self.driver:
-			return None
-		last_exc = None
-		for by, value in locators:
-			try:
-				if clickable:
-					return WebDriverWait(self.driver, timeout).until(
-						EC.element_to_be_clickable((by, value))
-					)
-				return WebDriverWait(self.driver, timeout).until(
-					EC.presence_of_element_located((by, value))
-				)
-			except Exception as e:
-				last_exc = e
-				continue
-		self.log_status(f"Leetcode step failed: {label}. Last error: {last_exc}", "warn")
-		self.log_browser_state(f"Leetcode failure: {label}")
-		return None
-	
-	def select_python_in_editor(self):
-		"""Selects Python3 as the language in the Leetcode editor."""
-		if not self.driver:
-			self.log_status("Driver not available. Cannot select editor language.", "warn")
-			return
-		try:
-			locators = [
-				(By.XPATH, '//*[@id="editor"]/div[1]/div[1]/div[1]/button'),
-				(By.CSS_SELECTOR, "button[aria-controls='radix-:r21:']")
-			]
-			language_dropdown = self.wait_for_any(locators, self.thread_config["timeout"], "editor language dropdown", clickable=True)
-			if not language_dropdown:
-				self.log_status("Editor language dropdown not found.", "warn")
-				return False
-			
-			current_label = language_dropdown.find_element(By.XPATH, "./..").text.strip().lower()
-			if current_label == "python3" or current_label == "python 3":
-				self.log_status("Editor already set to Python3.")
-				return True
-			
-			language_dropdown.click()
-			time.sleep(1) # wait for dropdown to open
-			
-
-			python_locators = [
-				(By.XPATH, "/html/body/div[7]/div/div/div[1]"),
-				(By.XPATH, "//*[@id='radix-:r21:']/div/div[1]")
-			]
-			python_option = self.wait_for_any(python_locators, self.thread_config["timeout"], "python3 language select", clickable=True)
-			if python_option:
-				self.log_status("Selecting Python3 in editor language dropdown...")
-				python_option.click()
-				time.sleep(1) # wait for editor to switch
-				self.log_status("Switched editor language to Python3.")
-				return True
-			else:
-				self.log_status("Python3 option not found in editor language dropdown.", "warn")
-				return False
-		except Exception as e:
-			self.log_status(f"Error switching editor language: {e}", "warn")
-			return False
-
-	def get_solution_from_solutions(self):
-		"""Attempts to extract a Python3 solution from the user solutions."""
-		if not self.driver:
-			self.log_status("Driver not available. Cannot get solutions.", "warn")
-			return None
-
-		self.log_status("Attempting to retrieve Python3 solution from solutions...")
-		try:
-			if self.cancel_event.is_set():
-				return None
-			# Navigate to the solutions tab
-			solutions_tab = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-				EC.element_to_be_clickable((By.XPATH, '//*[@id="description_tabbar_outer"]/div[1]/div/div[5]'))
-			)
-			solutions_tab.click()
-			
-			# wait for filters to load
-			initial_filter_tab = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-				EC.presence_of_element_located((By.XPATH, '//span[contains(text(), "My Solution")]')) # a span which contains text "My Solution"
-			)
-
-			# Find Python3 filter and click it
-			python_filter = None
-			filters = initial_filter_tab.find_elements(By.XPATH, '../div[1]/span') # filter options
-			for f in filters:
-				text = f.text.strip().lower()
-				if text == "python3" or text == "python":
-					python_filter = f
-					break
-			if python_filter:
-				python_filter.click()
-				self.log_status("Applied Python3 filter to solutions.")
-				time.sleep(2)  # Increased wait to ensure filtering completes and solutions re-render
-				self.log_status("Waiting for filtered solutions to load...")
-			else:
-				available_filters = [f.text.strip() for f in filters]
-				self.log_status(f"Python3 filter not found. Available filters: {available_filters}", "warn")
-
-			# Wait for solution list container to appear
-			flyout_container = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-				EC.presence_of_element_located((By.XPATH, '//*[@id="qd-content"]/div/div[6]'))
-			) # wait for solution flyout to load 
-			
-			self.log_status("Solution flyout container found. Waiting for posts to render...")
-			# //*[@id="23df9cfb-9446-352d-672a-481995819d79"]/div/div/div[1]/div[3]/div[3]/div[1]/div[1]
-			time.sleep(3)  # Give the page extra time to render solution posts after filtering
-
-			# Try to find solution posts with multiple attempts
-			solution_posts = []
-			for attempt in range(3):
-				try:
-					solution_posts = flyout_container.find_elements(By.XPATH, './div/div/div[1]/div[3]/div[3]/div[1]/div')
-					if solution_posts:
-						self.log_status(f"Found {len(solution_posts)} solution posts on attempt {attempt + 1}.")
-						break
-					else:
-						self.log_status(f"Attempt {attempt + 1}: No solution posts found yet, retrying...")
-						time.sleep(2)
-				except Exception as e:
-					self.log_status(f"Attempt {attempt + 1}: Error finding posts - {e}", "warn")
-					time.sleep(2)
-			
-			if not solution_posts:
-				self.log_status("Could not find any solution posts after retries.", "warn")
-				return None
-			
-			post_count = len(solution_posts)
-			for idx in range(1, post_count): # skip the first one since it's usually premium content
-				try:
-					# Wait for solution list to appear again in case of stale element after clicking a post
-					flyout_container = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-						EC.presence_of_element_located((By.XPATH, '//*[@id="qd-content"]/div/div[6]'))
-					) # wait for solution flyout to load 
-					fresh_posts = flyout_container.find_elements(By.XPATH, './div/div/div[1]/div[3]/div[3]/div[1]/div')
-					if idx >= len(fresh_posts):
-						break
-					post = fresh_posts[idx]
-					post_title = post.find_element(By.XPATH, './div[1]/div/div[2]/div[2]/div/a')
-					post_title.click()
-					self.log_status("Opened a solution post.")
-
-					# Wait for solution list to appear again in case of stale element after clicking a post
-					flyout_container = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-						EC.presence_of_element_located((By.XPATH, '//*[@id="qd-content"]/div/div[6]'))
-					) # wait for solution flyout to load 
-					
-					solution_flyout = WebDriverWait(flyout_container, self.thread_config["timeout"]).until(
-						EC.presence_of_element_located((By.XPATH, './div[2]'))
-					) # wait for the flyout which contains the solution content to load
-
-					if not solution_flyout:
-						self.log_status("Solution content did not load properly, trying next post if available.", "warn")
-						continue
-					self.log_status("Solution content loaded, looking for code blocks...")
-					# Find for code blocks in the solution content by class if not found continue to next post
-					time.sleep(1.5) # wait for content to fully render 
-					block_divs = solution_flyout.find_element(By.XPATH, './div/div/div/div[2]/div/div[1]/div[2]/div/div/div/div')
-
-					if not block_divs:
-						self.log_status("No code blocks found in this solution post, trying next post if available.", "warn")
-						all_solutions_flyout = WebDriverWait(solution_flyout, self.thread_config["timeout"]).until(
-							EC.presence_of_element_located((By.XPATH, './div/div/div/div[1]/div[1]'))
-						) # wait for the flyout which contains all solutions to load
-						all_solutions_flyout.click() # click it to open the sidebar which contains the list of all solutions which usually triggers the content to load properly and show the code blocks, then try finding the code block again
-						time.sleep(1) # wait for content to load after clicking
-						continue
-					try:
-						all_code_tabs = block_divs.find_elements(By.XPATH, './/div[contains(@class, "TabBarItem_item__jKpNv")]')
-						self.log_status(f"Found {len(all_code_tabs)} code tabs in this solution post, looking for Python tab...")
-						if not all_code_tabs or len(all_code_tabs) == 0:
-							self.log_status("No code tabs found in this solution post, looking for global python solutions", "warn")
-							python_code_blocks = block_divs.find_elements(By.CLASS_NAME, 'language-python')
-							if python_code_blocks:
-								solution_text = python_code_blocks[0].text.strip()
-								if solution_text and "class solution:" in solution_text.lower() \
-									and "return" in solution_text.lower(): # crude check to see if it's actually a code block with a solution or just some text that has python syntax highlighting for some reason, if it's the latter continue searching other posts
-									self.log_status("Found a Python code block without tabs, using it as the solution.")
-								else:
-									self.log_status("Python code block found but does not appear to contain a valid solution, trying next post if available.", "warn")
-									continue
-
-						else:
-							for tab in all_code_tabs:
-								python_code_block = None
-								# if python or python3 is in the tab text click it to switch to the python code block
-								tab_text = tab.text.strip().lower()
-								# If tab text doesn't indicate python, continue searching other tabs
-								if "python" in tab_text or "python3" in tab_text:
-									try:
-										tab.click()
-										time.sleep(1)  # wait for code block to switch to python if it's not already
-									except Exception:
-										pass
-									# try to locate a python code block after selecting the tab
-									try:
-										solution_tab_div = tab.find_element(By.XPATH, './../../div[2]/div') # the div which contains the code block for this tab
-										python_code_block = solution_tab_div.find_element(By.CLASS_NAME, 'language-python').text.strip()
-										if "class solution:" not in python_code_block \
-											and "return" not in python_code_block: # crude check to see if it's actually a code block with a solution or just some text that has python syntax highlighting for some reason, if it's the latter continue searching other tabs
-											if tab == all_code_tabs[-1]:
-												self.log_status("No Python solution Tab can be parsed. Skipping Post", "warn")
-											continue
-									except Exception:
-										python_code_block = None
-									if python_code_block:
-										break
-
-						if not python_code_block:
-							self.log_status("No Python code block found in this solution post, trying next post if available.", "warn")
-							continue
-
-						solution_text = python_code_block
-					except Exception as e_code:
-						self.log_status(f"Error extracting code block text: {e_code}", "warn")
-						solution_text = None
-					if solution_text:
-						self.log_status(f"Successfully extracted a Python3 solution from user solutions: {solution_text[:120]}\n.\n.\n.\n{solution_text[-120:]}") # Log the first 120 and last 120 chars of the solution for verification
-					else:
-						return None
-					return solution_text
-
-				except StaleElementReferenceException as e_post:
-					self.log_status(f"Solution post stale, retrying... -> {e_post}", "warn")
-					time.sleep(0.5)
-					continue
-				except Exception as e_post:
-					self.log_status(f"Solution post skipped!! -> {e_post}", "warn")
-					try:
-						all_solutions_flyout = WebDriverWait(solution_flyout, self.thread_config["timeout"]).until(
-							EC.presence_of_element_located((By.XPATH, './div/div/div/div[1]/div[1]'))
-						) # wait for the flyout which contains all solutions to load
-						all_solutions_flyout.click() # click it to open the sidebar which contains the list of all solutions which usually triggers the content to load properly and show the code blocks, then try finding the code block again
-						time.sleep(1) # wait for content to load after clicking
-					except Exception:
-						pass
-					continue
-				finally:
-					time.sleep(0.75) # small delay before trying the next post if available
-			return None
 
-		except Exception as e_solution:
-			self.log_status(f"Error accessing solutions: {e_solution}", "warn")
-			return None
-		
-	def paste_solution_into_editor(self, solution):
-		# paste the solution into the editor using the string we extracted from the solution post.
-		if not self.driver:
-			self.log_status("Driver not available. Cannot paste solution.", "warn")
-			return False
-		try:
-			editor_locators = [
-				(By.XPATH, '//*[@id="editor"]/div[2]/div[1]/div/div/div[1]/div[2]/div[1]/div[5]'),
-				(By.CSS_SELECTOR, ".monaco-editor"),
-				(By.XPATH, '//*[@id="editor"]/div[2]//div[@role="textbox"]'),
-				(By.CSS_SELECTOR, "#editor [contenteditable='true']"),
-			]
-			editor_flyout = self.wait_for_any(editor_locators, self.thread_config["timeout"], "editor textbox")
-			if not editor_flyout:
-				return False
-			self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", editor_flyout)
-			self.driver.execute_script("arguments[0].click();", editor_flyout)
-			time.sleep(0.5)
-
-			# Prefer JS injection for Monaco editor to avoid non-interactable errors.
-			injected = self.driver.execute_script(
-				"""
-				const code = arguments[0];
-				try {
-					if (window.monaco && monaco.editor && monaco.editor.getModels().length) {
-						monaco.editor.getModels()[0].setValue(code);
-						return true;
-					}
-					const editor = document.querySelector('.monaco-editor');
-					const textarea = editor ? editor.querySelector('textarea') : null;
-					if (textarea) {
-						textarea.focus();
-						textarea.value = code;
-						textarea.dispatchEvent(new Event('input', { bubbles: true }));
-						return true;
-					}
-				} catch (e) {}
-				return false;
-				""",
-				solution
-			)
-			if injected:
-				self.log_status("Injected solution into Monaco editor via JS.")
-			else:
-				editor_flyout.send_keys(Keys.CONTROL, 'a')
-				time.sleep(0.5)
-				editor_flyout.send_keys(solution)
-				self.log_status("Typed solution into editor.")
-			time.sleep(1)
-			return True
-
-		except Exception as e_editor:
-			self.log_status(f"Error pasting solution into editor: {e_editor}", "warn")
-			self.show_info("Leetcode Bot", "Could not paste solution into editor.")
-			return False
-
-	def confirm_submission_result(self):
-		"""Checks the result of the submission and logs it."""
-		# Checks for "testcases passed" text in the flyout
-		if not self.driver:
-			self.log_status("Driver not available. Cannot confirm submission result.", "warn")
-			return
-
-		self.log_status("Checking submission result...")
-		results_container = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-			EC.presence_of_element_located((By.XPATH, '//*[@data-e2e-locator="submission-result"]'))
-		)
-		if results_container:
-			self.log_status("Successfully submitted solution. Confirming submission result...")
-			try:
-				testcase_passed_check = WebDriverWait(results_container, self.thread_config["timeout"]).until(
-					EC.presence_of_element_located((By.XPATH, './../div/span'))
-				)
-				if not testcase_passed_check:
-					self.log_status("Could not find submission result. It may still be processing.", "warn")
-					return False
-				self.log_status(f"Submission result: {testcase_passed_check.text.strip()}")
-			except Exception as e_result:
-				self.log_status(f"Could not retrieve submission result: {e_result}", "warn")
-				return False
-		else:
-			self.log_status("Wrong answer submitted!!!", "warn")
-			self.show_info("Leetcode Bot", "Submitted wrong solution. Please submit correct solution manually on Leetcode.")
-			return False
-		return True
-
-	def run_leetcode_bot(self):
-		"""Leetcode daily question solver"""
-		if not self.driver:
-			self.log_status("Driver not available. Cannot run Leetcode bot.", "warn")
-			return
-		self.driver.get("https://leetcode.com/problemset/")
-		WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-			EC.presence_of_element_located((By.XPATH, "//*[@id='leetcode-navbar']"))
-		)
-
-		# check login status first before trying to navigate to the page
-		self.log_status("Checking Leetcode login status...")
-		if not self.check_leetcode_login_status():
-			self.log_status("Not logged into Leetcode. Please log in and try again.", "warn")
-			self.show_info("Leetcode Login Required", "Please log into Leetcode in your Edge browser and run the bot again.")
-			return
-
-		self.log_status("Logged into Leetcode. Navigating to daily question...")
-		try:
-			if self.cancel_event.is_set():
-				return
-			# "Daily Challenge" link in the navbar
-			daily_link_button = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-				EC.element_to_be_clickable((By.XPATH, "//*[@id='leetcode-navbar']/div[1]/div/div/div[3]/button/a"))
-			)
-			time.sleep(1) # small delay before clicking
-			if not daily_link_button:
-				self.log_status("Daily Challenge link not found. Please try again.", "warn")
-				return
-			try:
-				href = daily_link_button.get_attribute("href")
-				if href:
-					self.log_status(f"Navigating to: {href}")
-					self.driver.get(href)
-				else:
-					self.log_status("Could not click daily link. Please click it manually.", "warn")
-					time.sleep(5) # wait for manual navigation
-			except Exception:
-				daily_link_button.find_element(By.XPATH, "./..").click() # try clicking the parent element if the link itself is not clickable
-				time.sleep(2)
-				self.driver.switch_to.window(self.driver.window_handles[-1])
-				self.log_status(f"Navigating to: {self.driver.current_url}")
-			finally:
-				editor = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-					EC.presence_of_element_located((By.ID, "editor"))
-				)
-				if not editor:
-					return
-				self.log_status("Daily question page loaded.")
-
-
-			# switch the editor to python3 (if not already) by clicking the language dropdown and selecting python3
-			if not self.select_python_in_editor():
-				self.log_status("Failed to select Python3 in editor.", "warn")
-				return
-
-			# Get solution from the user posted solutions (if any) and try to extract a python3 solution. This is a bit hacky but leetcode doesn't make it easy to get the official solution content without subscribing, but many users post their own solutions in the solution section which we can scrape.
-			solution: str|None = self.get_solution_from_solutions()
-			if not solution:
-				self.log_status("No Python3 solution found. Cannot proceed with solving the problem.", "warn")
-				self.show_info("Leetcode Bot", "Could not find a Python3 solution in the user solutions. Please submit a correct solution manually on Leetcode and try again.")
-				return
-
-			# copy the solution to clipboard and paste it into the editor
-			try:
-				pyperclip.copy(solution)
-				self.log_status("Copied solution to clipboard.")
-			except Exception as e_clipboard:
-				self.log_status(f"Error copying solution to clipboard: {e_clipboard}", "warn")
-				self.show_info("Leetcode Bot", "Could not copy solution to clipboard. Please submit a correct solution manually on Leetcode and try again.")
-				return
-
-			if not self.paste_solution_into_editor(solution):
-				self.log_status("Failed to paste solution into editor.", "warn")
-				self.show_info("Leetcode Bot", "Could not paste solution into editor. Please submit a correct solution manually on Leetcode and try again.")
-				return
-
-			# clicking the submit button
-			try:
-
-				""" Method 1 -> list of possible xpaths"""
-				# submit_locators = [
-				# 	(By.XPATH, '//*[@id="ide-top-btns"]/div[1]/div/div/div[2]/div/div[2]/div/div[3]/div[3]/div/button')
-				# 	(By.XPATH, '//*[@id="ide-top-btns"]//button'),
-				# 	(By.XPATH, '//*[@data-e2e-locator="console-submit-button"]'),
-				# ]
-				# submit_button = self.wait_for_any(submit_locators, self.thread_config["timeout"], "submit button", clickable=True)
-
-				""" Method 2 -> hardcoded xpath"""
-				submit_button = WebDriverWait(self.driver, self.thread_config["timeout"]).until(
-					EC.element_to_be_clickable((By.XPATH, '//*[@id="ide-top-btns"]/div[1]/div/div/div[2]/div/div[2]/div/div[3]/div[3]/div/button'))
-				)
-
-				if not submit_button:
-					self.log_status("Submit button not found. Cannot submit solution.", "warn")
-					self.show_info("Leetcode Bot", "Could not click submit button. Please submit a correct solution manually on Leetcode and try again.")
-					return
-				submit_button.click()
-				time.sleep(3)
-			except Exception as e_submit:
-				self.log_status(f"Error clicking submit button: {e_submit}", "warn")
-				self.show_info("Leetcode Bot", "Could not click submit button. Please submit a correct solution manually on Leetcode and try again.")
-				return
-			try:
-				if not self.confirm_submission_result():
-					self.log_status("Could not confirm submission result. Please check Leetcode manually.", "warn")
-					self.show_info("Leetcode Bot", "Submitted solution but could not confirm result. Please check Leetcode manually.")
-				else:
-					self.log_status("Submission result confirmed successfully.")
-					self.prompt_close_driver()
-			except Exception as e_confirm:
-				self.log_status(f"Error confirming submission result: {e_confirm}", "warn")
-				self.show_info("Leetcode Bot", "Submitted solution but an error occurred while confirming result. Please check Leetcode manually.")
-
-		except Exception as e:
-			self.log_status(f"Error during Leetcode bot operation: {e}", "warn")
-			self.show_error("Leetcode Bot Error", f"An error occurred while running the Leetcode bot:\n{e}")
-		
 
 # --- Main Execution ---
 if __name__ == "__main__":